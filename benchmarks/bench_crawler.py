@@ -0,0 +1,29 @@
+#!/usr/bin/python3
+#
+# Copyright © 2021–2022 martin f. krafft <tctools@pobox.madduck.net>
+# Released under the MIT Licence
+#
+# Measure the wall time of crawling a number of queries against a simulated
+# API with fixed latency, at different concurrency levels.
+#
+
+import time
+
+from pytcnz.crawler import Crawler
+
+QUERIES = 200
+LATENCY = 0.02
+
+
+def fetch(query):
+    time.sleep(LATENCY)
+    return query
+
+
+if __name__ == "__main__":
+    for concurrency in (1, 2, 4, 8, 16):
+        crawler = Crawler(fetch, concurrency=concurrency)
+        start = time.perf_counter()
+        crawler.map(range(QUERIES))
+        elapsed = time.perf_counter() - start
+        print(f"concurrency {concurrency:2d}: {elapsed:6.2f}s")
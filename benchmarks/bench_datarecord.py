@@ -0,0 +1,78 @@
+#!/usr/bin/python3
+#
+# Copyright © 2021–2022 martin f. krafft <tctools@pobox.madduck.net>
+# Released under the MIT Licence
+#
+# Compare memory use and field access speed of DataRecord-based classes
+# against their CompactRecord variants.
+#
+
+import timeit
+import tracemalloc
+
+from pytcnz.datarecord import make_compact
+from pytcnz.playerbase import PlayerBase
+from pytcnz.draw import Draw
+from pytcnz.game import Game
+
+N = 20000
+
+CASES = (
+    (
+        PlayerBase,
+        ("name", "gender", "points", "club", "squash_code", "id"),
+        (),
+        lambda i: dict(
+            name=f"Player {i}",
+            gender="W",
+            points=i,
+            club="Club",
+            squash_code=f"WNTH{i}",
+            id=i,
+        ),
+    ),
+    (
+        Draw,
+        ("name", "gendered", "description"),
+        (),
+        lambda i: dict(name=f"W{i}", gendered="W", description="Women"),
+    ),
+    (
+        Game,
+        ("name", "player1", "player2", "status", "comment"),
+        ("players",),
+        lambda i: dict(
+            name=f"W{i}",
+            player1="Jane",
+            player2="Kate",
+            status=-1,
+            comment="11-0 11-0 11-0",
+        ),
+    ),
+)
+
+
+def bytes_per_record(Klass, make_data):
+    data = [make_data(i) for i in range(N)]
+    tracemalloc.start()
+    records = [Klass(**d) for d in data]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+    return size / N
+
+
+def access_time(Klass, make_data):
+    record = Klass(**make_data(0))
+    return min(timeit.repeat(lambda: record.name, number=N, repeat=5)) / N
+
+
+if __name__ == "__main__":
+    for Klass, fields, attributes, make_data in CASES:
+        Compact = make_compact(Klass, fields, attributes=attributes)
+        for label, K in (("DataRecord", Klass), ("CompactRecord", Compact)):
+            print(
+                f"{Klass.__name__:>10} {label:>13}: "
+                f"{bytes_per_record(K, make_data):7.1f} bytes/record, "
+                f"{access_time(K, make_data) * 1e9:6.1f} ns/access"
+            )
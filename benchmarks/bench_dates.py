@@ -0,0 +1,48 @@
+#!/usr/bin/python3
+#
+# Copyright © 2021–2022 martin f. krafft <tctools@pobox.madduck.net>
+# Released under the MIT Licence
+#
+# Measure parsing a column of dates of birth and computing age groups,
+# compared to dateutil and per-player age computation.
+#
+
+import random
+import time
+from datetime import date, timedelta
+import dateutil.parser
+
+from pytcnz.dates import DateParser
+from pytcnz.squashnz.player import Player
+
+N = 20000
+
+
+def reference(dobs):
+    groups = []
+    for dob in dobs:
+        dob = dateutil.parser.parse(dob, dayfirst=True)
+        age = Player.get_age_for_dob(dob)
+        groups.append(Player.get_age_group_for_age(age))
+    return groups
+
+
+def bulk(dobs):
+    dobs = DateParser().parse_many(dobs)
+    ages = Player.get_ages_for_dobs(dobs, onday=date.today())
+    return Player.get_age_groups_for_ages(ages)
+
+
+if __name__ == "__main__":
+    rng = random.Random(42)
+    dobs = [
+        (date(1940, 1, 1) + timedelta(days=rng.randrange(30000))).strftime(
+            "%d/%m/%Y"
+        )
+        for i in range(N)
+    ]
+    for label, fn in (("dateutil", reference), ("bulk", bulk)):
+        start = time.perf_counter()
+        fn(dobs)
+        print(f"{label:10s} {N / (time.perf_counter() - start):9.0f}/s")
+    assert reference(dobs) == bulk(dobs)
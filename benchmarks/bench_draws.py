@@ -0,0 +1,76 @@
+#!/usr/bin/python3
+#
+# Copyright © 2021–2022 martin f. krafft <tctools@pobox.madduck.net>
+# Released under the MIT Licence
+#
+# Measure filling a draw with players and games, which checks each for
+# duplicates, compared to scanning the lists as the draws used to do.
+#
+
+import time
+
+from pytcnz.dtkapiti.draw import Draw
+from pytcnz.dtkapiti.game import Game
+from pytcnz.dtkapiti.player import Player
+
+N = 1000
+
+PLAYER = dict(
+    gender="W",
+    points=3050,
+    dob="30/08/1999",
+    phone="041234567",
+    mobile="021234567",
+)
+
+GAME = dict(
+    player1="Jane Doe",
+    from1="",
+    score1=0,
+    player2="Kate Smith",
+    from2="",
+    score2=0,
+    status=99,
+    daytime="Thu 18:00",
+    comment="",
+)
+
+
+def make_records():
+    players = [
+        Player(id=f"W0{i + 1}", name=f"Jane Doe{i}", **PLAYER)
+        for i in range(N)
+    ]
+    games = [Game(name=f"W0{i + 1:04d}", **GAME) for i in range(N)]
+    return players, games
+
+
+def reference(players, games):
+    draw_players, draw_games = [], []
+    for player in players:
+        assert player not in draw_players
+        draw_players.append(player)
+    for game in games:
+        assert game not in draw_games
+        draw_games.append(game)
+
+
+def indexed(players, games):
+    draw = Draw("W0", description="Women")
+    for player in players:
+        draw.add_player(player)
+    for game in games:
+        draw.add_game(game)
+
+
+def timed(fn):
+    players, games = make_records()
+    start = time.perf_counter()
+    fn(players, games)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    print(f"{N} players and games:")
+    for label, fn in (("list scans", reference), ("indexes", indexed)):
+        print(f"{label:12s} {timed(fn):6.3f}s")
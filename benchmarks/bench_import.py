@@ -0,0 +1,69 @@
+#!/usr/bin/python3
+#
+# Copyright © 2021–2022 martin f. krafft <tctools@pobox.madduck.net>
+# Released under the MIT Licence
+#
+# Measure the time it takes to import pytcnz modules, using
+# python -X importtime in a fresh interpreter for each module, and list
+# the heavy dependencies that were pulled in along the way.
+#
+
+import subprocess
+import sys
+
+MODULES = (
+    "pytcnz.scores",
+    "pytcnz.squashnz.grading",
+    "pytcnz.squashnz.player",
+    "pytcnz.squashnz.registrations_reader",
+    "pytcnz.squashnz.gradinglist_reader",
+    "pytcnz.squashnz.isquash_controller",
+    "pytcnz.dtkapiti.tcexport_reader",
+    "pytcnz.tctools.drawmaker_reader",
+)
+
+HEAVY = (
+    "bs4",
+    "dateutil",
+    "phonenumbers",
+    "pyexcel",
+    "pytz",
+    "requests",
+    "selenium",
+    "xlrd",
+)
+
+RUNS = 5
+
+
+def import_time(module):
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = 0
+    loaded = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        name = name.strip()
+        if name.split(".")[0] in HEAVY:
+            loaded.add(name.split(".")[0])
+        if name == module:
+            total = int(cumulative)
+    return total, loaded
+
+
+if __name__ == "__main__":
+    for module in MODULES:
+        times = []
+        for i in range(RUNS):
+            us, loaded = import_time(module)
+            times.append(us)
+        print(
+            f"{module:40s} {min(times) / 1000:7.1f} ms"
+            f"  {', '.join(sorted(loaded)) or '-'}"
+        )
@@ -0,0 +1,77 @@
+#!/usr/bin/python3
+#
+# Copyright © 2021–2022 martin f. krafft <tctools@pobox.madduck.net>
+# Released under the MIT Licence
+#
+# Measure comparing players by their precomputed fingerprints, compared to
+# merging and comparing their data dicts, as players used to do, when
+# scanning a draw for duplicates, and when resolving duplicate records.
+#
+
+import time
+
+from pytcnz.squashnz.player import Player
+
+N = 2000
+
+PLAYER = dict(
+    gender="W",
+    dob="30/08/1999",
+    phone="043841234",
+    mobile="021234567",
+    email="jane.doe@example.org",
+)
+
+
+def reference_eq(p1, p2):
+    if not p2:
+        return False
+    return p1.data | dict(id=None) == p2.data | dict(id=None)
+
+
+def make_players(offset=0):
+    return [
+        Player(
+            id=offset + i,
+            name=f"Jane Doe{i}",
+            points=1000 + i,
+            **PLAYER,
+        )
+        for i in range(N)
+    ]
+
+
+def fill_draw(players, eq):
+    draw = []
+    for player in players:
+        assert not any(eq(p, player) for p in draw)
+        draw.append(player)
+
+
+def resolve_duplicates(target, duplicates, eq):
+    # As with resolve_duplicate_cb, keeping the existing record if the new
+    # one is no different
+    for p in duplicates:
+        existing = target[p.name]
+        target[p.name] = existing if eq(existing, p) else p
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    players, duplicates = make_players(), make_players(offset=N)
+    for label, eq in (
+        ("data dicts", reference_eq),
+        ("fingerprints", Player.__eq__),
+    ):
+        target = {p.name: p for p in players}
+        draw = timed(fill_draw, players, eq)
+        resolve = timed(resolve_duplicates, target, duplicates, eq)
+        print(
+            f"{label:13s} draw: {draw:6.3f}s  "
+            f"duplicates: {resolve * 1e3:6.2f}ms"
+        )
@@ -0,0 +1,76 @@
+#!/usr/bin/python3
+#
+# Copyright © 2021–2022 martin f. krafft <tctools@pobox.madduck.net>
+# Released under the MIT Licence
+#
+# Measure the throughput of constructing TC export player and game records,
+# and of cleaning player names, which depend on parametrised regular
+# expressions compiled once per pattern.
+#
+
+import re
+import time
+
+from pytcnz import patterns
+from pytcnz.dtkapiti.game import Game
+from pytcnz.dtkapiti.player import Player
+
+N = 20000
+
+PLAYER = dict(
+    name="Mrs J. Jane Doe",
+    gender="W",
+    points=3050,
+    dob="30/08/1999",
+    phone="041234567",
+    mobile="021234567",
+)
+
+GAME = dict(
+    player1="Jane Doe",
+    from1="",
+    score1=0,
+    player2="Kate Smith",
+    from2="",
+    score2=0,
+    status=99,
+    daytime="Thu 18:00",
+    comment="",
+)
+
+
+def reference_name_cleaned(name, salutations=Player.SALUTATIONS):
+    salutations = sorted(salutations, key=lambda x: -len(x))
+    pat = rf"^(?:(?:{'|'.join(salutations)})\.?\s*)*"
+    name = re.sub(pat, "", name)
+    return re.sub(r"(\w\.\s)*", "", name)
+
+
+def reference_draw(name, drawnamepat=r"\w\d{1}"):
+    pat = re.compile(rf"(?P<draw>{drawnamepat})")
+    return re.match(pat, name).groupdict().get("draw")
+
+
+def rate(fn):
+    start = time.perf_counter()
+    for i in range(N):
+        fn(i)
+    return N / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    names = [f"Mrs J. Jane Doe{i % 100}" for i in range(N)]
+    draws = [f"M{i % 9}01" for i in range(N)]
+    ids = [f"W{i % 9}{i % 50 + 1}" for i in range(N)]
+    for label, fn in (
+        ("reference cleaning", lambda i: reference_name_cleaned(names[i])),
+        ("get_name_cleaned", lambda i: Player.get_name_cleaned(names[i])),
+        ("reference draw parsing", lambda i: reference_draw(draws[i])),
+        (
+            "patterns.get_draw_re",
+            lambda i: patterns.get_draw_re(r"\w\d{1}").match(draws[i]),
+        ),
+        ("Player records", lambda i: Player(id=ids[i], **PLAYER)),
+        ("Game records", lambda i: Game(name=draws[i], **GAME)),
+    ):
+        print(f"{label:25s} {rate(fn):9.0f}/s")
@@ -0,0 +1,81 @@
+#!/usr/bin/python3
+#
+# Copyright © 2021–2022 martin f. krafft <tctools@pobox.madduck.net>
+# Released under the MIT Licence
+#
+# Measure score string parsing throughput, compared to the regular
+# expressions formerly built on every call.
+#
+
+import random
+import re
+import time
+
+from pytcnz.scores import Scores
+
+N = 50000
+
+
+def reference_parse(string):
+    SET_DELIMS = r" ,"
+    GAME_DELIMS = r"-/:"
+    string = re.sub(rf"\s*([{GAME_DELIMS}])\s*", r"\1", string)
+    sets = [
+        s.strip(SET_DELIMS) for s in re.split(rf"[{SET_DELIMS}]+", string)
+    ]
+    ret = []
+    unp = []
+    for s in sets:
+        if unp:
+            unp.append(s)
+            continue
+        try:
+            ret.append(
+                tuple(map(int, re.split(rf"[{GAME_DELIMS}]+", s, 1)))
+            )
+        except ValueError:
+            unp.append(s)
+    return (ret, " ".join(unp)) if ret else (None, string)
+
+
+def reference_from_string(string):
+    scores, remainder = reference_parse(string)
+    return (Scores(scores) if scores else None), remainder
+
+
+def make_comment(rng):
+    won = ["11-{}"] * 2 + ["{}-11"] * rng.randint(0, 2)
+    rng.shuffle(won)
+    won.append("11-{}")
+    return " ".join(s.format(rng.randint(0, 9)) for s in won)
+
+
+def rate(fn, strings):
+    start = time.perf_counter()
+    fn(strings)
+    return len(strings) / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    rng = random.Random(42)
+    scores = [make_comment(rng) for i in range(N)]
+    commented = [f"{make_comment(rng)} game {i}" for i in range(N)]
+    common = [
+        rng.choice(("11-0 11-0 11-0", "11-5 11-6 11-7")) for i in range(N)
+    ]
+
+    for label, strings in (
+        ("scores-only", scores),
+        ("commented", commented),
+        ("repeated", common),
+    ):
+        print(f"{label} comments:")
+        reference = rate(
+            lambda s: list(map(reference_from_string, s)), strings
+        )
+        print(f"  reference parser: {reference:9.0f}/s")
+        print(
+            f"  Scores.parse_many:"
+            f"{rate(lambda s: Scores.parse_many(s), strings):9.0f}/s"
+        )
+    print(Scores.get_parse_cache_info())
@@ -0,0 +1,129 @@
+#!/usr/bin/python3
+#
+# Copyright © 2021–2022 martin f. krafft <tctools@pobox.madduck.net>
+# Released under the MIT Licence
+#
+# Measure reading a large TC export: only the Games sheet, parsing the whole
+# workbook with pyexcel.get_book() vs. parsing sheets on demand, all of it,
+# parsing the workbook vs. loading a snapshot, and re-reading games vs.
+# updating from an export where only few rows changed.
+#
+
+import os
+import tempfile
+import time
+import pyexcel
+
+from pytcnz.workbook import LazyWorkbook
+from pytcnz.dtkapiti.tcexport_reader import TCExportReader
+
+N = 5000
+DRAWS = 10
+
+BOOK = {
+    "Tournament": [["Title", "Benchmark Open"]],
+    "Draws": [["Name", "Description", "Colour", "Gendered"]]
+    + [[f"M{d}", f"Men's {d}", "$00123456", "M"] for d in range(DRAWS)],
+    "Players": [["Code", "Name", "Gender", "Points", "DOB", "Phone", "Mobile"]]
+    + [
+        [
+            f"M{i % DRAWS}{i // DRAWS + 1:02d}",
+            f"Player {i}",
+            "M",
+            i,
+            "30/08/1999",
+            "",
+            "",
+        ]
+        for i in range(N)
+    ],
+    "Games": [
+        [
+            "Name",
+            "Player1",
+            "From1",
+            "Score1",
+            "Player2",
+            "From2",
+            "Score2",
+            "Status",
+            "Comment",
+            "DayTime",
+        ]
+    ]
+    + [
+        [
+            f"M{i % DRAWS}{i // DRAWS + 1:02d}",
+            f"Player {i}",
+            "",
+            0,
+            f"Player {i + DRAWS}",
+            "",
+            0,
+            99,
+            "",
+            "Thu 18:00",
+        ]
+        for i in range(N // 2)
+    ],
+}
+
+
+def eager(filename):
+    sheet = pyexcel.get_book(file_name=filename)["Games"]
+    sheet.name_columns_by_row(0)
+    return list(sheet)
+
+
+def lazy(filename):
+    with LazyWorkbook(filename) as workbook:
+        header, rows = workbook.get_table("Games")
+        return list(rows)
+
+
+def read_all(filename, snapshot=None):
+    return TCExportReader(
+        filename,
+        read_all=True,
+        snapshot=snapshot,
+        add_players_to_draws=True,
+        add_games_to_draws=True,
+    )
+
+
+def read_games(filename):
+    reader = TCExportReader(filename)
+    reader.read_players()
+    reader.read_games()
+    return reader
+
+
+def measure(label, fn, *args, n=5):
+    start = time.perf_counter()
+    for i in range(n):
+        fn(*args)
+    print(f"{label:10s} {(time.perf_counter() - start) / n:.3f}s")
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, "export.xls")
+        snapshot = os.path.join(tmpdir, "export.snapshot")
+        pyexcel.save_book_as(bookdict=BOOK, dest_file_name=filename)
+
+        print("Games sheet only:")
+        measure("get_book", eager, filename)
+        measure("lazy", lazy, filename)
+        assert eager(filename) == lazy(filename)
+
+        print("All sheets:")
+        measure("parse", read_all, filename)
+        reader = read_all(filename, snapshot)
+        measure("snapshot", read_all, filename, snapshot)
+        restored = read_all(filename, snapshot)
+        assert restored.players == reader.players
+        assert restored.games.keys() == reader.games.keys()
+
+        print("Players and games again:")
+        measure("re-read", read_games, filename)
+        measure("update", reader.update)
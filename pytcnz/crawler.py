@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2021–2022 martin f. krafft <tctools@pobox.madduck.net>
+# Released under the MIT Licence
+#
+
+import contextlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from .exceptions import BaseException
+
+
+class TokenBucket:
+    """Rate limiter handing out `rate` tokens per second, up to `burst`
+
+    acquire() blocks until a token is available. Callers that have to wait
+    reserve their token before sleeping, so that concurrent callers queue
+    up behind each other rather than all waking at the same time.
+    """
+
+    class InvalidRateError(BaseException):
+        pass
+
+    def __init__(self, rate, burst=1, *, clock=time.monotonic, sleep=None):
+        if not rate or rate <= 0:
+            raise TokenBucket.InvalidRateError(f"Rate must be > 0: {rate}")
+        if burst < 1:
+            raise TokenBucket.InvalidRateError(f"Burst must be >= 1: {burst}")
+        self.__rate = rate
+        self.__burst = burst
+        self.__clock = clock
+        self.__sleep = sleep or time.sleep
+        self.__tokens = burst
+        self.__last = clock()
+        self.__lock = threading.Lock()
+
+    rate = property(lambda s: s.__rate)
+    burst = property(lambda s: s.__burst)
+
+    def acquire(self):
+        with self.__lock:
+            now = self.__clock()
+            self.__tokens = min(
+                self.__burst,
+                self.__tokens + (now - self.__last) * self.__rate,
+            )
+            self.__last = now
+            self.__tokens -= 1
+            wait = -self.__tokens / self.__rate if self.__tokens < 0 else 0
+
+        if wait > 0:
+            self.__sleep(wait)
+        return wait
+
+
+class Crawler:
+    """Run a fetch function over a list of queries, concurrently
+
+    Up to `concurrency` fetches are in flight at any time, optionally
+    limited to `rate` requests per second overall. Fetches raising one of
+    the `retry_on` exceptions are retried up to `retries` times, waiting
+    `backoff`, then twice that, and so on between attempts.
+
+    Results are returned in the order of the queries, no matter the order
+    in which the fetches complete.
+    """
+
+    class FetchError(BaseException):
+        def __init__(self, query, error):
+            super().__init__(f"{query}: {error}")
+            self.query = query
+            self.error = error
+
+    def __init__(
+        self,
+        fetch,
+        *,
+        concurrency=4,
+        rate=None,
+        burst=1,
+        retries=3,
+        backoff=0.5,
+        retry_on=(Exception,),
+        sleep=None,
+    ):
+        self.__fetch = fetch
+        self.__concurrency = max(1, concurrency or 1)
+        self.__bucket = TokenBucket(rate, burst, sleep=sleep) if rate else None
+        self.__retries = retries
+        self.__backoff = backoff
+        self.__retry_on = tuple(retry_on)
+        self.__sleep = sleep or time.sleep
+
+    concurrency = property(lambda s: s.__concurrency)
+
+    def __fetch_one(self, query):
+        for attempt in range(self.__retries + 1):
+            if self.__bucket:
+                self.__bucket.acquire()
+            try:
+                return self.__fetch(query)
+            except self.__retry_on as e:
+                if attempt == self.__retries:
+                    raise Crawler.FetchError(query, e) from e
+                self.__sleep(self.__backoff * 2**attempt)
+
+    def map(self, queries):
+        queries = list(queries)
+        if self.__concurrency == 1 or len(queries) < 2:
+            return [self.__fetch_one(q) for q in queries]
+
+        pool = ThreadPoolExecutor(max_workers=self.__concurrency)
+        try:
+            return list(pool.map(self.__fetch_one, queries))
+        finally:
+            # Do not bother with outstanding queries if one failed for good
+            pool.shutdown(cancel_futures=True)
+
+
+class RequestMetrics:
+    """Thread-safe count and latency statistics of requests made
+
+    Wrap each request in `with metrics.measure():` to have it counted.
+    Requests that raise are counted as failures, but their latency is
+    recorded all the same.
+    """
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.__lock:
+            self.__count = 0
+            self.__failures = 0
+            self.__total = 0.0
+            self.__max = 0.0
+
+    count = property(lambda s: s.__count)
+    failures = property(lambda s: s.__failures)
+    total_time = property(lambda s: s.__total)
+    max_latency = property(lambda s: s.__max)
+    mean_latency = property(
+        lambda s: s.__total / s.__count if s.__count else 0.0
+    )
+
+    def record(self, latency, *, failed=False):
+        with self.__lock:
+            self.__count += 1
+            self.__failures += bool(failed)
+            self.__total += latency
+            self.__max = max(self.__max, latency)
+
+    @contextlib.contextmanager
+    def measure(self):
+        start = time.perf_counter()
+        failed = True
+        try:
+            yield
+            failed = False
+        finally:
+            self.record(time.perf_counter() - start, failed=failed)
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__}({self.count} requests, "
+            f"{self.failures} failed, "
+            f"{self.mean_latency * 1000:.1f}ms mean, "
+            f"{self.max_latency * 1000:.1f}ms max)>"
+        )
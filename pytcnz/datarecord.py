@@ -6,6 +6,7 @@
 
 from .exceptions import BaseException
 from collections import UserDict
+from types import MemberDescriptorType
 
 
 class DataRecord(UserDict):
@@ -64,6 +65,18 @@ class DataRecord(UserDict):
     def __repr__(self):
         return f"<{self.__class__.__name__}({self.data})>"
 
+    def __setstate__(self, state):
+        # Records are read-only and look up missing attributes in their
+        # data, so unpickling has to bypass __setattr__ and __getattr__.
+        # The state dict is assigned, not copied, as morphed Placeholders
+        # share theirs with the record they were set to.
+        if isinstance(state, tuple):
+            state, slots = state
+            for attr, value in (slots or {}).items():
+                object.__setattr__(self, attr, value)
+        if state is not None:
+            object.__setattr__(self, "__dict__", state)
+
 
 class Placeholder(DataRecord):
     def __init__(self, name, **kwargs):
@@ -72,8 +85,14 @@ class Placeholder(DataRecord):
 
     def set(self, obj):
         self.__dict__["_DataRecord__sealed"] = False
-        self.__class__ = obj.__class__
-        self.__dict__ = obj.__dict__
+        if isinstance(obj, CompactRecord):
+            # A slots-backed record has no __dict__ to share and a layout
+            # we cannot morph into, so we become a proxy instead
+            self.__dict__ = {"_BoundPlaceholder__target": obj}
+            self.__class__ = BoundPlaceholder
+        else:
+            self.__class__ = obj.__class__
+            self.__dict__ = obj.__dict__
 
     def __bool__(self):
         return False
@@ -82,6 +101,249 @@ class Placeholder(DataRecord):
         return getattr(self, f"_{self.__class__.__name__}__name", self.name)
 
 
+class BoundPlaceholder(Placeholder):
+    # What a Placeholder turns into when set() to a CompactRecord. All access
+    # is forwarded to the target, and __class__ is faked so that isinstance()
+    # continues to work as it would after morphing.
+
+    @property
+    def __class__(self):
+        return self.__target.__class__
+
+    def __getattr__(self, attr):
+        return getattr(self.__target, attr)
+
+    def __setattr__(self, attr, value):
+        raise DataRecord.ReadOnlyError(
+            f"DataRecord is read-only, cannot assign {attr}={value}"
+        )
+
+    def __getitem__(self, key):
+        return self.__target[key]
+
+    def __contains__(self, key):
+        return key in self.__target
+
+    def __iter__(self):
+        return iter(self.__target)
+
+    def __len__(self):
+        return len(self.__target)
+
+    def get(self, key, default=None):
+        return self.__target.get(key, default)
+
+    def __eq__(self, other):
+        return self.__target == other
+
+    def __lt__(self, other):
+        return self.__target < other
+
+    def __hash__(self):
+        return hash(self.__target)
+
+    def __bool__(self):
+        return True
+
+    def __str__(self):
+        return str(self.__target)
+
+    def __repr__(self):
+        return repr(self.__target)
+
+    def __reduce_ex__(self, protocol):
+        # Pickle would take the faked __class__ for the real one, so pickle
+        # the target instead, and bind a new proxy to it when unpickling
+        return _bind_placeholder, (self.__target,)
+
+
+def _bind_placeholder(target):
+    placeholder = BoundPlaceholder.__new__(BoundPlaceholder)
+    object.__setattr__(
+        placeholder, "__dict__", {"_BoundPlaceholder__target": target}
+    )
+    return placeholder
+
+
+class _CompactRecordType(type(DataRecord)):
+    def __new__(mcls, name, bases, namespace, **kwargs):
+        fields = tuple(f.lower() for f in namespace.get("fields", ()))
+        attributes = tuple(namespace.get("attributes", ()))
+        if fields:
+            namespace["fields"] = fields
+
+        inherited = {}
+        for base in reversed(bases):
+            inherited |= getattr(base, "_field_slots", {})
+
+        for field in fields:
+            if field in inherited:
+                continue
+            for base in bases:
+                if hasattr(base, field):
+                    raise DataRecord.InvalidDataError(
+                        f"'{field}' is a reserved field name of {name}"
+                    )
+
+        if "__slots__" not in namespace:
+            namespace["__slots__"] = tuple(
+                f for f in fields + attributes if f not in inherited
+            )
+
+        cls = super().__new__(mcls, name, bases, namespace, **kwargs)
+        cls._field_slots = inherited | {
+            f: getattr(cls, f)
+            for f in fields
+            if isinstance(getattr(cls, f, None), MemberDescriptorType)
+        }
+        return cls
+
+
+class CompactRecord(DataRecord, metaclass=_CompactRecordType):
+    """Slots-backed DataRecord with a fixed schema
+
+    Subclasses list the fields they expect in `fields`, and each field gets
+    its own slot, rather than an entry in a per-instance dict. Keys are
+    lowercased once during construction. Data not covered by the schema is
+    still accepted, but kept in a dict on the side. Use `attributes` to
+    reserve slots for plain instance attributes set before sealing.
+
+    Mix this into an existing record class to get a compact variant, e.g.
+
+        class CompactPlayer(Player, CompactRecord):
+            fields = ("name", "gender", "points")
+
+    or use make_compact(), which does the same.
+    """
+
+    __slots__ = ("__sealed", "__extra")
+
+    _field_slots = {}
+
+    def __new__(cls, *args, **kwargs):
+        self = super().__new__(cls)
+        object.__setattr__(self, "_CompactRecord__sealed", False)
+        object.__setattr__(self, "_CompactRecord__extra", None)
+        return self
+
+    def __init__(self, **kwargs):
+        slots = self._field_slots
+        extra = {}
+        for key, value in kwargs.items():
+            key = key.lower()
+            slot = slots.get(key)
+            if slot is not None:
+                slot.__set__(self, value)
+            elif hasattr(self.__class__, key):
+                raise DataRecord.InvalidDataError(
+                    f"'{key}' is a reserved field name of "
+                    f"{self.__class__.__name__}"
+                )
+            else:
+                extra[key] = value
+        if extra:
+            object.__setattr__(self, "_CompactRecord__extra", extra)
+        object.__setattr__(self, "_CompactRecord__sealed", True)
+
+    @property
+    def data(self):
+        ret = {}
+        for field, slot in self._field_slots.items():
+            try:
+                ret[field] = slot.__get__(self)
+            except AttributeError:
+                pass
+        if self.__extra:
+            ret |= self.__extra
+        return ret
+
+    def __getitem__(self, key):
+        slot = self._field_slots.get(key) or self._field_slots.get(
+            key.lower()
+        )
+        if slot is not None:
+            try:
+                return slot.__get__(self)
+            except AttributeError:
+                raise KeyError(key)
+        elif self.__extra:
+            try:
+                return self.__extra[key]
+            except KeyError:
+                return self.__extra[key.lower()]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        raise DataRecord.ReadOnlyError(
+            f"DataRecord is read-only, cannot assign {key}={value}"
+        )
+
+    def __delitem__(self, key):
+        raise DataRecord.ReadOnlyError(
+            f"DataRecord is read-only, cannot delete {key}"
+        )
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key):
+        slot = self._field_slots.get(key)
+        if slot is not None:
+            try:
+                slot.__get__(self)
+                return True
+            except AttributeError:
+                return False
+        return bool(self.__extra) and key in self.__extra
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __eq__(self, other):
+        try:
+            return self.data == other.data
+        except AttributeError:
+            return NotImplemented
+
+    def __getattr__(self, attr):
+        # Only reached if a field slot is unset, or attr is not a field
+        if attr.startswith("_CompactRecord__"):
+            raise AttributeError(attr)
+        try:
+            return self[attr]
+        except KeyError:
+            raise AttributeError(
+                f"'{self.__class__.__name__}' has no attribute '{attr}'"
+            )
+
+    def __setattr__(self, attr, value):
+        if self.__sealed:
+            raise DataRecord.ReadOnlyError(
+                f"DataRecord is read-only, cannot assign {attr}={value}"
+            )
+        else:
+            object.__setattr__(self, attr.lower(), value)
+
+
+def make_compact(Klass, fields, *, attributes=()):
+    return _CompactRecordType(
+        Klass.__name__,
+        (Klass, CompactRecord),
+        dict(
+            __module__=Klass.__module__,
+            __qualname__=Klass.__qualname__,
+            fields=tuple(fields),
+            attributes=tuple(attributes),
+        ),
+    )
+
+
 if __name__ == "__main__":
     d = DataRecord(one=1, two=2, three=3)
     print(vars(d))
@@ -5,6 +5,9 @@
 #
 
 import re
+import functools
+import operator
+from collections import OrderedDict
 from .exceptions import BaseException
 from .playerbase import PlayerBase
 from .draw import Draw as DrawBase
@@ -53,6 +56,8 @@ class DataSource:
         r += f"players:{len(self.players)}"
         return f"{r})>"
 
+    UNSAFE_COLNAME_RE = re.compile(r"^\d+|\W+")
+
     @classmethod
     def sanitise_colname(cls, colname):
         def replace_safe(s):
@@ -63,7 +68,7 @@ class DataSource:
             else:
                 return ""  # noqa:E272,E701,E501
 
-        return re.sub(r"^\d+|\W+", replace_safe, str(colname)).lower()
+        return cls.UNSAFE_COLNAME_RE.sub(replace_safe, str(colname)).lower()
 
     @classmethod
     def sanitise_colnames(cls, colnames):
@@ -98,44 +103,138 @@ class DataSource:
         self.tname = tname
 
     @classmethod
-    def read_rows_into(
+    def get_column_plan(
+        cls, colnames, *, colmap=None, idcol="name", drop_fields=None
+    ):
+        return _get_column_plan(
+            tuple(colnames),
+            frozenset((colmap or {}).items()),
+            idcol,
+            frozenset(drop_fields or ()),
+        )
+
+    @classmethod
+    def __make_records(
         cls,
-        target,
-        colnames,
+        plan,
         rows,
         Klass,
         *,
-        colmap=None,
-        idcol="name",
         preprocess=None,
         postprocess=None,
-        resolve_duplicate_cb=None,
         **kwargs,
     ):
-        colnames = cls.sanitise_colnames(colnames)
-        idcol = cls.sanitise_colname(idcol)
-        if colmap:
-            colnames = cls.apply_colmap(colmap, colnames)
+        idcol, idindex = plan.idcol, plan.idindex
         for row in rows:
-            data = dict(zip(colnames, row))
+            if not preprocess and idindex is not None and idindex < len(row):
+                # skip rows without ID before even building their data
+                if not row[idindex]:
+                    continue
+                data = plan.make_kwargs(row)
+
+            else:
+                data = plan.make_kwargs(row)
 
-            if preprocess:
-                preprocess(data)
+                if preprocess:
+                    preprocess(data)
 
-            if not data[idcol]:
-                continue
+                if not data[idcol]:
+                    continue
 
             p = Klass(**data | kwargs)
 
             if postprocess:
                 postprocess(p)
 
+            yield p
+
+    @classmethod
+    def read_rows_into(
+        cls,
+        target,
+        colnames,
+        rows,
+        Klass,
+        *,
+        colmap=None,
+        idcol="name",
+        drop_fields=None,
+        preprocess=None,
+        postprocess=None,
+        resolve_duplicate_cb=None,
+        **kwargs,
+    ):
+        plan = cls.get_column_plan(
+            colnames, colmap=colmap, idcol=idcol, drop_fields=drop_fields
+        )
+        idcol = plan.idcol
+        for p in cls.__make_records(
+            plan,
+            rows,
+            Klass,
+            preprocess=preprocess,
+            postprocess=postprocess,
+            **kwargs,
+        ):
             if p[idcol] in target and resolve_duplicate_cb:
                 p = resolve_duplicate_cb(target[p[idcol]], p)
 
             target[p[idcol]] = p
 
-        return colnames
+        return list(plan.colnames)
+
+    @classmethod
+    def iter_rows(
+        cls,
+        colnames,
+        rows,
+        Klass,
+        *,
+        colmap=None,
+        idcol="name",
+        drop_fields=None,
+        preprocess=None,
+        postprocess=None,
+        resolve_duplicate_cb=None,
+        index_size=1000,
+        **kwargs,
+    ):
+        """Like read_rows_into, but yield records as rows are consumed
+
+        Nothing is read from rows until the caller asks for the next
+        record, and nothing is kept other than an index of the last
+        index_size records, used to detect duplicates. If a duplicate is
+        found in there, and resolve_duplicate_cb keeps the existing record,
+        nothing is yielded. Otherwise the resolved record is yielded, and
+        it is up to the caller to replace the record seen earlier.
+        """
+        plan = cls.get_column_plan(
+            colnames, colmap=colmap, idcol=idcol, drop_fields=drop_fields
+        )
+        idcol = plan.idcol
+        index = OrderedDict()
+        for p in cls.__make_records(
+            plan,
+            rows,
+            Klass,
+            preprocess=preprocess,
+            postprocess=postprocess,
+            **kwargs,
+        ):
+            key = p[idcol]
+            if key in index:
+                existing = index.pop(key)
+                if resolve_duplicate_cb:
+                    p = resolve_duplicate_cb(existing, p)
+                    if p is existing:
+                        index[key] = p
+                        continue
+
+            index[key] = p
+            if len(index) > index_size:
+                index.popitem(last=False)
+
+            yield p
 
     def read_players(
         self,
@@ -221,6 +320,27 @@ class DataSource:
         except BaseException as e:
             raise DataSource.ReadError("Reading games", e)
 
+    def __iter_records(self, what, Klass, colnames, rows, **kwargs):
+        try:
+            yield from DataSource.iter_rows(colnames, rows, Klass, **kwargs)
+        except BaseException as e:
+            raise DataSource.ReadError(f"Reading {what}", e)
+
+    def iter_players(self, colnames, rows, **kwargs):
+        return self.__iter_records(
+            "players", self.Player_class, colnames, rows, **kwargs
+        )
+
+    def iter_draws(self, colnames, rows, **kwargs):
+        return self.__iter_records(
+            "draws", self.Draw_class, colnames, rows, **kwargs
+        )
+
+    def iter_games(self, colnames, rows, **kwargs):
+        return self.__iter_records(
+            "games", self.Game_class, colnames, rows, **kwargs
+        )
+
     def read_all(
         self, *, draws_colmap=None, players_colmap=None, games_colmap=None
     ):
@@ -240,3 +360,63 @@ class DataSource:
 
     def get_players(self):
         return self.players.values()
+
+
+class ColumnPlan:
+    """How to turn rows with a given header into record data
+
+    Sanitising column names, applying the colmap, and working out which
+    fields to drop only depend on the header, so this is done once, and
+    the result is cached for all further reads with the same header. Rows
+    are then turned into record data by indexing, rather than zipping all
+    columns into a dict and deleting what is not needed.
+    """
+
+    def __init__(self, colnames, *, colmap=None, idcol="name", drop_fields=()):
+        colnames = DataSource.sanitise_colnames(colnames)
+        if colmap:
+            colnames = DataSource.apply_colmap(colmap, colnames)
+        self.colnames = tuple(colnames)
+        self.idcol = DataSource.sanitise_colname(idcol)
+
+        # later columns win over earlier columns of the same name, like
+        # they would in dict(zip(colnames, row))
+        indices = {}
+        for i, col in enumerate(self.colnames):
+            indices.pop(col, None)
+            if col not in drop_fields:
+                indices[col] = i
+
+        self.fields = tuple(indices.keys())
+        self.indices = tuple(indices.values())
+        self.width = max(self.indices, default=-1) + 1
+        self.idindex = indices.get(self.idcol)
+
+        if len(self.indices) == 1:
+            getter = operator.itemgetter(*self.indices)
+            self.__getter = lambda row: (getter(row),)
+        elif self.indices:
+            self.__getter = operator.itemgetter(*self.indices)
+        else:
+            self.__getter = lambda row: ()
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}({', '.join(self.fields)})>"
+
+    def make_kwargs(self, row):
+        if len(row) >= self.width:
+            return dict(zip(self.fields, self.__getter(row)))
+        else:
+            # short rows just lack the trailing fields, as with zip()
+            return {
+                f: row[i]
+                for f, i in zip(self.fields, self.indices)
+                if i < len(row)
+            }
+
+
+@functools.lru_cache(maxsize=64)
+def _get_column_plan(colnames, colmap, idcol, drop_fields):
+    return ColumnPlan(
+        colnames, colmap=dict(colmap), idcol=idcol, drop_fields=drop_fields
+    )
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2021–2022 martin f. krafft <tctools@pobox.madduck.net>
+# Released under the MIT Licence
+#
+
+from datetime import datetime
+from .util import LazyImport
+
+dateutil_parser = LazyImport("dateutil.parser")
+
+
+class DateParser:
+    """Parser for columns of date strings, e.g. dates of birth
+
+    The dates in a column are all in the same format, so the format is
+    detected on the first string parsed, and then used with strptime()
+    for all subsequent strings, which is much faster than dateutil.
+    Should a string not match the format, detection runs again, and
+    strings in formats not known here are handed to dateutil. Either way,
+    the result is the same as dateutil.parser.parse(string, dayfirst=…),
+    and memoised, as many strings recur, e.g. expiry dates.
+    """
+
+    # With dayfirst, dateutil reads ISO dates like 1999-03-05 as the 3rd
+    # of May, so those are left to dateutil, to get the same results
+    DAYFIRST_FORMATS = (
+        "%d/%m/%Y",
+        "%d-%m-%Y",
+        "%d.%m.%Y",
+        "%d %b %Y",
+        "%d %B %Y",
+    )
+
+    MONTHFIRST_FORMATS = (
+        "%m/%d/%Y",
+        "%Y-%m-%d",
+        "%m-%d-%Y",
+        "%Y-%m-%d %H:%M:%S",
+    )
+
+    def __init__(self, *, dayfirst=True, formats=None):
+        self.__dayfirst = dayfirst
+        self.__formats = formats or (
+            self.DAYFIRST_FORMATS if dayfirst else self.MONTHFIRST_FORMATS
+        )
+        self.__format = None
+        self.__memo = {}
+        self.hits = 0
+        self.misses = 0
+
+    format = property(lambda s: s.__format)
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__}({self.__format or 'undetected'}, "
+            f"{len(self.__memo)} seen)>"
+        )
+
+    @staticmethod
+    def __strptime(string, fmt):
+        try:
+            ret = datetime.strptime(string, fmt)
+        except ValueError:
+            return None
+        # strptime takes "99" for %Y to mean the year 99, whereas dateutil
+        # would make it 1999
+        return ret if ret.year >= 1000 else None
+
+    def __parse(self, string):
+        if self.__format:
+            ret = self.__strptime(string, self.__format)
+            if ret is not None:
+                return ret
+
+        for fmt in self.__formats:
+            if fmt != self.__format:
+                ret = self.__strptime(string, fmt)
+                if ret is not None:
+                    self.__format = fmt
+                    return ret
+
+        return dateutil_parser.parse(string, dayfirst=self.__dayfirst)
+
+    def parse(self, string):
+        try:
+            ret = self.__memo[string]
+            self.hits += 1
+            return ret
+        except KeyError:
+            self.misses += 1
+
+        ret = self.__parse(string)
+        self.__memo[string] = ret
+        return ret
+
+    def parse_many(self, values):
+        """Parse a column of values, passing through dates and empty ones"""
+        ret = []
+        for value in values:
+            if value:
+                try:
+                    value.strftime("")
+                except AttributeError:
+                    value = self.parse(value)
+            ret.append(value)
+        return ret
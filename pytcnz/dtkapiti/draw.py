@@ -32,6 +32,11 @@ class Draw(BaseDraw):
     def __init__(self, name, *, gendered=None, **kwargs):
         self.players = []
         self.games = []
+        # Indexes, so that neither duplicate checks nor lookups have to
+        # scan the lists, comparing records one by one
+        self._players_by_id = {}
+        self._players_by_name = {}
+        self._games_by_name = {}
 
         data = kwargs.copy()
         colour = data.get("colour")
@@ -42,13 +47,28 @@ class Draw(BaseDraw):
 
         super().__init__(name=name, **data)
 
+    def __has_player(self, player):
+        # Players compare equal by their data, including the name, so only
+        # those with the same name need comparing
+        return any(
+            p == player for p in self._players_by_name.get(player.name, ())
+        )
+
+    def __unindex_player(self, player):
+        if self._players_by_id.get(player.id) is player:
+            del self._players_by_id[player.id]
+        players = self._players_by_name.get(player.name, [])
+        players[:] = [p for p in players if p is not player]
+        if not players:
+            self._players_by_name.pop(player.name, None)
+
     def add_player(self, player):
         if not player.id.startswith(self.name):
             raise Draw.InvalidPlayerError(
                 f"Player {player} does not belong into draw {self.name}"
             )
 
-        if player in self.players:
+        if self.__has_player(player):
             raise Draw.DuplicatePlayerError(
                 f"Player {player} already added to draw {self.name}"
             )
@@ -61,32 +81,81 @@ class Draw(BaseDraw):
 
         for i in range(max(0, player.seed - len(self.players))):
             self.players.append(None)
+        if replaced := self.players[player.seed - 1]:
+            self.__unindex_player(replaced)
         player.draw.set(self)
         self.players[player.seed - 1] = player
+        self._players_by_id[player.id] = player
+        self._players_by_name.setdefault(player.name, []).append(player)
+
+    def remove_player(self, player):
+        seed = player.seed
+        if 0 < seed <= len(self.players) and self.players[seed - 1] is player:
+            self.players[seed - 1] = None
+            self.__unindex_player(player)
 
     def get_players(self):
         return self.players
 
+    def get_player_by_seed(self, seed):
+        if 0 < seed <= len(self.players):
+            return self.players[seed - 1]
+        return None
+
+    def get_player_by_id(self, id):
+        return self._players_by_id.get(id)
+
     def get_size(self):
         return len(self.players)
 
-    def add_game(self, game):
+    def __check_game(self, game):
         if not game.name.startswith(self.name):
             raise Draw.InvalidGameError(
                 f"Game {game} does not belong into draw {self.name}"
             )
 
-        if game in self.games:
+        if game.name in self._games_by_name:
             raise Draw.DuplicateGameError(
                 f"Game {game} already added to draw {self.name}"
             )
 
+    def add_game(self, game):
+        self.__check_game(game)
         game.draw.set(self)
         self.games.append(game)
+        self._games_by_name[game.name] = game
+
+    def __get_game_index(self, game):
+        for i, g in enumerate(self.games):
+            if g is game:
+                return i
+        return None
+
+    def remove_game(self, game):
+        if self._games_by_name.get(game.name) is game:
+            del self._games_by_name[game.name]
+            del self.games[self.__get_game_index(game)]
+
+    def replace_game(self, old, new):
+        """Put the new game where the old one was, e.g. after an update"""
+        if self._games_by_name.get(old.name) is not old:
+            return self.add_game(new)
+        del self._games_by_name[old.name]
+        try:
+            self.__check_game(new)
+        except (Draw.InvalidGameError, Draw.DuplicateGameError):
+            self._games_by_name[old.name] = old
+            raise
+        new.draw.set(self)
+        self.games[self.__get_game_index(old)] = new
+        self._games_by_name[new.name] = new
 
     def get_games(self):
         return self.games
 
+    def get_game(self, name):
+        return self._games_by_name.get(name)
+
 
 if __name__ == "__main__":
     from ..gender import Gender
@@ -4,16 +4,16 @@
 # Released under the MIT Licence
 #
 
-import dateutil.parser
 import enum
-import re
 
 from ..game import Game as BaseGame
 from ..squashnz.game_names import get_game_name
 from ..datarecord import Placeholder
+from .. import patterns
 from ..exceptions import BaseException
 from ..scores import Scores
 from ..warnings import Warnings
+from .schedule import ScheduleParser
 
 
 class Game(BaseGame):
@@ -92,12 +92,12 @@ class Game(BaseGame):
         *,
         autoflip_scores=False,
         drawnamepat=r"\w\d{1}",
+        schedule_parser=None,
         **kwargs,
     ):
         draw_name = None
         if name is not None and len(name):
-            pat = re.compile(rf"(?P<draw>{drawnamepat})")
-            md = re.match(pat, name).groupdict()
+            md = patterns.get_draw_re(drawnamepat).match(name).groupdict()
             draw_name = md.get("draw")
         data = kwargs | dict(draw=Placeholder(name=draw_name))
 
@@ -190,16 +190,15 @@ class Game(BaseGame):
             try:
                 datetime.strftime("")
             except AttributeError:
-                # parse into a date starting from next Monday. This is to
-                # ensure that when a string like "Thu 7:30pm" is passed to the
-                # code run on a Thursday and on a Friday, the result is the
-                # same on both.
-                data["datetime"] = dateutil.parser.parse(
-                    datetime,
-                    default=data.get(
-                        "tournament_start_date", dateutil.parser.parse("Mon")
-                    ),
-                )
+                # parse into a date starting from next Monday, unless the
+                # tournament start date is known, see ScheduleParser
+                if start := data.get("tournament_start_date"):
+                    schedule_parser = ScheduleParser.for_reference(start)
+                elif schedule_parser is None:
+                    schedule_parser = ScheduleParser.for_reference(
+                        ScheduleParser.get_next_monday()
+                    )
+                data["datetime"] = schedule_parser.parse(datetime)
             del data["daytime"]
 
         super().__init__(name=name, player1=player1, player2=player2, **data)
@@ -275,6 +274,8 @@ class Game(BaseGame):
 
 
 if __name__ == "__main__":
+    import dateutil.parser
+
     gd = dict(
         name="W0201",
         player1="",
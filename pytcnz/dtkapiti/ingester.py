@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2021–2022 martin f. krafft <tctools@pobox.madduck.net>
+# Released under the MIT Licence
+#
+
+import asyncio
+import threading
+from ..exceptions import BaseException
+from ..filewatcher import FileWatcher
+from ..warnings import Warnings
+from .tcexport_reader import TCExportReader
+
+
+class TCExportIngester:
+    """Keep the data of a TC export up to date as the export is rewritten
+
+    The export is read once, and then watched for changes. Once it has not
+    changed for `debounce` seconds, it is updated incrementally with
+    TCExportReader.update(), so that the parsed data stays in memory
+    between updates. Should the export not be readable, e.g. because it
+    is only partly written, this is retried after another `debounce`
+    seconds, and if an update fails half-way, the export is read anew.
+
+    Subscribers are called with the reader and the TCExportReader.ChangeSet
+    whenever something changed, including after the first read, when all
+    players and games are new. Subscribers are called from the thread
+    ingesting the data; hold `lock` to access the reader from elsewhere.
+
+        ingester = TCExportIngester("export.xls", add_games_to_draws=True)
+        ingester.subscribe(lambda reader, changes: publish(changes))
+        ingester.start()
+
+    Keyword arguments other than those listed are passed to
+    TCExportReader.
+    """
+
+    def __init__(
+        self,
+        filename,
+        *,
+        debounce=1.0,
+        poll_interval=1.0,
+        use_inotify=None,
+        **reader_kwargs,
+    ):
+        self.__filename = filename
+        self.__debounce = debounce
+        self.__poll_interval = poll_interval
+        self.__use_inotify = use_inotify
+        self.__reader_kwargs = reader_kwargs
+        self.__reader = None
+        self.__subscribers = []
+        self.__stopping = threading.Event()
+        self.__thread = None
+        self.lock = threading.RLock()
+
+    reader = property(lambda s: s.__reader)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}({self.__filename})>"
+
+    def subscribe(self, callback):
+        self.__subscribers.append(callback)
+        return callback
+
+    def unsubscribe(self, callback):
+        self.__subscribers.remove(callback)
+
+    def get_queue(self, *, loop=None, maxsize=0):
+        """Return an asyncio.Queue receiving (reader, changes) tuples
+
+        Call this from the event loop, or pass the loop.
+        """
+        loop = loop or asyncio.get_running_loop()
+        queue = asyncio.Queue(maxsize=maxsize)
+
+        def put(reader, changes):
+            loop.call_soon_threadsafe(queue.put_nowait, (reader, changes))
+
+        self.subscribe(put)
+        return queue
+
+    def __publish(self, changes):
+        for callback in list(self.__subscribers):
+            try:
+                callback(self.__reader, changes)
+            except (Exception, BaseException) as e:
+                Warnings.add(str(e), context=f"Publishing to {callback}")
+
+    def __read(self):
+        reader = TCExportReader(
+            self.__filename, read_all=True, **self.__reader_kwargs
+        )
+        changes = TCExportReader.ChangeSet()
+        changes.added_players = list(reader.players.values())
+        changes.added_games = list(reader.games.values())
+        return reader, changes
+
+    def ingest(self):
+        """Read or update the export once, and publish the changes
+
+        Returns the changes, or None if the export could not be read.
+        """
+        with self.lock:
+            try:
+                if self.__reader is None:
+                    self.__reader, changes = self.__read()
+                else:
+                    changes = self.__reader.update()
+            except (Exception, BaseException) as e:
+                # An update that failed half-way leaves the data in an
+                # unknown state, so start afresh next time
+                self.__reader = None
+                Warnings.add(str(e), context=f"Reading {self.__filename}")
+                return None
+
+            if changes:
+                self.__publish(changes)
+            return changes
+
+    def run(self):
+        """Ingest the export, and then each time it changed, until stop()"""
+        with FileWatcher(
+            self.__filename,
+            poll_interval=self.__poll_interval,
+            use_inotify=self.__use_inotify,
+        ) as watcher:
+            pending = True
+            while not self.__stopping.is_set():
+                if pending:
+                    # wait for writing the export to finish
+                    while not self.__stopping.is_set() and watcher.wait(
+                        self.__debounce
+                    ):
+                        pass
+                    if self.__stopping.is_set():
+                        break
+                    pending = self.ingest() is None
+                else:
+                    pending = watcher.wait(self.__poll_interval)
+
+    def start(self):
+        self.__stopping.clear()
+        self.__thread = threading.Thread(
+            target=self.run, name=repr(self), daemon=True
+        )
+        self.__thread.start()
+
+    def stop(self, timeout=None):
+        self.__stopping.set()
+        if self.__thread is not None:
+            self.__thread.join(timeout)
+            self.__thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
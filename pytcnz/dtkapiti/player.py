@@ -4,9 +4,8 @@
 # Released under the MIT Licence
 #
 
-import re
-
 from ..datarecord import Placeholder
+from .. import patterns
 from ..phonenumber import PhoneNumber
 from ..squashnz.player import Player as BasePlayer
 
@@ -31,8 +30,7 @@ class Player(BasePlayer):
     ):
         draw_name, seed = None, None
         if id is not None and len(id):
-            pat = re.compile(rf"(?P<draw>{drawnamepat})(?P<seed>\d+)")
-            m = re.match(pat, id)
+            m = patterns.get_draw_seed_re(drawnamepat).match(id)
             if not m:
                 raise Player.DrawPatternError(
                     f"Cannot deduce draw/seed from player ID {id}. "
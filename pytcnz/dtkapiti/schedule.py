@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2021–2022 martin f. krafft <tctools@pobox.madduck.net>
+# Released under the MIT Licence
+#
+
+import functools
+import re
+from datetime import datetime, timedelta
+from ..util import LazyImport
+
+dateutil_parser = LazyImport("dateutil.parser")
+
+
+class ScheduleParser:
+    """Parser for game schedule strings like "Thu 7:30pm"
+
+    Tournament Control only gives a weekday and a time for each game, which
+    are resolved relative to a reference date, the tournament start, or
+    else the next Monday. This ensures that "Thu 7:30pm" results in the
+    same date no matter whether the code runs on a Thursday or a Friday.
+
+    The handful of formats in use are parsed with a regular expression, and
+    anything else with dateutil, the same way dateutil would parse it with
+    the reference date as default. Results are memoised per string.
+    """
+
+    WEEKDAYS = {
+        name.lower(): i
+        for i, names in enumerate(
+            (
+                ("Mon", "Monday"),
+                ("Tue", "Tuesday"),
+                ("Wed", "Wednesday"),
+                ("Thu", "Thursday"),
+                ("Fri", "Friday"),
+                ("Sat", "Saturday"),
+                ("Sun", "Sunday"),
+            )
+        )
+        for name in names
+    }
+
+    SCHEDULE_RE = re.compile(
+        r"^\s*(?P<weekday>[a-z]+),?\s+"
+        r"(?P<hour>\d{1,2})(?::(?P<minute>\d{2}))?"
+        r"\s*(?P<ampm>[ap]m)?\s*$",
+        re.IGNORECASE,
+    )
+
+    def __init__(self, reference=None):
+        self.__reference = reference or ScheduleParser.get_next_monday()
+        self.__memo = {}
+        self.hits = 0
+        self.misses = 0
+
+    reference = property(lambda s: s.__reference)
+
+    @classmethod
+    def get_next_monday(cls, today=None):
+        today = (today or datetime.now()).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        return today + timedelta(days=-today.weekday() % 7)
+
+    @classmethod
+    @functools.lru_cache(maxsize=16)
+    def for_reference(cls, reference):
+        return cls(reference)
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__}"
+            f"(from {self.__reference:%a %F}, {len(self.__memo)} seen)>"
+        )
+
+    def __parse_fast(self, string):
+        m = self.SCHEDULE_RE.match(string)
+        if not m:
+            return None
+
+        weekday = self.WEEKDAYS.get(m["weekday"].lower())
+        hour = int(m["hour"])
+        minute = m["minute"]
+        ampm = m["ampm"]
+        if weekday is None or (minute and int(minute) > 59):
+            return None
+        elif not minute and not ampm:
+            # dateutil takes a lone number to be the day of the month
+            return None
+        if ampm:
+            if not 1 <= hour <= 12:
+                return None
+            hour = hour % 12 + (12 if ampm.lower() == "pm" else 0)
+        elif hour > 23:
+            return None
+
+        # Like dateutil, only replace the fields given in the string
+        repl = dict(hour=hour)
+        if minute:
+            repl["minute"] = int(minute)
+        ref = self.__reference
+        days = (weekday - ref.weekday()) % 7
+        return ref.replace(**repl) + timedelta(days=days)
+
+    def parse(self, string):
+        try:
+            ret = self.__memo[string]
+            self.hits += 1
+            return ret
+        except KeyError:
+            self.misses += 1
+
+        ret = self.__parse_fast(string)
+        if ret is None:
+            ret = dateutil_parser.parse(string, default=self.__reference)
+        self.__memo[string] = ret
+        return ret
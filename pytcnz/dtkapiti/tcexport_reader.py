@@ -4,19 +4,91 @@
 # Released under the MIT Licence
 #
 
-import pyexcel
-import xlrd.compdoc
+import hashlib
+from datetime import date
 from ..datasource import DataSource
 from ..exceptions import BaseException
 from .player import Player
 from .game import Game
 from .draw import Draw
+from .schedule import ScheduleParser
+from ..snapshot import Snapshot
+from ..workbook import LazyWorkbook
+from ..warnings import Warnings
+from ..util import LazyImport
+
+xlrd_compdoc = LazyImport("xlrd.compdoc")
 
 
 class TCExportReader(DataSource):
     class IncompatibleFileError(BaseException):
         pass
 
+    class ChangeSet:
+        """Records added, updated or removed by TCExportReader.update()
+
+        Updated records are listed as (old, new) tuples.
+        """
+
+        def __init__(self):
+            self.added_players = []
+            self.updated_players = []
+            self.removed_players = []
+            self.added_games = []
+            self.updated_games = []
+            self.removed_games = []
+
+        def __repr__(self):
+            return (
+                f"<{self.__class__.__name__}("
+                f"players:+{len(self.added_players)}"
+                f"~{len(self.updated_players)}"
+                f"-{len(self.removed_players)} "
+                f"games:+{len(self.added_games)}"
+                f"~{len(self.updated_games)}"
+                f"-{len(self.removed_games)})>"
+            )
+
+        def __bool__(self):
+            return any(
+                (
+                    self.added_players,
+                    self.updated_players,
+                    self.removed_players,
+                    self.added_games,
+                    self.updated_games,
+                    self.removed_games,
+                )
+            )
+
+        @staticmethod
+        def __get_result(game):
+            return (
+                game.status,
+                game.score1,
+                game.score2,
+                str(game.get("scores")),
+            )
+
+        def get_results(self):
+            """Return games newly finished, or with a changed result"""
+            ret = [g for g in self.added_games if g.is_finished()]
+            for old, new in self.updated_games:
+                if new.is_finished() and (
+                    self.__get_result(old) != self.__get_result(new)
+                ):
+                    ret.append(new)
+            return ret
+
+        def get_rescheduled(self):
+            """Return games yet to finish, with a changed date or time"""
+            return [
+                new
+                for old, new in self.updated_games
+                if not new.is_finished()
+                and old.get("datetime") != new.get("datetime")
+            ]
+
     def __init__(
         self,
         filename,
@@ -29,14 +101,21 @@ class TCExportReader(DataSource):
         Draw_class=None,
         Game_class=None,
         Player_class=None,
+        snapshot=None,
         **kwargs,
     ):
-        self.__open_book(filename)
+        self.__filename = filename
+        self.__book = None
+        self.__snapshot = snapshot
+        self.__row_digests = {}
+        self.__row_keys = {}
+        self.__row_key = None
         self.__add_players_to_draws = add_players_to_draws
         self.__add_games_to_draws = add_games_to_draws
         self.__add_players_to_games = add_players_to_games
         self.__autoflip_scores = autoflip_scores
         self.__drawnamepat = drawnamepat
+        self.__schedule_parser = ScheduleParser()
         super().__init__(
             Player_class=Player_class or Player,
             Draw_class=Draw_class or Draw,
@@ -45,11 +124,18 @@ class TCExportReader(DataSource):
         )
 
 
-    def __open_book(self, filename):
-        self.__filename = filename
+    def __get_book(self):
+        # The workbook is only opened when a sheet is needed, so that it
+        # is not touched at all if a snapshot can be used, see read_all()
+        if self.__book is None:
+            self.__book = self.__open_book(self.__filename)
+        return self.__book
+
+    @classmethod
+    def __open_book(cls, filename):
         try:
-            self.__book = pyexcel.get_book(file_name=filename)
-        except xlrd.compdoc.CompDocError as e:
+            return LazyWorkbook(filename)
+        except xlrd_compdoc.CompDocError as e:
             if "size exceeds expected" in e.args[0]:
                 raise TCExportReader.IncompatibleFileError(
                     "{filename} is corrupt, open and save it with "
@@ -58,25 +144,38 @@ class TCExportReader(DataSource):
             else:
                 raise
 
+    def __get_sheet(self, name):
+        # Sheets are only parsed when needed, and their rows streamed, so
+        # that e.g. refreshing results only ever touches the Games sheet
+        return self.__get_book().get_table(name)
+
     def read_tournament_name(self):
-        rows = self.__book["Tournament"]
-        rows.name_rows_by_column(0)
-        self.set_tournament_name(rows["Title", 0])
+        for row in self.__get_book().iter_rows("Tournament"):
+            if row and row[0] == "Title":
+                self.set_tournament_name(row[1] if len(row) > 1 else "")
+                break
 
     def read_draws(self, *, colmap=None, resolve_duplicate_cb=None, **kwargs):
-        rows = self.__book["Draws"]
-        rows.name_columns_by_row(0)
+        colnames, rows = self.__get_sheet("Draws")
         super().read_draws(
-            rows.colnames,
+            colnames,
             rows,
             colmap=colmap,
             resolve_duplicate_cb=resolve_duplicate_cb,
             **kwargs,
         )
 
-    def read_players(
-        self, *, colmap=None, resolve_duplicate_cb=None, **kwargs
-    ):
+    def iter_draws(self, *, colmap=None, resolve_duplicate_cb=None, **kwargs):
+        colnames, rows = self.__get_sheet("Draws")
+        return super().iter_draws(
+            colnames,
+            rows,
+            colmap=colmap,
+            resolve_duplicate_cb=resolve_duplicate_cb,
+            **kwargs,
+        )
+
+    def __get_players_kwargs(self, colmap):
         postprocess = None
         if self.__add_players_to_draws:
             if not self.draws:
@@ -91,18 +190,40 @@ class TCExportReader(DataSource):
         colmap = colmap or {}
         colmap |= dict(code="id")
 
-        rows = self.__book["Players"]
-        rows.name_columns_by_row(0)
-        super().read_players(
-            rows.colnames,
-            rows,
+        return dict(
             colmap=colmap,
             postprocess=postprocess,
-            resolve_duplicate_cb=resolve_duplicate_cb,
             drawnamepat=self.__drawnamepat,
+            # One reference day for the ages of all players
+            onday=date.today(),
+        )
+
+    def read_players(
+        self, *, colmap=None, resolve_duplicate_cb=None, **kwargs
+    ):
+        colnames, rows = self.__get_sheet("Players")
+        kwargs = self.__get_players_kwargs(colmap) | kwargs
+        kwargs["postprocess"] = self.__track_records(
+            "players", kwargs["postprocess"]
+        )
+        super().read_players(
+            colnames,
+            self.__track_rows("players", colnames, rows, kwargs["colmap"]),
+            resolve_duplicate_cb=resolve_duplicate_cb,
             **kwargs,
         )
 
+    def iter_players(
+        self, *, colmap=None, resolve_duplicate_cb=None, **kwargs
+    ):
+        colnames, rows = self.__get_sheet("Players")
+        return super().iter_players(
+            colnames,
+            rows,
+            resolve_duplicate_cb=resolve_duplicate_cb,
+            **self.__get_players_kwargs(colmap) | kwargs,
+        )
+
     def __add_player_to_draw(self, player):
         self.draws[player.draw.name].add_player(player)
 
@@ -115,14 +236,7 @@ class TCExportReader(DataSource):
         for player in self.players.values():
             self.__add_player_to_draw(player)
 
-    def read_games(
-        self,
-        *,
-        colmap=None,
-        autoflip_scores=None,
-        resolve_duplicate_cb=None,
-        **kwargs,
-    ):
+    def __get_games_kwargs(self, colmap, autoflip_scores):
         preprocess, postprocess = None, None
 
         if self.__add_players_to_games:
@@ -147,17 +261,50 @@ class TCExportReader(DataSource):
             else self.__autoflip_scores
         )
 
-        rows = self.__book["Games"]
-        rows.name_columns_by_row(0)
-        super().read_games(
-            rows.colnames,
-            rows,
+        return dict(
             colmap=colmap,
             preprocess=preprocess,
             postprocess=postprocess,
             autoflip_scores=autoflip_scores,
-            resolve_duplicate_cb=resolve_duplicate_cb,
             drawnamepat=self.__drawnamepat,
+            schedule_parser=self.__schedule_parser,
+        )
+
+    def read_games(
+        self,
+        *,
+        colmap=None,
+        autoflip_scores=None,
+        resolve_duplicate_cb=None,
+        **kwargs,
+    ):
+        colnames, rows = self.__get_sheet("Games")
+        games_kwargs = self.__get_games_kwargs(colmap, autoflip_scores)
+        games_kwargs["postprocess"] = self.__track_records(
+            "games", games_kwargs["postprocess"]
+        )
+        super().read_games(
+            colnames,
+            self.__track_rows("games", colnames, rows, colmap),
+            resolve_duplicate_cb=resolve_duplicate_cb,
+            **games_kwargs,
+            **kwargs,
+        )
+
+    def iter_games(
+        self,
+        *,
+        colmap=None,
+        autoflip_scores=None,
+        resolve_duplicate_cb=None,
+        **kwargs,
+    ):
+        colnames, rows = self.__get_sheet("Games")
+        return super().iter_games(
+            colnames,
+            rows,
+            resolve_duplicate_cb=resolve_duplicate_cb,
+            **self.__get_games_kwargs(colmap, autoflip_scores),
             **kwargs,
         )
 
@@ -187,6 +334,266 @@ class TCExportReader(DataSource):
         for game in self.games.values():
             self.__add_game_to_draw(game)
 
+    @staticmethod
+    def __get_row_digest(row):
+        # Stable across runs, unlike hash(), so digests can be snapshotted
+        return hashlib.blake2b(repr(row).encode(), digest_size=16).digest()
+
+    def __track_rows(self, kind, colnames, rows, colmap):
+        # Remember a digest of each row read, by the ID cell of the row, so
+        # that update() can tell which rows changed
+        idindex = DataSource.get_column_plan(colnames, colmap=colmap).idindex
+        digests = self.__row_digests[kind] = {}
+        self.__row_keys[kind] = {}
+        for row in rows:
+            self.__row_key = None
+            if idindex is not None and idindex < len(row) and row[idindex]:
+                self.__row_key = row[idindex]
+                digests[self.__row_key] = self.__get_row_digest(row)
+            yield row
+
+    def __track_records(self, kind, postprocess):
+        # Records are keyed by their ID as stored, which is not necessarily
+        # the ID cell of the row, e.g. player names get cleaned. Records are
+        # built from a row before the next row is read, so this maps the
+        # row last yielded by __track_rows to the record built from it.
+        def track(record):
+            if self.__row_key is not None:
+                self.__row_keys[kind][self.__row_key] = record.name
+            if postprocess:
+                postprocess(record)
+
+        return track
+
+    def __get_removed_keys(self, kind, removed):
+        # Rows may be removed while another row still gives the same
+        # record, e.g. if "Jane Doe" was renamed to "Dr Jane Doe"
+        keys = self.__row_keys.setdefault(kind, {})
+        live = {keys.get(k, k) for k in self.__row_digests[kind]}
+        ret = []
+        for key in removed:
+            key = keys.pop(key, key)
+            if key not in live:
+                ret.append(key)
+        return ret
+
+    def __iter_changed_records(self, kind, colnames, rows, Klass, **kwargs):
+        idindex = DataSource.get_column_plan(
+            colnames, colmap=kwargs.get("colmap")
+        ).idindex
+        keys = self.__row_keys.setdefault(kind, {})
+        for row in rows:
+            for record in DataSource.iter_rows(
+                colnames, (row,), Klass, **kwargs
+            ):
+                keys[row[idindex]] = record.name
+                yield record
+
+    def __diff_rows(self, kind, colnames, rows, colmap, force=()):
+        idindex = DataSource.get_column_plan(colnames, colmap=colmap).idindex
+        if idindex is None:
+            raise DataSource.DataUnavailableError(
+                f"update: {kind} have no name column"
+            )
+        old = self.__row_digests.get(kind, {})
+        new = {}
+        changed = []
+        for row in rows:
+            key = row[idindex] if idindex < len(row) else None
+            if not key:
+                continue
+            new[key] = digest = self.__get_row_digest(row)
+            if old.get(key) != digest or key in force:
+                changed.append(row)
+        self.__row_digests[kind] = new
+        return changed, old.keys() - new.keys()
+
+    def __remove_player_from_draw(self, player):
+        draw = self.draws.get(player.draw.name)
+        if self.__add_players_to_draws and draw:
+            draw.remove_player(player)
+
+    def __update_players(self, colmap, changes):
+        colnames, rows = self.__get_sheet("Players")
+        kwargs = self.__get_players_kwargs(colmap) | dict(postprocess=None)
+        changed, removed = self.__diff_rows(
+            "players", colnames, rows, kwargs["colmap"]
+        )
+
+        for player in self.__iter_changed_records(
+            "players", colnames, changed, self.Player_class, **kwargs
+        ):
+            if old := self.players.get(player.name):
+                self.__remove_player_from_draw(old)
+                changes.updated_players.append((old, player))
+            else:
+                changes.added_players.append(player)
+            self.players[player.name] = player
+            if self.__add_players_to_draws and player.draw.name:
+                self.__add_player_to_draw(player)
+
+        # Only once the changed rows are mapped to records, it is known
+        # which records are no longer there
+        for name in self.__get_removed_keys("players", removed):
+            player = self.players.pop(name)
+            self.__remove_player_from_draw(player)
+            changes.removed_players.append(player)
+
+    def __remove_game_from_draw(self, game):
+        draw = self.draws.get(game.draw.name)
+        if self.__add_games_to_draws and draw:
+            draw.remove_game(game)
+
+    def __update_games(self, colmap, changes):
+        # Games hold on to the records of their players, so those of
+        # replaced players need replacing too, even if their rows did not
+        # change
+        force = set()
+        if self.__add_players_to_games:
+            stale = {id(p) for p, _ in changes.updated_players} | {
+                id(p) for p in changes.removed_players
+            }
+            force = {
+                g.name
+                for g in self.games.values()
+                if id(g.player1) in stale or id(g.player2) in stale
+            }
+
+        colnames, rows = self.__get_sheet("Games")
+        kwargs = self.__get_games_kwargs(colmap, None) | dict(
+            postprocess=None
+        )
+        changed, removed = self.__diff_rows(
+            "games", colnames, rows, colmap, force=force
+        )
+
+        for game in self.__iter_changed_records(
+            "games", colnames, changed, self.Game_class, **kwargs
+        ):
+            if old := self.games.get(game.name):
+                changes.updated_games.append((old, game))
+            else:
+                changes.added_games.append(game)
+            self.games[game.name] = game
+            if self.__add_games_to_draws:
+                if old:
+                    self.draws[game.draw.name].replace_game(old, game)
+                else:
+                    self.__add_game_to_draw(game)
+
+        for name in self.__get_removed_keys("games", removed):
+            game = self.games.pop(name)
+            self.__remove_game_from_draw(game)
+            changes.removed_games.append(game)
+
+    def update(self, *, players_colmap=None, games_colmap=None):
+        """Re-read players and games, and return what changed
+
+        The export is opened again, and rows of the Players and Games
+        sheets are compared to those read before. Records are only rebuilt
+        for rows that changed, and replace the previous ones, also in the
+        draws if players or games were added to those. Draws and the
+        tournament name are not re-read.
+
+        Returns a ChangeSet, e.g. to publish new results.
+        """
+        if not self.games:
+            raise DataSource.DataUnavailableError(
+                "update: Games have not been read"
+            )
+
+        if self.__book is not None:
+            self.__book.close()
+            self.__book = None
+
+        changes = TCExportReader.ChangeSet()
+        if self.players:
+            self.__update_players(players_colmap, changes)
+        self.__update_games(games_colmap, changes)
+        return changes
+
+    def __get_snapshot_context(self, colmaps):
+        # Everything other than the file itself that goes into the records:
+        # the options, the classes, and the reference dates for player ages
+        # and the game schedule
+        return dict(
+            classes=[
+                f"{k.__module__}.{k.__qualname__}"
+                for k in (
+                    self.__class__,
+                    self.Draw_class,
+                    self.Player_class,
+                    self.Game_class,
+                )
+            ],
+            options=[
+                self.__add_players_to_draws,
+                self.__add_games_to_draws,
+                self.__add_players_to_games,
+                self.__autoflip_scores,
+                self.__drawnamepat,
+            ],
+            colmaps=[sorted((c or {}).items()) for c in colmaps],
+            onday=date.today().isoformat(),
+            schedule=self.__schedule_parser.reference.isoformat(),
+            records=[
+                "tname",
+                "draws",
+                "players",
+                "games",
+                "row_digests",
+                "row_keys",
+            ],
+        )
+
+    def read_all(
+        self, *, draws_colmap=None, players_colmap=None, games_colmap=None
+    ):
+        if self.__snapshot is None:
+            return super().read_all(
+                draws_colmap=draws_colmap,
+                players_colmap=players_colmap,
+                games_colmap=games_colmap,
+            )
+
+        if self.draws or self.players or self.games:
+            raise DataSource.DataAlreadyReadError("Data already read")
+
+        snapshot = Snapshot(
+            self.__snapshot,
+            self.__filename,
+            context=self.__get_snapshot_context(
+                (draws_colmap, players_colmap, games_colmap)
+            ),
+        )
+        try:
+            records = snapshot.load()
+        except Snapshot.SnapshotError as e:
+            Warnings.add(str(e), context="Reading snapshot")
+            records = None
+
+        if records is not None:
+            tname, self.draws, self.players, self.games = records[:4]
+            self.__row_digests, self.__row_keys = records[4:6]
+            self.set_tournament_name(tname)
+            return
+
+        super().read_all(
+            draws_colmap=draws_colmap,
+            players_colmap=players_colmap,
+            games_colmap=games_colmap,
+        )
+        snapshot.save(
+            (
+                self.tname,
+                self.draws,
+                self.players,
+                self.games,
+                self.__row_digests,
+                self.__row_keys,
+            )
+        )
+
     def get_played_games(self):
         return [
             g
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2021–2022 martin f. krafft <tctools@pobox.madduck.net>
+# Released under the MIT Licence
+#
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+from .exceptions import BaseException
+
+
+class FileWatcher:
+    """Wait for a file to change, using inotify on Linux, or polling
+
+    The directory of the file is watched, rather than the file itself, so
+    that files replaced by renaming another file over them, or deleted and
+    created anew, are noticed. Where inotify is not available, the file is
+    stat()ed every `poll_interval` seconds instead.
+
+    wait() returns as soon as something happened to the file, which may
+    well be while it is still being written. It is up to the caller to wait
+    for the file to settle.
+    """
+
+    class InotifyUnavailableError(BaseException):
+        pass
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+
+    IN_MASK = (
+        IN_MODIFY
+        | IN_CLOSE_WRITE
+        | IN_MOVED_FROM
+        | IN_MOVED_TO
+        | IN_CREATE
+        | IN_DELETE
+    )
+
+    # struct inotify_event, followed by len bytes of name
+    EVENT = struct.Struct("iIII")
+
+    def __init__(self, filename, *, poll_interval=1.0, use_inotify=None):
+        self.__filename = os.path.abspath(filename)
+        self.__name = os.fsencode(os.path.basename(self.__filename))
+        self.__poll_interval = poll_interval
+        self.__fd = None
+        if use_inotify is not False:
+            try:
+                self.__fd = self.__init_inotify()
+            except FileWatcher.InotifyUnavailableError:
+                if use_inotify:
+                    raise
+        self.__stat = self.get_stat(self.__filename)
+
+    filename = property(lambda s: s.__filename)
+    uses_inotify = property(lambda s: s.__fd is not None)
+
+    def __repr__(self):
+        how = "inotify" if self.uses_inotify else "polling"
+        return f"<{self.__class__.__name__}({self.__filename}, {how})>"
+
+    @staticmethod
+    def get_stat(filename):
+        try:
+            stat = os.stat(filename)
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+    def __init_inotify(self):
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            inotify_init1 = libc.inotify_init1
+            inotify_add_watch = libc.inotify_add_watch
+        except (OSError, AttributeError) as e:
+            raise FileWatcher.InotifyUnavailableError(str(e)) from e
+
+        fd = inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            raise FileWatcher.InotifyUnavailableError(
+                os.strerror(ctypes.get_errno())
+            )
+        dirname = os.fsencode(os.path.dirname(self.__filename))
+        if inotify_add_watch(fd, dirname, self.IN_MASK) < 0:
+            errno = ctypes.get_errno()
+            os.close(fd)
+            raise FileWatcher.InotifyUnavailableError(
+                f"{dirname.decode()}: {os.strerror(errno)}"
+            )
+        return fd
+
+    def __is_about_file(self, data):
+        offset = 0
+        while offset + self.EVENT.size <= len(data):
+            _, _, _, length = self.EVENT.unpack_from(data, offset)
+            offset += self.EVENT.size
+            name = data[offset : offset + length].rstrip(b"\0")
+            offset += length
+            if name == self.__name:
+                return True
+        return False
+
+    def __wait_inotify(self, deadline):
+        while True:
+            timeout = None if deadline is None else deadline - time.monotonic()
+            if timeout is not None and timeout < 0:
+                return False
+            ready, _, _ = select.select([self.__fd], [], [], timeout)
+            if not ready:
+                return False
+            try:
+                data = os.read(self.__fd, 64 * 1024)
+            except BlockingIOError:
+                continue
+            if self.__is_about_file(data):
+                return True
+
+    def __wait_polling(self, deadline):
+        while True:
+            stat = self.get_stat(self.__filename)
+            if stat != self.__stat:
+                self.__stat = stat
+                return True
+            timeout = self.__poll_interval
+            if deadline is not None:
+                timeout = min(timeout, deadline - time.monotonic())
+                if timeout <= 0:
+                    return False
+            time.sleep(timeout)
+
+    def wait(self, timeout=None):
+        """Return True if the file changed, or False after `timeout`"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if self.__fd is not None:
+            return self.__wait_inotify(deadline)
+        return self.__wait_polling(deadline)
+
+    def close(self):
+        if self.__fd is not None:
+            os.close(self.__fd)
+            self.__fd = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -4,7 +4,6 @@
 # Released under the MIT Licence
 #
 
-import dateutil.parser
 from .datarecord import DataRecord
 
 
@@ -32,6 +31,8 @@ class Game(DataRecord):
 
 
 if __name__ == "__main__":
+    import dateutil.parser
+
     gd = dict(name="W0101", player1="Jane", player2="Kate")
     g1 = Game(**gd)
     print(vars(g1))
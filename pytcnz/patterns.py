@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2021–2022 martin f. krafft <tctools@pobox.madduck.net>
+# Released under the MIT Licence
+#
+
+import functools
+import re
+
+# Registry of compiled regular expressions that depend on parameters, such
+# as the pattern of draw names, which is the same for all records of an
+# import. Each pattern is compiled once and then shared by all callers.
+
+INITIALS_RE = re.compile(r"(\w\.\s)*")
+
+
+@functools.lru_cache(maxsize=64)
+def get_draw_re(drawnamepat):
+    return re.compile(rf"(?P<draw>{drawnamepat})")
+
+
+@functools.lru_cache(maxsize=64)
+def get_draw_seed_re(drawnamepat):
+    return re.compile(rf"(?P<draw>{drawnamepat})(?P<seed>\d+)")
+
+
+@functools.lru_cache(maxsize=64)
+def get_salutations_re(salutations):
+    # Longest first, so that e.g. "Mrs" is not matched as "Mr" plus "s"
+    salutations = sorted(salutations, key=lambda x: -len(x))
+    return re.compile(rf"^(?:(?:{'|'.join(salutations)})\.?\s*)*")
+
+
+def get_cache_info():
+    return dict(
+        draw=get_draw_re.cache_info(),
+        draw_seed=get_draw_seed_re.cache_info(),
+        salutations=get_salutations_re.cache_info(),
+    )
@@ -5,7 +5,10 @@
 #
 
 from .exceptions import BaseException
-import phonenumbers
+from .util import LazyImport
+import functools
+
+phonenumbers = LazyImport("phonenumbers")
 
 
 class PhoneNumber:
@@ -21,36 +24,50 @@ class PhoneNumber:
 
     def __init__(self, numberstr, region="NZ", mobileprefixes=("02",)):
         self.__raw = numberstr
-        self.__mobileprefixes = mobileprefixes
+        self.__mobileprefixes = tuple(mobileprefixes)
         numberstr = PhoneNumber.fixup(numberstr, region)
+        self.__number, self.__national = PhoneNumber.__parse(
+            numberstr, region
+        )
+        if self.__number is None:
+            raise PhoneNumber.InvalidPhoneNumber(numberstr)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
+    def __parse(numberstr, region):
+        # Invalid numbers are cached too, as (None, None)
         try:
-            self.__number = phonenumbers.parse(numberstr, region)
+            number = phonenumbers.parse(numberstr, region)
         except phonenumbers.phonenumberutil.NumberParseException:
-            raise PhoneNumber.InvalidPhoneNumber(numberstr)
+            return None, None
 
-        if not phonenumbers.is_valid_number_for_region(self.__number, region):
-            raise PhoneNumber.InvalidPhoneNumber(numberstr)
+        if not phonenumbers.is_valid_number_for_region(number, region):
+            return None, None
 
-    def __str__(self):
         trans = str.maketrans("", "", "-/ ")
-        return phonenumbers.format_number(
-            self.__number, phonenumbers.PhoneNumberFormat.NATIONAL
+        national = phonenumbers.format_number(
+            number, phonenumbers.PhoneNumberFormat.NATIONAL
         ).translate(trans)
+        return number, national
+
+    @classmethod
+    def get_cache_info(cls):
+        return cls.__parse.cache_info()
+
+    def __str__(self):
+        return self.__national
 
     def __repr__(self):
         return f"<{self.__class__.__name__}({self} from {self.__raw})>"
 
     def __eq__(self, other):
-        return str(self) == str(other)
+        return self.__national == str(other)
 
     def __hash__(self):
-        return str(self).__hash__()
+        return self.__national.__hash__()
 
     def is_mobile_number(self):
-        for pfx in self.__mobileprefixes:
-            if str(self).startswith(pfx):
-                return True
-        return False
+        return self.__national.startswith(self.__mobileprefixes)
 
 
 if __name__ == "__main__":
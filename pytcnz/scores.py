@@ -7,6 +7,7 @@
 from .exceptions import BaseException
 import re
 import enum
+import functools
 
 
 class Scores:
@@ -20,17 +21,41 @@ class Scores:
     class IncompleteError(BaseException):
         pass
 
-    @classmethod
-    def __parse_string(cls, string):
-        SET_DELIMS = r" ,"
-        GAME_DELIMS = r"-/:"  # '-' must be first
-        string = re.sub(rf"\s*([{GAME_DELIMS}])\s*", r"\1", string)
-        sets = [
-            s.strip(SET_DELIMS) for s in re.split(rf"[{SET_DELIMS}]+", string)
-        ]
+    SET_DELIMS = r" ,"
+    GAME_DELIMS = r"-/:"  # '-' must be first
+
+    __GAME_DELIMS_RE = re.compile(rf"\s*([{GAME_DELIMS}])\s*")
+    __SET_SPLIT_RE = re.compile(rf"[{SET_DELIMS}]+")
+    __GAME_SPLIT_RE = re.compile(rf"[{GAME_DELIMS}]+")
+
+    # The common case of a string consisting of nothing but scores can be
+    # parsed in one go, everything else takes the slow path. Strings with
+    # anything but digits, delimiters and whitespace, e.g. comments, cannot
+    # be scores only, which is quicker to find than trying to match them.
+    __SCORES_ONLY_RE = re.compile(
+        rf"(?:\d+\s*[{GAME_DELIMS}]+\s*\d+(?:[{SET_DELIMS}]+|$))+"
+    )
+    __NOT_SCORES_RE = re.compile(rf"[^{GAME_DELIMS}{SET_DELIMS}\d\s]")
+    __SCORE_PAIR_RE = re.compile(rf"(\d+)\s*[{GAME_DELIMS}]+\s*(\d+)")
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def __parse_string_cached(string):
+        if not Scores.__NOT_SCORES_RE.search(
+            string
+        ) and Scores.__SCORES_ONLY_RE.fullmatch(string):
+            return (
+                tuple(
+                    (int(a), int(b))
+                    for a, b in Scores.__SCORE_PAIR_RE.findall(string)
+                ),
+                "",
+            )
+
+        string = Scores.__GAME_DELIMS_RE.sub(r"\1", string)
         ret = []
         unp = []
-        for s in sets:
+        for s in Scores.__SET_SPLIT_RE.split(string):
             # as soon as we fail to parse scores, append the remainder to the
             # unparsed string, which we return as well as the scores
             if unp:
@@ -38,16 +63,21 @@ class Scores:
                 continue
             try:
                 ret.append(
-                    tuple(map(int, re.split(rf"[{GAME_DELIMS}]+", s, 1)))
+                    tuple(map(int, Scores.__GAME_SPLIT_RE.split(s, 1)))
                 )
             except ValueError:
                 unp.append(s)
 
         if ret:
-            return ret, SET_DELIMS[0].join(unp)
+            return tuple(ret), Scores.SET_DELIMS[0].join(unp)
         else:
             return None, string
 
+    @classmethod
+    def __parse_string(cls, string):
+        scores, remainder = cls.__parse_string_cached(string)
+        return list(scores) if scores else None, remainder
+
     @classmethod
     def from_string(cls, string, *, bestof=5, par=(11, 15)):
         scores, remainder = cls.__parse_string(string)
@@ -56,6 +86,24 @@ class Scores:
         else:
             return None, remainder
 
+    @classmethod
+    def parse_many(cls, strings, *, bestof=5, par=(11, 15)):
+        """Like from_string, for many strings, e.g. a column of comments"""
+        parse = cls.__parse_string_cached
+        ret = []
+        append = ret.append
+        for string in strings:
+            scores, remainder = parse(string)
+            if scores:
+                append((cls(list(scores), bestof=bestof, par=par), remainder))
+            else:
+                append((None, remainder))
+        return ret
+
+    @classmethod
+    def get_parse_cache_info(cls):
+        return cls.__parse_string_cached.cache_info()
+
     def __init__(self, sets=None, *, bestof=5, par=(11, 15)):
         try:
             bestof + 1
@@ -76,14 +124,40 @@ class Scores:
         self.__verify_scores()
 
     def __verify_scores(self):
-        min_games = [int(cnt / 2 + 1) for cnt in self.bestof]
-        max_games = self.bestof
+        key = (tuple(self._sets), self._bestof, self._par)
+        try:
+            hash(key)
+        except TypeError:
+            # e.g. lists instead of tuples, which we cannot cache
+            winner, games_score = Scores.__verify(*key)
+        else:
+            (winner, games_score), error = Scores.__verify_cached(key)
+            if error:
+                raise Scores.IncompleteError(error)
+
+        self._winner = winner
+        self._games_score = games_score
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def __verify_cached(key):
+        # Only the outcome is cached, so that each failure gets a new
+        # exception instance
+        try:
+            return Scores.__verify(*key), None
+        except Scores.IncompleteError as e:
+            return (None, None), str(e)
+
+    @staticmethod
+    def __verify(sets, bestof, par):
+        min_games = [int(cnt / 2 + 1) for cnt in bestof]
+        max_games = bestof
 
-        if len(self._sets) < min(min_games):
+        if len(sets) < min(min_games):
             raise Scores.IncompleteError(
                 f"At least {min(min_games)} sets must be played"
             )
-        elif len(self._sets) > max(max_games):
+        elif len(sets) > max(max_games):
             raise Scores.IncompleteError(
                 f"At most {max(max_games)} sets can be played"
             )
@@ -92,17 +166,17 @@ class Scores:
         maxpar = 0
 
         try:
-            for i, (a, b) in enumerate(self._sets, 1):
+            for i, (a, b) in enumerate(sets, 1):
                 if (
-                    (a - b > 2 and a not in self._par)
-                    or (a - b == 2 and a < min(self._par))
+                    (a - b > 2 and a not in par)
+                    or (a - b == 2 and a < min(par))
                     or (a - b == 1)
                     or (b - a == 1)
-                    or (b - a > 2 and b not in self._par)
-                    or (b - a == 2 and b < min(self._par))
+                    or (b - a > 2 and b not in par)
+                    or (b - a == 2 and b < min(par))
                 ):
                     raise Scores.IncompleteError(
-                        f"{a}-{b} did not reach any PAR in {self.par} in set {i}"
+                        f"{a}-{b} did not reach any PAR in {par} in set {i}"
                     )
 
                 cntA += 1 if a > b else 0
@@ -116,7 +190,7 @@ class Scores:
         except ValueError as e:
             if "not enough values to unpack" in str(e):
                 raise Scores.IncompleteError(
-                    f"Not a pair of scores for set {i}: {self._sets[i]}"
+                    f"Not a pair of scores for set {i}: {sets[i]}"
                 )
 
         if cntA == cntB:
@@ -124,14 +198,14 @@ class Scores:
 
         if cntA == 0 and cntB not in min_games:
             raise Scores.IncompleteError(
-                f"Cannot lose 0-{cntB} in best-of {self.bestof}"
+                f"Cannot lose 0-{cntB} in best-of {bestof}"
             )
         elif cntB == 0 and cntA not in min_games:
             raise Scores.IncompleteError(
-                f"Cannot win {cntA}-0 in best-of {self.bestof}"
+                f"Cannot win {cntA}-0 in best-of {bestof}"
             )
 
-        for i, (a, b) in enumerate(self._sets, 1):
+        for i, (a, b) in enumerate(sets, 1):
             if (a > b and a < maxpar) or (b > a and b < maxpar):
                 raise Scores.IncompleteError(
                     f"{a}-{b} did not reach PAR {maxpar} in set {i}"
@@ -140,8 +214,8 @@ class Scores:
             # (which is the rules), but right now, Scores does not have the
             # concept of defaults, and raises this error instead.
 
-        self._winner = Scores.Player.A if cntA > cntB else Scores.Player.B
-        self._games_score = (cntA, cntB)
+        winner = Scores.Player.A if cntA > cntB else Scores.Player.B
+        return winner, (cntA, cntB)
 
     winner = property(lambda s: s._winner)
     bestof = property(lambda s: s._bestof)
@@ -178,7 +252,10 @@ class Scores:
         return f"{s})>"
 
     def __eq__(self, other):
-        return self._sets == other._sets
+        try:
+            return self._sets == other._sets
+        except AttributeError:
+            return NotImplemented
 
     def __len__(self):
         return len(self._sets)
@@ -189,6 +266,158 @@ class Scores:
     def __getitem__(self, nset):
         return self._sets[nset]
 
+    def pack(self):
+        return PackedScores.from_scores(self)
+
+
+class PackedScores:
+    """Scores packed into a fixed-width record of bytes
+
+    The first byte holds the number of sets, followed by the scores of up
+    to five sets, one byte per score, with unplayed sets left as zero. The
+    bytes are read in place from the buffer passed in, which may be shared
+    by many records (see ScoresArray), so nothing is copied until records
+    are converted back to Scores.
+    """
+
+    MAX_SETS = 5
+    WIDTH = 1 + 2 * MAX_SETS
+
+    class PackingError(Scores.BaseException):
+        pass
+
+    __slots__ = ("_buf", "_offset")
+
+    def __init__(self, buf, offset=0):
+        if len(buf) < offset + PackedScores.WIDTH:
+            raise PackedScores.PackingError(
+                f"Need {PackedScores.WIDTH} bytes at offset {offset}"
+            )
+        self._buf = buf
+        self._offset = offset
+
+    @classmethod
+    def pack_sets(cls, sets):
+        sets = list(sets)
+        if len(sets) > cls.MAX_SETS:
+            raise PackedScores.PackingError(
+                f"Cannot pack more than {cls.MAX_SETS} sets"
+            )
+        try:
+            ret = bytearray((len(sets),))
+            for a, b in sets:
+                ret += bytes((a, b))
+        except (ValueError, TypeError) as e:
+            raise PackedScores.PackingError(f"Cannot pack {sets}: {e}")
+        return bytes(ret.ljust(cls.WIDTH, b"\0"))
+
+    @classmethod
+    def from_scores(cls, scores):
+        return cls(cls.pack_sets(scores))
+
+    def to_scores(self, *, bestof=5, par=(11, 15)):
+        return Scores(list(self), bestof=bestof, par=par)
+
+    def to_bytes(self):
+        return bytes(self._buf[self._offset : self._offset + self.WIDTH])
+
+    def __len__(self):
+        return self._buf[self._offset]
+
+    def __getitem__(self, nset):
+        nset = range(len(self))[nset]
+        i = self._offset + 1 + 2 * nset
+        return (self._buf[i], self._buf[i + 1])
+
+    def __iter__(self):
+        buf, i = self._buf, self._offset + 1
+        for n in range(len(self)):
+            yield (buf[i], buf[i + 1])
+            i += 2
+
+    def __count_games(self):
+        cntA, cntB = 0, 0
+        for a, b in self:
+            cntA += 1 if a > b else 0
+            cntB += 1 if b > a else 0
+        return cntA, cntB
+
+    def get_games_score(self):
+        return "-".join(map(str, self.__count_games()))
+
+    @property
+    def winner(self):
+        cntA, cntB = self.__count_games()
+        if cntA == cntB:
+            return None
+        return Scores.Player.A if cntA > cntB else Scores.Player.B
+
+    def get_scores(self):
+        if len(self):
+            return " ".join(f"{a}-{b}" for a, b in self)
+        else:
+            return None
+
+    def flip_scores(self):
+        buf = self._buf
+        if not isinstance(buf, bytearray):
+            buf = self._buf = bytearray(self.to_bytes())
+            self._offset = 0
+        for n in range(len(self)):
+            i = self._offset + 1 + 2 * n
+            buf[i], buf[i + 1] = buf[i + 1], buf[i]
+
+    def __str__(self):
+        return self.get_scores()
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}({self!s})>"
+
+    def __eq__(self, other):
+        try:
+            return self.to_bytes() == other.to_bytes()
+        except AttributeError:
+            pass
+        if isinstance(other, Scores):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.to_bytes())
+
+
+class ScoresArray:
+    """Many PackedScores records in a single buffer
+
+    Items are PackedScores views onto the buffer, so changes made through
+    them, e.g. flip_scores(), are made to the array.
+    """
+
+    def __init__(self, scores=()):
+        self.__buf = bytearray()
+        for s in scores:
+            self.append(s)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}({len(self)} entries)>"
+
+    def append(self, scores):
+        try:
+            self.__buf += scores.to_bytes()
+        except AttributeError:
+            self.__buf += PackedScores.pack_sets(scores)
+
+    def __len__(self):
+        return len(self.__buf) // PackedScores.WIDTH
+
+    def __getitem__(self, i):
+        i = range(len(self))[i]
+        return PackedScores(self.__buf, i * PackedScores.WIDTH)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield PackedScores(self.__buf, i * PackedScores.WIDTH)
+
 
 if __name__ == "__main__":
     print(repr(Scores.from_string("11-6 6-11 11-8 8-11 10-12")))
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2021–2022 martin f. krafft <tctools@pobox.madduck.net>
+# Released under the MIT Licence
+#
+
+import hashlib
+import json
+import os
+import pickle
+import struct
+import tempfile
+from .exceptions import BaseException
+
+
+class Snapshot:
+    """Binary snapshot of records parsed from a source file
+
+    A snapshot stores the records read from a file, such as a TC export,
+    together with what it takes to tell whether they are still valid: the
+    size, modification time and SHA-256 digest of the source file, and a
+    context, e.g. the reader options and the reference date for ages. The
+    records are pickled as a whole, so that links between them, like
+    players and games in draws, are restored as they were.
+
+    The file starts with a fixed-size preamble of magic, format version and
+    header length, followed by a JSON header, and the pickled records. The
+    header is checked before any records are loaded. If only the
+    modification time differs, the digest decides, so that touching or
+    copying an export does not invalidate its snapshot.
+
+    Snapshots are unpickled, so only load snapshots you wrote yourself.
+    """
+
+    MAGIC = b"PYTCNZ"
+    # Bump whenever pickled records change shape, e.g. gain attributes
+    VERSION = 4
+    PREAMBLE = struct.Struct(">6sHI")
+
+    class SnapshotError(BaseException):
+        pass
+
+    def __init__(self, filename, source, *, context=None):
+        self.__filename = filename
+        self.__source = source
+        # Round-trip the context through JSON, so that it compares equal
+        # to the context read from the header, e.g. tuples become lists
+        self.__context = json.loads(json.dumps(context or {}))
+        self.__stat = None
+        self.__digest = None
+
+    filename = property(lambda s: s.__filename)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}({self.__filename})>"
+
+    @classmethod
+    def get_digest(cls, filename):
+        digest = hashlib.sha256()
+        with open(filename, "rb") as f:
+            while chunk := f.read(1 << 20):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def __get_stat(filename):
+        stat = os.stat(filename)
+        return stat.st_size, stat.st_mtime_ns
+
+    def __get_source_stat(self):
+        # The source is looked at once, before its records are read, so
+        # that a snapshot is never saved for a file changed since
+        if self.__stat is None:
+            self.__stat = self.__get_stat(self.__source)
+        return self.__stat
+
+    def __get_source_digest(self):
+        if self.__digest is None:
+            self.__digest = self.get_digest(self.__source)
+        return self.__digest
+
+    def __read_header(self, f):
+        preamble = f.read(self.PREAMBLE.size)
+        if len(preamble) < self.PREAMBLE.size:
+            return None
+        magic, version, length = self.PREAMBLE.unpack(preamble)
+        if magic != self.MAGIC or version != self.VERSION:
+            return None
+        try:
+            return json.loads(f.read(length))
+        except ValueError:
+            return None
+
+    def __is_valid(self, header):
+        if header.get("context") != self.__context:
+            return False
+        size, mtime_ns = self.__get_source_stat()
+        if header.get("size") != size:
+            return False
+        elif header.get("mtime_ns") == mtime_ns:
+            return True
+        return header.get("sha256") == self.__get_source_digest()
+
+    def load(self):
+        """Return the records, or None if there is no valid snapshot"""
+        self.__get_source_stat()
+        try:
+            with open(self.__filename, "rb") as f:
+                header = self.__read_header(f)
+                if header is None or not self.__is_valid(header):
+                    return None
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except (
+            pickle.UnpicklingError,
+            EOFError,
+            AttributeError,
+            ImportError,
+            ValueError,
+        ) as e:
+            raise Snapshot.SnapshotError(
+                f"Cannot load snapshot {self.__filename}: {e}"
+            ) from e
+
+    def save(self, records):
+        """Save the records, unless the source changed while reading them
+
+        Returns whether the snapshot was written.
+        """
+        size, mtime_ns = self.__get_source_stat()
+        digest = self.__get_source_digest()
+        if self.__get_stat(self.__source) != (size, mtime_ns):
+            return False
+
+        header = json.dumps(
+            dict(
+                size=size,
+                mtime_ns=mtime_ns,
+                sha256=digest,
+                context=self.__context,
+            ),
+            sort_keys=True,
+        ).encode()
+
+        # Write to a temporary file first, so that readers never see a
+        # partly written snapshot
+        dirname = os.path.dirname(os.path.abspath(self.__filename))
+        fd, tmpname = tempfile.mkstemp(dir=dirname, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(
+                    self.PREAMBLE.pack(self.MAGIC, self.VERSION, len(header))
+                )
+                f.write(header)
+                pickle.dump(records, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmpname, self.__filename)
+        finally:
+            if os.path.exists(tmpname):
+                os.unlink(tmpname)
+        return True
+
+    def invalidate(self):
+        try:
+            os.unlink(self.__filename)
+        except FileNotFoundError:
+            pass
@@ -6,6 +6,7 @@
 
 from ..exceptions import BaseException
 from ..gender import Gender, InvalidGenderError
+import bisect
 import enum
 
 
@@ -19,6 +20,13 @@ class GradingEnum(enum.IntEnum):
         )
 
 
+def _make_lookup(table):
+    # Grades with their thresholds in ascending order, for use with bisect,
+    # leaving out Ungraded, which needs special treatment
+    grades = sorted(g for g in table if g != table.Ungraded)
+    return table, tuple(int(g) for g in grades), tuple(grades)
+
+
 class SquashNZGrading:
     class Points_Men(GradingEnum):
         A1 = 4000
@@ -69,6 +77,15 @@ class SquashNZGrading:
     class InvalidGradingError(BaseException):
         pass
 
+    __LOOKUP = {
+        (Gender.M, False): _make_lookup(Points_Men),
+        (Gender.M, True): _make_lookup(Points_Junior_Men),
+        (Gender.W, False): _make_lookup(Points_Women),
+        (Gender.W, True): _make_lookup(Points_Junior_Women),
+        (Gender.N, False): _make_lookup(Points_Ungendered),
+        (Gender.N, True): _make_lookup(Points_Ungendered),
+    }
+
     @classmethod
     def points_to_grade(cls, points, gender, junior=False):
         if points is None or points < 0:
@@ -76,46 +93,87 @@ class SquashNZGrading:
                 "Points have to be positive"
             )
         try:
-            table = {
-                Gender.M: (cls.Points_Men, cls.Points_Junior_Men),
-                Gender.W: (cls.Points_Women, cls.Points_Junior_Women),
-                Gender.N: (cls.Points_Ungendered, cls.Points_Ungendered),
-            }[gender][1 if junior else 0]
+            table, thresholds, grades = cls.__LOOKUP[gender, bool(junior)]
         except KeyError:
             raise InvalidGenderError(
                 f"Not a valid gender for grading: {gender.name}"
             )
 
-        for th in list(table):
-            if th != table.Ungraded and points >= th:
-                return th
+        idx = bisect.bisect_right(thresholds, points)
+        if idx:
+            return grades[idx - 1]
 
-            elif th == table.Ungraded:
-                if gender == Gender.N:
-                    # Ungraded can have points when there is no gender
-                    return th
+        elif gender == Gender.N:
+            # Ungraded can have points when there is no gender
+            return table.Ungraded
 
-                elif points == th:
-                    # Ungraded gendered players must be 0…
-                    return th
+        elif points == table.Ungraded:
+            # Ungraded gendered players must be 0…
+            return table.Ungraded
 
-                elif points > 0 and not junior:
-                    # A junior turning senior gets F grade even if below F
-                    # grade points
-                    return table.F
+        elif points > 0 and not junior:
+            # A junior turning senior gets F grade even if below F
+            # grade points
+            return table.F
 
         raise SquashNZGrading.InvalidGradingError(
             f"No grade for {points} points"
         )
 
-    def __init__(self, points, gender, junior=False):
-        self._points = points
-        self._gender = Gender.from_string(gender)
-        self._junior = junior
-        self._grade = SquashNZGrading.points_to_grade(
-            points, self._gender, junior
+    @classmethod
+    def points_to_grades(cls, points, genders, juniors=None):
+        if juniors is None:
+            juniors = (False,) * len(points)
+        ret = []
+        for p, g, j in zip(points, genders, juniors):
+            lookup = cls.__LOOKUP.get((g, bool(j)))
+            if lookup and p is not None:
+                idx = bisect.bisect_right(lookup[1], p)
+                if idx:
+                    ret.append(lookup[2][idx - 1])
+                    continue
+            # Leave errors and the special cases below the lowest threshold
+            # to points_to_grade
+            ret.append(cls.points_to_grade(p, g, j))
+        return ret
+
+    __slots__ = ("_points", "_gender", "_junior", "_grade", "_hash")
+
+    # Gradings are immutable, so there is no need for more than one
+    # instance per points, gender, and junior status
+    __instances = {}
+
+    def __new__(cls, points, gender, junior=False):
+        gender = Gender.from_string(gender)
+        junior = bool(junior)
+        key = (cls, points, gender, junior)
+        try:
+            return cls.__instances[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # unhashable points, let points_to_grade() deal with it
+            key = None
+
+        grade = SquashNZGrading.points_to_grade(points, gender, junior)
+        self = super().__new__(cls)
+        object.__setattr__(self, "_points", points)
+        object.__setattr__(self, "_gender", gender)
+        object.__setattr__(self, "_junior", junior)
+        object.__setattr__(self, "_grade", grade)
+        object.__setattr__(self, "_hash", hash((points, gender, junior)))
+        if key:
+            cls.__instances[key] = self
+        return self
+
+    def __setattr__(self, attr, value):
+        raise AttributeError(
+            f"{self.__class__.__name__} is immutable, cannot set {attr}"
         )
 
+    def __reduce__(self):
+        return (self.__class__, (self._points, self._gender, self._junior))
+
     points = property(lambda s: s._points)
     grade = property(lambda s: s._grade.name)
     gender = property(lambda s: s._gender)
@@ -128,28 +186,53 @@ class SquashNZGrading:
         )
 
     def __hash__(self):
-        return hash(repr(self))
+        return self._hash
 
     def __str__(self):
         return self.grade
 
     def __eq__(self, other):
-        return (
-            self.points == other.points
-            and self.gender == other.gender
-            and self.junior == other.junior
-        )
+        if self is other:
+            return True
+        try:
+            return (
+                self._points == other._points
+                and self._gender == other._gender
+                and self._junior == other._junior
+            )
+        except AttributeError:
+            return NotImplemented
 
     def __lt__(self, other):
-        return self.points.__lt__(other.points)
+        try:
+            return self._points < other._points
+        except AttributeError:
+            return NotImplemented
+
+    def __le__(self, other):
+        try:
+            return self._points <= other._points
+        except AttributeError:
+            return NotImplemented
+
+    def __gt__(self, other):
+        try:
+            return self._points > other._points
+        except AttributeError:
+            return NotImplemented
+
+    def __ge__(self, other):
+        try:
+            return self._points >= other._points
+        except AttributeError:
+            return NotImplemented
 
     def __int__(self):
-        return self.points
+        return self._points
 
 
 if __name__ == "__main__":
     grading = SquashNZGrading(2870, "M")
-    print(vars(grading))
     print(repr(grading))
     try:
         import ipdb
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2021–2022 martin f. krafft <tctools@pobox.madduck.net>
+# Released under the MIT Licence
+#
+
+import json
+import sqlite3
+import threading
+import time
+from ..exceptions import BaseException
+
+
+class GradingListCache:
+    """SQLite-backed store of grading list API responses
+
+    Responses are stored as JSON, keyed by their kind ("init", "search")
+    and the query parameters, along with the time they were fetched. The
+    grading list only changes after grading runs, so responses can be
+    reused for a while; get() takes the maximum age acceptable to the
+    caller.
+
+    Use ":memory:" as filename for a cache that does not persist.
+    """
+
+    class CacheError(BaseException):
+        pass
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY,
+            fetched REAL NOT NULL,
+            data TEXT NOT NULL
+        )
+    """
+
+    def __init__(self, filename, *, clock=time.time):
+        try:
+            self.__db = sqlite3.connect(filename, check_same_thread=False)
+            self.__db.execute(self.SCHEMA)
+            self.__db.commit()
+        except sqlite3.Error as e:
+            raise GradingListCache.CacheError(
+                f"Cannot open cache {filename}: {e}"
+            ) from e
+        self.__lock = threading.Lock()
+        self.__clock = clock
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(kind, params=None):
+        return f"{kind}:{json.dumps(params or {}, sort_keys=True)}"
+
+    def get(self, kind, params=None, *, max_age=None):
+        key = self.make_key(kind, params)
+        with self.__lock:
+            row = self.__db.execute(
+                "SELECT fetched, data FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or (
+                max_age is not None and self.__clock() - row[0] > max_age
+            ):
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(row[1])
+
+    def get_age(self, kind, params=None):
+        with self.__lock:
+            row = self.__db.execute(
+                "SELECT fetched FROM responses WHERE key = ?",
+                (self.make_key(kind, params),),
+            ).fetchone()
+        return None if row is None else self.__clock() - row[0]
+
+    def put(self, kind, params, data):
+        with self.__lock:
+            self.__db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                (
+                    self.make_key(kind, params),
+                    self.__clock(),
+                    json.dumps(data),
+                ),
+            )
+            self.__db.commit()
+
+    def invalidate(self, kind=None):
+        with self.__lock:
+            if kind is None:
+                self.__db.execute("DELETE FROM responses")
+            else:
+                self.__db.execute(
+                    "DELETE FROM responses WHERE key LIKE ?", (f"{kind}:%",)
+                )
+            self.__db.commit()
+
+    def __len__(self):
+        with self.__lock:
+            return self.__db.execute(
+                "SELECT COUNT(*) FROM responses"
+            ).fetchone()[0]
+
+    def close(self):
+        self.__db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -6,12 +6,16 @@
 
 from ..datasource import DataSource
 from .player import Player
-import requests
+from ..util import LazyImport
+from ..crawler import Crawler, RequestMetrics
+from ..warnings import Warnings
 from urllib.parse import urljoin
 import argparse
-import time
+import contextlib
 import re
 
+requests = LazyImport("requests")
+
 
 class GradingListReader(DataSource):
 
@@ -20,10 +24,117 @@ class GradingListReader(DataSource):
     class RequestError(BaseException):
         pass
 
-    def __init__(self, *, Player_class=None):
+    # Failures worth retrying: connection problems, HTTP errors and
+    # responses that are not valid JSON
+    RETRY_ON = (IOError, ValueError)
+
+    # The API returns no more than this many players per query
+    RESULT_LIMIT = 500
+
+    class QueryPlan:
+        """Record of the queries made to read the grading list"""
+
+        def __init__(self):
+            self.steps = []
+
+        def add(self, path, query, count, *, cached, capped, split):
+            self.steps.append(
+                dict(
+                    path=path,
+                    query=query,
+                    count=count,
+                    cached=cached,
+                    capped=capped,
+                    split=split,
+                )
+            )
+
+        requests = property(
+            lambda s: sum(1 for step in s.steps if not step["cached"])
+        )
+        cached = property(
+            lambda s: sum(1 for step in s.steps if step["cached"])
+        )
 
-        req = requests.get(urljoin(GradingListReader.BASE_URL, "init"))
-        self.__config = req.json().get("config")
+        def __len__(self):
+            return len(self.steps)
+
+        def __iter__(self):
+            return iter(sorted(self.steps, key=lambda step: step["path"]))
+
+        def __repr__(self):
+            return (
+                f"<{self.__class__.__name__}({len(self)} queries, "
+                f"{self.requests} requests)>"
+            )
+
+        def get_string(self, *, indent="  "):
+            lines = []
+            for step in self:
+                q = step["query"]
+                desc = (
+                    f"{q['district'] or 'All'}/{q['club'] or 'All'} "
+                    f"grade={q['grade']} age={q['age']}"
+                )
+                if q["name"]:
+                    desc = f"{desc} name={q['name']}"
+                notes = [f"{step['count']} players"]
+                if step["cached"]:
+                    notes.append("cached")
+                if step["split"]:
+                    notes.append("split")
+                elif step["capped"]:
+                    notes.append("INCOMPLETE")
+                indentation = indent * (len(step["path"]) - 1)
+                lines.append(f"{indentation}{desc}: {', '.join(notes)}")
+            lines.append(
+                f"{len(self)} queries, {self.requests} requests, "
+                f"{self.cached} from cache"
+            )
+            return "\n".join(lines)
+
+        def __str__(self):
+            return self.get_string()
+
+    def __init__(
+        self,
+        *,
+        Player_class=None,
+        session=None,
+        pool_size=8,
+        timeout=30,
+        base_url=None,
+        cache=None,
+        ttl=24 * 3600,
+        config_ttl=7 * 24 * 3600,
+        offline=False,
+    ):
+        self.__session = session or GradingListReader.make_session(
+            pool_size=pool_size
+        )
+        self.__timeout = timeout
+        self.__base_url = base_url or GradingListReader.BASE_URL
+        self.metrics = RequestMetrics()
+        self.plan = None
+        self.__cache = cache
+        self.__ttl = ttl
+        self.__offline = offline
+        if offline and cache is None:
+            raise GradingListReader.RequestError(
+                "Working offline requires a cache"
+            )
+
+        config = self.__get_cached("init", None, max_age=config_ttl)
+        if config is None:
+            with self.metrics.measure():
+                req = self.__session.get(
+                    urljoin(self.__base_url, "init"), timeout=timeout
+                )
+                req.raise_for_status()
+            config = req.json()
+            if cache is not None and config.get("config"):
+                cache.put("init", None, config)
+        self.__config = config.get("config")
         if not self.__config:
             raise GradingListReader.RequestError(
                 "Failed to read basic grading list data"
@@ -53,6 +164,35 @@ class GradingListReader(DataSource):
 
         super().__init__(Player_class=Player_class or Player)
 
+    session = property(lambda s: s.__session)
+    cache = property(lambda s: s.__cache)
+
+    def __get_cached(self, kind, params, *, max_age):
+        if self.__cache is None:
+            return None
+        # Offline, anything in the cache beats nothing at all
+        ret = self.__cache.get(
+            kind, params, max_age=None if self.__offline else max_age
+        )
+        if ret is None and self.__offline:
+            raise GradingListReader.RequestError(
+                f"Not in cache, and working offline: {kind} {params or ''}"
+            )
+        return ret
+
+    @classmethod
+    def make_session(cls, *, pool_size=8):
+        # One session keeps connections alive across all queries; size the
+        # pool so that concurrent crawls do not have to open extra ones
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=1, pool_maxsize=pool_size
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["Accept-Encoding"] = "gzip, deflate"
+        return session
+
     @classmethod
     def search_grading_list(
         cls,
@@ -63,6 +203,10 @@ class GradingListReader(DataSource):
         club="All",
         age="Any",
         grade="Any",
+        session=None,
+        timeout=None,
+        base_url=None,
+        metrics=None,
     ):
         name = name or ""
 
@@ -98,7 +242,7 @@ class GradingListReader(DataSource):
         elif len(grade) == 1:
             grade = grade.upper()  # noqa:E701
 
-        url = urljoin(GradingListReader.BASE_URL, "search")
+        url = urljoin(base_url or GradingListReader.BASE_URL, "search")
         sdict = dict(
             name=name,
             gender=gender,
@@ -107,7 +251,9 @@ class GradingListReader(DataSource):
             age=age,
             grade=grade,
         )
-        req = requests.post(url, json=sdict)
+        with metrics.measure() if metrics else contextlib.nullcontext():
+            req = (session or requests).post(url, json=sdict, timeout=timeout)
+            req.raise_for_status()
         return req.json()
 
     def __get_code(self, dict, term):
@@ -120,36 +266,81 @@ class GradingListReader(DataSource):
             if re.search(term, v, re.IGNORECASE):
                 return k
 
-    def __iterate_grades_ages(
+    def __make_queries(
         self,
         *,
         name=None,
-        district=None,
-        club=None,
+        districts=None,
+        clubs=None,
         ages=None,
         grades=None,
-        sleep=0,
-        first=True,
     ):
-        male, female = [], []
-        for grade in grades or ["Any"]:
-            for age in ages or ["Any"]:
-                if first:
-                    first = False
-                else:
-                    time.sleep(sleep)
-
-                ret = GradingListReader.search_grading_list(
-                    name=name,
-                    district=district,
-                    club=club,
-                    age=age,
-                    grade=grade,
+        districts = [
+            self.__get_code(self.districts, i) for i in districts or []
+        ]
+        clubs = [self.__get_code(self.clubs, i) for i in clubs or []]
+        if clubs:
+            locations = [
+                (club[:2], club)
+                for club in self.clubs
+                if club in clubs and (not districts or club[:2] in districts)
+            ]
+        elif districts:
+            locations = [(d, None) for d in self.districts if d in districts]
+        else:
+            locations = [(None, None)]
+
+        return [
+            dict(name=name, district=district, club=club, age=age, grade=grade)
+            for district, club in locations
+            for grade in grades or ["Any"]
+            for age in ages or ["Any"]
+        ]
+
+    def __split_query(self, query):
+        # iSquash limits results to 500, so queries hitting the limit are
+        # split into queries by district, then club, then grade, then age
+        if not query["district"]:
+            return [query | dict(district=d) for d in self.districts]
+        elif not query["club"]:
+            return [
+                query | dict(club=c)
+                for c in self.clubs
+                if c[:2] == query["district"]
+            ]
+        elif query["grade"] == "Any":
+            return [query | dict(grade=g) for g in self.grades]
+        elif query["age"] == "Any":
+            return [query | dict(age=a) for a in self.ages]
+        else:
+            return []
+
+    def __fetch(self, crawler, queries, *, refresh=False):
+        # Only query what is not in the cache, or has gone stale there,
+        # unless a refresh of everything was requested
+        results = [None] * len(queries)
+        stale = []
+        for i, query in enumerate(queries):
+            if not refresh:
+                results[i] = self.__get_cached(
+                    "search", query, max_age=self.__ttl
                 )
-                female.extend(ret["gradedPlayers1"])
-                male.extend(ret["gradedPlayers2"])
+            if results[i] is None:
+                stale.append(i)
 
-        return female, male
+        try:
+            fetched = crawler.map(queries[i] for i in stale)
+        except Crawler.FetchError as e:
+            raise GradingListReader.RequestError(
+                f"Failed to search grading list: {e}"
+            ) from e
+
+        for i, ret in zip(stale, fetched):
+            results[i] = ret
+            if self.__cache is not None:
+                self.__cache.put("search", queries[i], ret)
+
+        return results, set(stale)
 
     def __get_isquash_records(
         self,
@@ -160,47 +351,80 @@ class GradingListReader(DataSource):
         ages=None,
         grades=None,
         sleep=0,
+        concurrency=1,
+        rate=None,
+        retries=3,
+        refresh=False,
     ):
-        if name and not clubs and not districts:
-            return self.__iterate_grades_ages(
-                name=name,
-                ages=ages,
-                grades=grades,
-                sleep=sleep,
-            )
-
-        else:
-            districts = [
-                self.__get_code(self.districts, i) for i in districts or []
-            ]
-            clubs = [self.__get_code(self.clubs, i) for i in clubs or []]
-            # iSquash limits results to 500, so we iterate by clubs
-            first = True
-            male, female = [], []
-            for club in self.clubs:
-                district = club[:2]
-                if False and district == "WN":
-                    import ipdb
+        crawler = Crawler(
+            lambda q: GradingListReader.search_grading_list(
+                **q,
+                session=self.__session,
+                timeout=self.__timeout,
+                base_url=self.__base_url,
+                metrics=self.metrics,
+            ),
+            concurrency=concurrency,
+            rate=rate or (1 / sleep if sleep else None),
+            retries=retries,
+            retry_on=GradingListReader.RETRY_ON,
+        )
 
-                    ipdb.set_trace()  # noqa:E402,E702
-                if (clubs and (club not in clubs)) or (
-                    districts and (district not in districts)
-                ):
+        # Start with the coarsest queries possible, and only subdivide
+        # those that hit the result limit, one level at a time. Each query
+        # is identified by its path down the tree of subdivisions.
+        plan = GradingListReader.QueryPlan()
+        queries = self.__make_queries(
+            name=name,
+            districts=districts,
+            clubs=clubs,
+            ages=ages,
+            grades=grades,
+        )
+        batch = [((i,), q) for i, q in enumerate(queries)]
+        results = []
+        while batch:
+            fetched, stale = self.__fetch(
+                crawler, [q for _, q in batch], refresh=refresh
+            )
+            next_batch = []
+            for i, ((path, query), ret) in enumerate(zip(batch, fetched)):
+                count = len(ret["gradedPlayers1"]) + len(ret["gradedPlayers2"])
+                capped = count >= GradingListReader.RESULT_LIMIT
+                children = self.__split_query(query) if capped else []
+                plan.add(
+                    path,
+                    query,
+                    count,
+                    cached=i not in stale,
+                    capped=capped,
+                    split=bool(children),
+                )
+                if children:
+                    next_batch.extend(
+                        (path + (j,), c) for j, c in enumerate(children)
+                    )
                     continue
 
-                ret = self.__iterate_grades_ages(
-                    name=name,
-                    district=district,
-                    club=club,
-                    ages=ages,
-                    grades=grades,
-                    sleep=sleep,
-                    first=first,
-                )
-                female.extend(ret[0])
-                male.extend(ret[1])
+                elif capped:
+                    Warnings.add(
+                        f"Query hit the limit of {count} results, "
+                        "some players may be missing",
+                        context="Searching the grading list",
+                        query=query,
+                    )
+                results.append((path, ret))
+            batch = next_batch
+        self.plan = plan
+
+        # Merging results in order of their paths yields the same lists,
+        # no matter how the requests were scheduled
+        male, female = [], []
+        for path, ret in sorted(results, key=lambda r: r[0]):
+            female.extend(ret["gradedPlayers1"])
+            male.extend(ret["gradedPlayers2"])
 
-            return female, male
+        return female, male
 
     def __get_all_player_dicts(
         self,
@@ -213,6 +437,10 @@ class GradingListReader(DataSource):
         points_min=None,
         points_max=None,
         sleep=0,
+        concurrency=1,
+        rate=None,
+        retries=3,
+        refresh=False,
     ):
         female, male = self.__get_isquash_records(
             name=name,
@@ -221,6 +449,10 @@ class GradingListReader(DataSource):
             ages=ages,
             grades=grades,
             sleep=sleep,
+            concurrency=concurrency,
+            rate=rate,
+            retries=retries,
+            refresh=refresh,
         )
 
         for gender, players in (("f", female), ("m", male)):
@@ -248,6 +480,10 @@ class GradingListReader(DataSource):
         points_max=None,
         colmap=None,
         sleep=0,
+        concurrency=4,
+        rate=None,
+        retries=3,
+        refresh=False,
         resolve_duplicate_cb=None,
     ):
 
@@ -273,6 +509,10 @@ class GradingListReader(DataSource):
             points_min=points_min,
             points_max=points_max,
             sleep=sleep,
+            concurrency=concurrency,
+            rate=rate,
+            retries=retries,
+            refresh=refresh,
         ):
             records.append([player[col] for col in colnames])
         records.sort(key=lambda r: r[5], reverse=True)
@@ -308,6 +548,7 @@ def make_argument_parser(
     age_choices=None,
     grade_choices=None,
     sleep_default=0,
+    concurrency_default=4,
     add_help=False,
     **kwargs,
 ):
@@ -374,7 +615,44 @@ def make_argument_parser(
         "-s",
         type=int,
         default=sleep_default,
-        help="Time to wait between API requests",
+        help="Time to wait between API requests (same as --rate 1/SLEEP)",
+    )
+    argparser.add_argument(
+        "--concurrency",
+        "-j",
+        type=int,
+        default=concurrency_default,
+        help="Number of API requests to have in flight at the same time",
+    )
+    argparser.add_argument(
+        "--rate",
+        type=float,
+        help="Maximum number of API requests per second",
+    )
+    cacheg = argparser.add_argument_group(
+        title="Caching",
+        description="Keep grading list responses in a local cache file",
+    )
+    cacheg.add_argument(
+        "--cache",
+        metavar="FILE",
+        help="SQLite file to cache grading list responses in",
+    )
+    cacheg.add_argument(
+        "--ttl",
+        type=float,
+        default=24,
+        help="Hours after which cached search results are queried again",
+    )
+    cacheg.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Query everything again, disregarding the cache",
+    )
+    cacheg.add_argument(
+        "--offline",
+        action="store_true",
+        help="Only use cached data, no matter how old",
     )
 
     return argparser
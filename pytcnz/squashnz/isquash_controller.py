@@ -8,25 +8,28 @@
 from ..exceptions import BaseException
 from ..gender import Gender
 from ..warnings import Warnings
-from ..util import get_timestamp
+from ..util import get_timestamp, LazyImport
 from ..scores import Scores
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions
-from selenium.webdriver.support.select import Select
-from selenium.webdriver.support.wait import WebDriverWait
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from urllib.parse import urljoin
 import enum
-import bs4
 import sys
 import re
 import bdb
 import argparse
-import requests
 import configparser
 import os.path
 
+webdriver = LazyImport("selenium.webdriver")
+By = LazyImport("selenium.webdriver.common.by", "By")
+expected_conditions = LazyImport(
+    "selenium.webdriver.support.expected_conditions"
+)
+Select = LazyImport("selenium.webdriver.support.select", "Select")
+WebDriverWait = LazyImport("selenium.webdriver.support.wait", "WebDriverWait")
+selenium_exceptions = LazyImport("selenium.common.exceptions")
+bs4 = LazyImport("bs4")
+requests = LazyImport("requests")
+
 DRAW_TYPES = {
     "8": "Draw8",
     "16": "Draw16",
@@ -317,7 +320,7 @@ class iSquashController:
                 if player_cb:
                     player_cb(player)
 
-        except NoSuchElementException:
+        except selenium_exceptions.NoSuchElementException:
             pass
 
     def go_fill_registrations(self, players, *, update=False, player_cb=None):
@@ -423,7 +426,7 @@ class iSquashController:
                 if pat.search(isqname):
                     choice.click()
                     break
-        except TimeoutException:
+        except selenium_exceptions.TimeoutException:
             msg = (
                 "iSquash does not know a player with code "
                 f"{player.squash_code}"
@@ -579,7 +582,7 @@ class iSquashController:
                 if draw_cb:
                     draw_cb(draw)
 
-        except NoSuchElementException:
+        except selenium_exceptions.NoSuchElementException:
             pass
 
     def go_add_draw(self, draw, drawtype, *, drawdesc=None):
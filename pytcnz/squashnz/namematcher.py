@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2021–2022 martin f. krafft <tctools@pobox.madduck.net>
+# Released under the MIT Licence
+#
+
+import math
+from .playerindex import PlayerIndex
+
+
+class NameMatcher:
+    """Approximate matching of player names using a trigram index
+
+    Names are normalised like PlayerIndex does, and broken into the
+    trigrams of each of their words, padded with spaces, so that the order
+    of first and last names does not matter. Two names are scored by the
+    Dice coefficient of their trigram sets, which is 1.0 for names that
+    are the same after normalisation.
+
+    Candidates are generated from an inverted index of trigrams, looking
+    only at the rarest trigrams of a name, as many as are needed for any
+    name sharing none of them to score less than `min_score`. Only those
+    candidates are then scored, so matching does not degrade to comparing
+    each name against every other.
+    """
+
+    def __init__(self, players=(), *, min_score=0.6, key=None):
+        self.__min_score = min_score
+        self.__key = key or (lambda p: p.name)
+        self.__entries = []
+        self.__exact = {}
+        self.__postings = {}
+        self.update(players)
+
+    min_score = property(lambda s: s.__min_score)
+
+    @classmethod
+    def get_trigrams(cls, normalised):
+        trigrams = set()
+        for word in normalised.split():
+            word = f" {word} "
+            trigrams.update(word[i : i + 3] for i in range(len(word) - 2))
+        return trigrams
+
+    @classmethod
+    def get_score(cls, name_a, name_b):
+        a = cls.get_trigrams(PlayerIndex.normalise_name(name_a))
+        b = cls.get_trigrams(PlayerIndex.normalise_name(name_b))
+        if not a or not b:
+            return 0.0
+        return 2 * len(a & b) / (len(a) + len(b))
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}({len(self)} names)>"
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def add(self, player):
+        normalised = PlayerIndex.normalise_name(self.__key(player))
+        trigrams = self.get_trigrams(normalised)
+        i = len(self.__entries)
+        self.__entries.append((player, trigrams))
+        self.__exact.setdefault(normalised, []).append(i)
+        for trigram in trigrams:
+            self.__postings.setdefault(trigram, []).append(i)
+
+    def update(self, players):
+        try:
+            players = players.values()
+        except AttributeError:
+            pass
+        for player in players:
+            self.add(player)
+
+    def match(self, name, *, limit=1, min_score=None, gender=None):
+        """Return up to `limit` (player, score) tuples, best first"""
+        min_score = self.__min_score if min_score is None else min_score
+        normalised = PlayerIndex.normalise_name(name)
+        trigrams = self.get_trigrams(normalised)
+        if not trigrams:
+            return []
+
+        # A candidate sharing o of the n trigrams scores at most
+        # 2o / (n + o), so it needs o >= n * s / (2 - s) to reach s
+        n = len(trigrams)
+        need = max(1, math.ceil(n * min_score / (2 - min_score) - 1e-9))
+        rarest = sorted(
+            trigrams, key=lambda t: len(self.__postings.get(t, ()))
+        )[: n - need + 1]
+
+        candidates = set(self.__exact.get(normalised, ()))
+        for trigram in rarest:
+            candidates.update(self.__postings.get(trigram, ()))
+
+        scored = []
+        for i in candidates:
+            player, other = self.__entries[i]
+            if gender is not None and (
+                getattr(player, "gender", gender) != gender
+            ):
+                continue
+            score = 2 * len(trigrams & other) / (n + len(other))
+            if score >= min_score:
+                scored.append((score, -i, player))
+
+        scored.sort(reverse=True)
+        return [(player, score) for score, _, player in scored[:limit]]
+
+    def match_one(self, name, **kwargs):
+        found = self.match(name, limit=1, **kwargs)
+        return found[0] if found else (None, 0.0)
+
+
+def match_players(source_a, source_b, *, min_score=0.6, match_gender=True):
+    """Find the best match in source_b for each player in source_a
+
+    Sources can be DataSource instances, dicts of players, or any iterable
+    of players. Returns a dict mapping names of players in source_a to
+    (player, score) tuples, for those players with a match scoring at
+    least `min_score`. Scores range from 0 to 1, with 1 meaning the names
+    are the same after normalisation.
+    """
+
+    def get_players(source):
+        players = getattr(source, "players", source)
+        try:
+            return players.values()
+        except AttributeError:
+            return players
+
+    matcher = NameMatcher(get_players(source_b), min_score=min_score)
+    matches = {}
+    for player in get_players(source_a):
+        gender = getattr(player, "gender", None) if match_gender else None
+        match, score = matcher.match_one(player.name, gender=gender)
+        if match is not None:
+            matches[player.name] = (match, score)
+    return matches
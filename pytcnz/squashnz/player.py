@@ -5,13 +5,14 @@
 #
 
 import enum
-import re
 from datetime import date
-import dateutil.parser
 from ..warnings import Warnings
 from ..playerbase import PlayerBase
 from ..phonenumber import PhoneNumber
 from ..exceptions import InvalidDataError
+from ..datarecord import DataRecord
+from ..dates import DateParser
+from .. import patterns
 from .grading import SquashNZGrading
 
 
@@ -42,6 +43,11 @@ class Player(PlayerBase):
         def __bool__(self):
             return self.name == "V"
 
+    # Shared by all players, so that the date format is detected once,
+    # and recurring dates are parsed only once, see DateParser
+    DOB_PARSER = DateParser(dayfirst=True)
+    EXPIRY_PARSER = DateParser(dayfirst=True)
+
     def __init__(
         self,
         *,
@@ -67,7 +73,7 @@ class Player(PlayerBase):
             try:
                 dob.strftime("")
             except AttributeError:
-                dob = dateutil.parser.parse(dob, dayfirst=True)
+                dob = Player.DOB_PARSER.parse(dob)
 
             age = Player.get_age_for_dob(dob, onday=onday)
             age_group = Player.get_age_group_for_age(age)
@@ -83,12 +89,12 @@ class Player(PlayerBase):
             try:
                 vaccination_expiry.strftime("")
             except AttributeError:
-                vaccination_expiry = dateutil.parser.parse(
-                    vaccination_expiry, dayfirst=True
+                vaccination_expiry = Player.EXPIRY_PARSER.parse(
+                    vaccination_expiry
                 )
 
             vaxxed = Player.get_vaccinated_status(
-                vaccinated, vaccination_expiry
+                vaccinated, vaccination_expiry, onday=onday
             )
         else:
             vaxxed = Player.VaccinationStatus.N
@@ -120,6 +126,25 @@ class Player(PlayerBase):
 
         super().__init__(name=name, gender=gender, **data)
 
+        # Records are read-only, so their fingerprint can be computed once
+        fingerprint = Player.get_fingerprint_for_data(self.data)
+        object.__setattr__(self, "_fingerprint", fingerprint)
+        object.__setattr__(
+            self,
+            "_fingerprint_hash",
+            Player.get_hash_for_fingerprint(fingerprint),
+        )
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        # hash() of strings differs between processes, so the hash pickled
+        # with the fingerprint, e.g. in a Snapshot, cannot be used
+        object.__setattr__(
+            self,
+            "_fingerprint_hash",
+            Player.get_hash_for_fingerprint(self._fingerprint),
+        )
+
     def __repr__(self):
         return (
             f"<{self.__class__.__name__}({self.name} ({self.age_group}"
@@ -127,12 +152,64 @@ class Player(PlayerBase):
             f"{self.grade} @ {self.points:,d} pts)>"
         )
 
+    @classmethod
+    def get_fingerprint_for_data(cls, data):
+        """Return the items of the data as a tuple, ignoring the ID
+
+        Values compare as they do in the data, except that records, such as
+        the draw, are represented by their name, so that the fingerprint
+        stays the same when a Placeholder is set to the record it stands
+        for. Phone numbers are represented by the national number, which is
+        what they compare by.
+        """
+
+        def get_value(value):
+            if isinstance(value, DataRecord):
+                return value.get("name")
+            elif isinstance(value, PhoneNumber):
+                return str(value)
+            return value
+
+        return tuple(
+            sorted((k, get_value(v)) for k, v in data.items() if k != "id")
+        )
+
+    @classmethod
+    def get_hash_for_fingerprint(cls, fingerprint):
+        try:
+            return hash(fingerprint)
+        except TypeError:
+            # Leave out unhashable values, they still count for equality
+            hashable = []
+            for item in fingerprint:
+                try:
+                    hash(item)
+                    hashable.append(item)
+                except TypeError:
+                    hashable.append(item[0])
+            return hash(tuple(hashable))
+
+    def get_fingerprint(self):
+        return self._fingerprint
+
     def __eq__(self, other):
-        if not other:
-            return False
-        d1 = self.data | dict(id=None)
-        d2 = other.data | dict(id=None)
-        return d1 == d2
+        if self is other:
+            return True
+        try:
+            return (
+                self._fingerprint_hash == other._fingerprint_hash
+                and self._fingerprint == other._fingerprint
+            )
+        except AttributeError:
+            # Not a player, or a Placeholder not yet set
+            if not other:
+                return False
+            return self._fingerprint == Player.get_fingerprint_for_data(
+                other.data
+            )
+
+    def __hash__(self):
+        return self._fingerprint_hash
 
     @classmethod
     def get_age_for_dob(cls, dob, *, onday=None):
@@ -149,6 +226,20 @@ class Player(PlayerBase):
         finally:
             return age
 
+    @classmethod
+    def get_ages_for_dobs(cls, dobs, *, onday=None):
+        onday = onday or date.today()
+        today = (onday.month, onday.day)
+        ages = []
+        for dob in dobs:
+            try:
+                ages.append(
+                    onday.year - dob.year - (today < (dob.month, dob.day))
+                )
+            except AttributeError:
+                ages.append(None)
+        return ages
+
     def get_age(self, *, onday=None):
         return Player.get_age_for_dob(self.dob, onday=onday)
 
@@ -160,6 +251,18 @@ class Player(PlayerBase):
             if age >= th:
                 return th
 
+    @classmethod
+    def get_age_groups_for_ages(cls, ages):
+        groups = {}
+        ret = []
+        for age in ages:
+            try:
+                ret.append(groups[age])
+            except KeyError:
+                groups[age] = cls.get_age_group_for_age(age)
+                ret.append(groups[age])
+        return ret
+
     def get_age_group(self, *, onday=None):
         age = self.get_age(onday=onday)
         return Player.get_age_group_for_age(age)
@@ -188,12 +291,10 @@ class Player(PlayerBase):
 
     @classmethod
     def get_name_cleaned(cls, name, *, ignore_salutations=None):
-        ignore_salutations = sorted(
-            ignore_salutations or cls.SALUTATIONS, key=lambda x: -len(x)
+        pat = patterns.get_salutations_re(
+            tuple(ignore_salutations or cls.SALUTATIONS)
         )
-        pat = rf"^(?:(?:{'|'.join(ignore_salutations)})\.?\s*)*"
-        name = re.sub(pat, "", name)
-        return re.sub(r"(\w\.\s)*", "", name)
+        return patterns.INITIALS_RE.sub("", pat.sub("", name))
 
     @classmethod
     def get_first_name(cls, name, *, ignore_salutations=None):
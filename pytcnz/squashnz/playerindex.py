@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2021–2022 martin f. krafft <tctools@pobox.madduck.net>
+# Released under the MIT Licence
+#
+
+import bisect
+from ..exceptions import BaseException
+from .player import Player
+
+
+class PlayerIndex:
+    """Hash indexes over players, for lookups other than by exact name
+
+    Players can be looked up by name, by normalised name (salutations and
+    initials removed, case and whitespace folded), squash_code, id and
+    club. A sorted index on points answers range queries. The indexes are
+    kept up to date as players are added or removed.
+
+    Players from different sources can be in the same index, so that e.g.
+    registrations can be joined with grading list entries by squash code.
+    """
+
+    KEYS = ("name", "normalised_name", "squash_code", "id", "club")
+
+    class BaseException(BaseException):
+        pass
+
+    class UnknownKeyError(BaseException):
+        pass
+
+    class AmbiguousKeyError(BaseException):
+        pass
+
+    def __init__(self, players=()):
+        self.__indexes = {key: {} for key in self.KEYS}
+        self.__points = []
+        self.__points_players = []
+        self.__players = {}
+        self.update(players)
+
+    @classmethod
+    def from_source(cls, source):
+        return cls(source.players.values())
+
+    @classmethod
+    def normalise_name(cls, name):
+        return " ".join(Player.get_name_cleaned(name).casefold().split())
+
+    @classmethod
+    def __get_keys(cls, player):
+        return dict(
+            name=player.name,
+            normalised_name=cls.normalise_name(player.name),
+            squash_code=player.get("squash_code"),
+            id=player.get("id"),
+            club=player.get("club"),
+        )
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}({len(self)} players)>"
+
+    def __len__(self):
+        return len(self.__players)
+
+    def __iter__(self):
+        return iter(self.__players.values())
+
+    def __contains__(self, player):
+        return id(player) in self.__players
+
+    def add(self, player):
+        if player in self:
+            return
+
+        self.__players[id(player)] = player
+        for key, value in self.__get_keys(player).items():
+            if value is not None and value != "":
+                self.__indexes[key].setdefault(value, []).append(player)
+
+        points = player.get("points")
+        if points is not None:
+            i = bisect.bisect_right(self.__points, points)
+            self.__points.insert(i, points)
+            self.__points_players.insert(i, player)
+
+    def update(self, players):
+        try:
+            players = players.values()
+        except AttributeError:
+            pass
+        for player in players:
+            self.add(player)
+
+    def remove(self, player):
+        if self.__players.pop(id(player), None) is None:
+            return
+
+        for key, value in self.__get_keys(player).items():
+            entries = self.__indexes[key].get(value)
+            if entries is None:
+                continue
+            entries[:] = [p for p in entries if p is not player]
+            if not entries:
+                del self.__indexes[key][value]
+
+        points = player.get("points")
+        if points is not None:
+            lo = bisect.bisect_left(self.__points, points)
+            hi = bisect.bisect_right(self.__points, points)
+            for i in range(lo, hi):
+                if self.__points_players[i] is player:
+                    del self.__points[i]
+                    del self.__points_players[i]
+                    break
+
+    def find(self, key, value):
+        try:
+            index = self.__indexes[key]
+        except KeyError:
+            raise PlayerIndex.UnknownKeyError(
+                f"{key} is not one of {', '.join(self.KEYS)}"
+            )
+        if key == "normalised_name":
+            value = self.normalise_name(value)
+        return list(index.get(value, ()))
+
+    def get(self, key, value, default=None):
+        found = self.find(key, value)
+        if not found:
+            return default
+        elif len(found) > 1:
+            raise PlayerIndex.AmbiguousKeyError(
+                f"{len(found)} players with {key} {value}: "
+                f"{', '.join(p.name for p in found)}"
+            )
+        return found[0]
+
+    def get_by_name(self, name, default=None):
+        return self.get("name", name, default)
+
+    def get_by_normalised_name(self, name, default=None):
+        return self.get("normalised_name", name, default)
+
+    def get_by_squash_code(self, squash_code, default=None):
+        return self.get("squash_code", squash_code, default)
+
+    def get_by_id(self, id, default=None):
+        return self.get("id", id, default)
+
+    def find_by_club(self, club):
+        return self.find("club", club)
+
+    def find_by_points(self, points_min=None, points_max=None):
+        lo = (
+            0
+            if points_min is None
+            else bisect.bisect_left(self.__points, points_min)
+        )
+        hi = (
+            len(self.__points)
+            if points_max is None
+            else bisect.bisect_right(self.__points, points_max)
+        )
+        return self.__points_players[lo:hi]
+
+    def get_keys(self, key):
+        if key not in self.__indexes:
+            raise PlayerIndex.UnknownKeyError(
+                f"{key} is not one of {', '.join(self.KEYS)}"
+            )
+        return self.__indexes[key].keys()
@@ -0,0 +1,298 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2021–2022 martin f. krafft <tctools@pobox.madduck.net>
+# Released under the MIT Licence
+#
+
+import sys
+from array import array
+from collections import Counter
+from datetime import date
+from itertools import compress
+from ..datasource import DataSource
+from ..gender import Gender
+from .grading import SquashNZGrading
+from .player import Player
+
+
+class PlayerTable:
+    """Column-oriented store of player data
+
+    Players are kept as one array per column rather than as a dict of Player
+    objects, so that filtering, sorting and aggregating over tens of
+    thousands of players does not touch Python objects one by one. Player
+    records are only constructed when a row is actually accessed.
+
+    Operations like filter() or sort() return views onto the same store.
+    """
+
+    GENDERS = tuple(Gender)
+    NUMERIC_COLUMNS = ("points", "gender", "age_group", "grade", "seed")
+    STRING_COLUMNS = ("name", "club", "squash_code")
+
+    class UnknownColumnError(DataSource.DataUnavailableError):
+        pass
+
+    class _Store:
+        def __init__(self, Player_class, kwargs):
+            self.Player_class = Player_class
+            self.kwargs = kwargs
+            self.points = array("l")
+            self.gender = array("b")
+            self.age_group = array("b")
+            self.grade = array("b")
+            self.seed = array("l")
+            self.name = []
+            self.club = []
+            self.squash_code = []
+            self.grades = []
+            self.rows = []
+            self.players = []
+
+        def intern_grade(self, grade):
+            try:
+                return self.grades.index(grade)
+            except ValueError:
+                self.grades.append(grade)
+                return len(self.grades) - 1
+
+        def append(
+            self,
+            row,
+            player,
+            *,
+            points,
+            gender,
+            age_group,
+            grade,
+            seed,
+            name,
+            club,
+            squash_code,
+        ):
+            self.points.append(points)
+            self.gender.append(PlayerTable.GENDERS.index(gender))
+            self.age_group.append(age_group)
+            self.grade.append(self.intern_grade(grade))
+            self.seed.append(seed or 0)
+            self.name.append(sys.intern(name or ""))
+            self.club.append(sys.intern(club or ""))
+            self.squash_code.append(sys.intern(squash_code or ""))
+            self.rows.append(row)
+            self.players.append(player)
+
+        def materialise(self, i):
+            player = self.players[i]
+            if player is None:
+                player = self.Player_class(**self.rows[i] | self.kwargs)
+                self.players[i] = player
+                self.rows[i] = None
+            return player
+
+    def __init__(self, store, index=None):
+        self.__store = store
+        if index is None:
+            index = array("l", range(len(store.points)))
+        self.__index = index
+
+    @classmethod
+    def from_rows(
+        cls,
+        colnames,
+        rows,
+        *,
+        Player_class=Player,
+        colmap=None,
+        idcol="name",
+        preprocess=None,
+        resolve_duplicate_cb=None,
+        **kwargs,
+    ):
+        data = {}
+        DataSource.read_rows_into(
+            data,
+            colnames,
+            rows,
+            dict,
+            colmap=colmap,
+            idcol=idcol,
+            preprocess=preprocess,
+            resolve_duplicate_cb=resolve_duplicate_cb,
+        )
+        # Dates of birth are parsed, and ages computed, for the whole column
+        # at once, against the same day
+        rows = list(data.values())
+        dobs = Player.DOB_PARSER.parse_many(row.get("dob") for row in rows)
+        onday = kwargs.get("onday") or date.today()
+        age_groups = Player.get_age_groups_for_ages(
+            Player.get_ages_for_dobs(dobs, onday=onday)
+        )
+
+        store = PlayerTable._Store(Player_class, kwargs)
+        for row, age_group in zip(rows, age_groups):
+            store.append(
+                row, None, **cls.__extract_row(row, Player_class, age_group)
+            )
+        return cls(store)
+
+    @classmethod
+    def from_players(cls, players):
+        try:
+            players = players.values()
+        except AttributeError:
+            pass
+        store = PlayerTable._Store(None, {})
+        for p in players:
+            store.append(
+                None,
+                p,
+                points=p.points,
+                gender=p.gender,
+                age_group=p.age_group,
+                grade=p.grade,
+                seed=p.get("seed"),
+                name=p.name,
+                club=p.get("club"),
+                squash_code=p.get("squash_code"),
+            )
+        return cls(store)
+
+    @classmethod
+    def __extract_row(cls, row, Player_class, age_group):
+        name = Player_class.get_name_cleaned(row["name"])
+        gender = Gender.from_string(row.get("gender"))
+        points = int(row.get("points") or 0)
+
+        grade = row.get("grade")
+        if grade and grade.startswith("J"):
+            age_group = Player.AgeGroup.Junior
+
+        grade = SquashNZGrading.points_to_grade(
+            points, gender, age_group == Player.AgeGroup.Junior
+        ).name
+
+        return dict(
+            points=points,
+            gender=gender,
+            age_group=age_group,
+            grade=grade,
+            seed=row.get("seed"),
+            name=name,
+            club=row.get("club"),
+            squash_code=row.get("squash_code"),
+        )
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}({len(self)} players)>"
+
+    def __len__(self):
+        return len(self.__index)
+
+    def __getitem__(self, i):
+        return self.__store.materialise(self.__index[i])
+
+    def __iter__(self):
+        for i in self.__index:
+            yield self.__store.materialise(i)
+
+    def __get_raw_column(self, column):
+        if column not in self.NUMERIC_COLUMNS + self.STRING_COLUMNS:
+            raise PlayerTable.UnknownColumnError(
+                f"{column} is not one of "
+                f"{', '.join(self.NUMERIC_COLUMNS + self.STRING_COLUMNS)}"
+            )
+        return getattr(self.__store, column)
+
+    def __decoder(self, column):
+        if column == "gender":
+            return self.GENDERS.__getitem__
+        elif column == "age_group":
+            return Player.AgeGroup
+        elif column == "grade":
+            return self.__store.grades.__getitem__
+        elif column == "seed":
+            return lambda s: s or None
+        else:
+            return None
+
+    def get_column(self, column):
+        raw = self.__get_raw_column(column)
+        values = [raw[i] for i in self.__index]
+        decoder = self.__decoder(column)
+        return list(map(decoder, values)) if decoder else values
+
+    def where(self, mask):
+        return PlayerTable(
+            self.__store, array("l", compress(self.__index, mask))
+        )
+
+    def filter(
+        self,
+        *,
+        genders=None,
+        age_groups=None,
+        grades=None,
+        clubs=None,
+        points_min=None,
+        points_max=None,
+    ):
+        store = self.__store
+        index = self.__index
+
+        if genders is not None:
+            codes = {
+                self.GENDERS.index(Gender.from_string(g)) for g in genders
+            }
+            index = [i for i in index if store.gender[i] in codes]
+
+        if age_groups is not None:
+            codes = {int(a) for a in age_groups}
+            index = [i for i in index if store.age_group[i] in codes]
+
+        if grades is not None:
+            codes = {
+                store.grades.index(g) for g in grades if g in store.grades
+            }
+            index = [i for i in index if store.grade[i] in codes]
+
+        if clubs is not None:
+            clubs = set(clubs)
+            index = [i for i in index if store.club[i] in clubs]
+
+        if points_min is not None:
+            index = [i for i in index if store.points[i] >= points_min]
+
+        if points_max is not None:
+            index = [i for i in index if store.points[i] <= points_max]
+
+        return PlayerTable(store, array("l", index))
+
+    def sort(self, column="points", *, reverse=False):
+        raw = self.__get_raw_column(column)
+        if column == "grade":
+            # Grade codes are interned in order of appearance, which is
+            # meaningless for sorting, but points order grades just fine
+            raw = self.__store.points
+        index = sorted(self.__index, key=raw.__getitem__, reverse=reverse)
+        return PlayerTable(self.__store, array("l", index))
+
+    def group_by(self, column):
+        raw = self.__get_raw_column(column)
+        groups = {}
+        for i in self.__index:
+            groups.setdefault(raw[i], array("l")).append(i)
+        decoder = self.__decoder(column) or (lambda v: v)
+        return {
+            decoder(k): PlayerTable(self.__store, v) for k, v in groups.items()
+        }
+
+    def count_by(self, column):
+        raw = self.__get_raw_column(column)
+        counts = Counter(raw[i] for i in self.__index)
+        decoder = self.__decoder(column) or (lambda v: v)
+        return {decoder(k): v for k, v in counts.items()}
+
+    def get_points_histogram(self, binsize=100):
+        points = self.__store.points
+        counts = Counter(points[i] // binsize * binsize for i in self.__index)
+        return dict(sorted(counts.items()))
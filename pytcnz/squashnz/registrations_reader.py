@@ -4,9 +4,12 @@
 # Released under the MIT Licence
 #
 
-import pyexcel
+from datetime import date
 from ..datasource import DataSource
 from .player import Player
+from ..util import LazyImport
+
+pyexcel = LazyImport("pyexcel")
 
 
 class RegistrationsReader(DataSource):
@@ -29,6 +32,8 @@ class RegistrationsReader(DataSource):
 
         rows = self.__book["Registrations"]
         rows.name_columns_by_row(0)
+        # One reference day for the ages of all players
+        kwargs.setdefault("onday", date.today())
         super().read_players(
             rows.colnames,
             rows,
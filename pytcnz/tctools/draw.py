@@ -20,6 +20,10 @@ class Draw(BaseDraw):
 
     def __init__(self, name, *, gendered=None, **kwargs):
         self.players = []
+        # Indexes, so that neither duplicate checks nor lookups have to
+        # scan the list, comparing records one by one
+        self._players_by_id = {}
+        self._players_by_name = {}
 
         if name[0] == "M":
             desc = "Men's"  # noqa:E701
@@ -45,25 +49,58 @@ class Draw(BaseDraw):
 
         super().__init__(name=name, description=desc, gendered=gendered)
 
+    def __has_player(self, player):
+        # Players compare equal by their data, including the name, so only
+        # those with the same name need comparing
+        return any(
+            p == player for p in self._players_by_name.get(player.name, ())
+        )
+
+    def __unindex_player(self, player):
+        if self._players_by_id.get(player.id) is player:
+            del self._players_by_id[player.id]
+        players = self._players_by_name.get(player.name, [])
+        players[:] = [p for p in players if p is not player]
+        if not players:
+            self._players_by_name.pop(player.name, None)
+
     def add_player(self, player):
         if not player.id.startswith(self.name):
             raise Draw.InvalidPlayerError(
                 f"Player {player} does not belong into draw {self.name}"
             )
 
-        if player in self.players:
+        if self.__has_player(player):
             raise Draw.DuplicatePlayerError(
                 f"Player {player} already added to draw {self.name}"
             )
 
         for i in range(max(0, player.seed - len(self.players))):
             self.players.append(None)
+        if replaced := self.players[player.seed - 1]:
+            self.__unindex_player(replaced)
         player.draw.set(self)
         self.players[player.seed - 1] = player
+        self._players_by_id[player.id] = player
+        self._players_by_name.setdefault(player.name, []).append(player)
+
+    def remove_player(self, player):
+        seed = player.seed
+        if 0 < seed <= len(self.players) and self.players[seed - 1] is player:
+            self.players[seed - 1] = None
+            self.__unindex_player(player)
 
     def get_players(self):
         return self.players
 
+    def get_player_by_seed(self, seed):
+        if 0 < seed <= len(self.players):
+            return self.players[seed - 1]
+        return None
+
+    def get_player_by_id(self, id):
+        return self._players_by_id.get(id)
+
 
 if __name__ == "__main__":
     from ..gender import Gender
@@ -4,11 +4,14 @@
 # Released under the MIT Licence
 #
 
-import pyexcel
+from datetime import date
 from ..datasource import DataSource
 from ..gender import Gender
 from .player import Player
 from .draw import Draw
+from ..util import LazyImport
+
+pyexcel = LazyImport("pyexcel")
 
 
 class ReaderBase(DataSource):
@@ -90,17 +93,14 @@ class ReaderBase(DataSource):
         colnames = DataSource.sanitise_colnames(sheet.colnames)
         colnames.append("gender")
 
-        def preprocess(data):
-            for field in self.remove_fields:
-                if field in data:
-                    del data[field]
-            self.preprocess_player_data(data)
-
+        # One reference day for the ages of all players
+        kwargs.setdefault("onday", date.today())
         super().read_players(
             colnames,
             combined,
             colmap=colmap,
-            preprocess=preprocess,
+            drop_fields=self.remove_fields,
+            preprocess=self.preprocess_player_data,
             postprocess=postprocess,
             resolve_duplicate_cb=resolve_duplicate_cb,
             **kwargs,
@@ -6,8 +6,51 @@
 
 import sys
 import os.path
+import importlib
 from datetime import datetime
-from pytz import timezone as tz
+
+
+class LazyImport:
+    """Stand-in for a module, or an attribute thereof, imported on first use
+
+    Some of the dependencies (pyexcel, selenium, phonenumbers, …) take
+    longer to import than most callers spend using them, so modules bind
+    them with e.g.
+
+        pyexcel = LazyImport("pyexcel")
+        By = LazyImport("selenium.webdriver.common.by", "By")
+
+    and the actual import happens on the first attribute access or call.
+    """
+
+    def __init__(self, modname, attr=None):
+        self.__modname = modname
+        self.__attr = attr
+        self.__obj = None
+
+    def __resolve(self):
+        if self.__obj is None:
+            obj = importlib.import_module(self.__modname)
+            if self.__attr:
+                obj = getattr(obj, self.__attr)
+            self.__obj = obj
+        return self.__obj
+
+    def __getattr__(self, attr):
+        return getattr(self.__resolve(), attr)
+
+    def __call__(self, *args, **kwargs):
+        return self.__resolve()(*args, **kwargs)
+
+    def __repr__(self):
+        name = self.__modname
+        if self.__attr:
+            name = f"{name}.{self.__attr}"
+        state = "loaded" if self.__obj is not None else "not loaded"
+        return f"<{self.__class__.__name__}({name}, {state})>"
+
+
+tz = LazyImport("pytz", "timezone")
 
 
 def get_timestamp(*, timezone="Pacific/Auckland", fmt="%F %T %Z", moment=None):
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2021–2022 martin f. krafft <tctools@pobox.madduck.net>
+# Released under the MIT Licence
+#
+
+from .exceptions import BaseException
+from .util import LazyImport
+
+pyexcel = LazyImport("pyexcel")
+xlrd = LazyImport("xlrd")
+XLSheet = LazyImport("pyexcel_xls.xlsr", "XLSheet")
+
+
+class LazyWorkbook:
+    """Spreadsheet of which only the sheets actually used are parsed
+
+    pyexcel.get_book() parses all sheets of a workbook up front, even if
+    only one of them is needed. For .xls files, the workbook is instead
+    opened once with xlrd's on_demand mode, and sheets are parsed only when
+    first asked for, with their cells converted the same way pyexcel does.
+    Other formats are read with pyexcel, one sheet at a time.
+
+    Rows can be streamed from a sheet, with trailing empty cells dropped,
+    and rows padded to the width of the header row, like pyexcel does.
+    """
+
+    class SheetNotFoundError(BaseException):
+        pass
+
+    def __init__(self, filename):
+        self.__filename = filename
+        self.__book = None
+        if str(filename).lower().endswith(".xls"):
+            # formatting_info is needed to skip hidden rows and columns,
+            # which pyexcel does by default for .xls files
+            self.__book = xlrd.open_workbook(
+                filename, on_demand=True, formatting_info=True
+            )
+
+    filename = property(lambda s: s.__filename)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}({self.__filename})>"
+
+    def get_sheet_names(self):
+        if self.__book is not None:
+            return self.__book.sheet_names()
+        return pyexcel.get_book(file_name=self.__filename).sheet_names()
+
+    def is_loaded(self, name):
+        if self.__book is None:
+            return False
+        try:
+            return self.__book.sheet_loaded(name)
+        except xlrd.XLRDError:
+            return False
+
+    def __iter_xls_rows(self, name):
+        try:
+            native = self.__book.sheet_by_name(name)
+        except xlrd.XLRDError as e:
+            raise LazyWorkbook.SheetNotFoundError(
+                f"{self.__filename}: {e}"
+            ) from e
+        sheet = XLSheet(
+            native,
+            date_mode=self.__book.datemode,
+            skip_hidden_row_and_column=True,
+        )
+        for row in sheet.row_iterator():
+            yield list(sheet.column_iterator(row))
+
+    def __iter_pyexcel_rows(self, name):
+        try:
+            yield from pyexcel.iget_array(
+                file_name=self.__filename, sheet_name=name
+            )
+        except (KeyError, ValueError) as e:
+            raise LazyWorkbook.SheetNotFoundError(
+                f"{self.__filename}: No sheet named {name}"
+            ) from e
+        finally:
+            pyexcel.free_resources()
+
+    def iter_rows(self, name):
+        """Yield the rows of a sheet as lists, without parsing others"""
+        if self.__book is not None:
+            rows = self.__iter_xls_rows(name)
+        else:
+            rows = self.__iter_pyexcel_rows(name)
+
+        width = None
+        for row in rows:
+            while row and row[-1] == "":
+                row.pop()
+            if width is None:
+                width = len(row)
+            elif len(row) < width:
+                row.extend([""] * (width - len(row)))
+            yield row
+
+    def get_table(self, name):
+        """Return the header of a sheet, and an iterator over its rows"""
+        rows = self.iter_rows(name)
+        header = next(rows, None)
+        if header is None:
+            return [], iter(())
+        return header, rows
+
+    def unload(self, name):
+        if self.__book is not None and self.is_loaded(name):
+            self.__book.unload_sheet(name)
+
+    def close(self):
+        if self.__book is not None:
+            self.__book.release_resources()
+            self.__book = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2021–2022 martin f. krafft <tctools@pobox.madduck.net>
+# Released under the MIT Licence
+#
+
+import pytest
+import random
+import threading
+import time
+
+from pytcnz.crawler import TokenBucket, Crawler, RequestMetrics
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, secs):
+        self.slept.append(secs)
+        self.now += secs
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_tokenbucket_invalid_rate():
+    with pytest.raises(TokenBucket.InvalidRateError):
+        TokenBucket(0)
+
+
+def test_tokenbucket_invalid_burst():
+    with pytest.raises(TokenBucket.InvalidRateError):
+        TokenBucket(1, 0)
+
+
+def test_tokenbucket_burst_then_rate(clock):
+    bucket = TokenBucket(2, 3, clock=clock, sleep=clock.sleep)
+    waits = [bucket.acquire() for i in range(5)]
+    assert waits == [0, 0, 0, 0.5, 0.5]
+    assert clock.now == 1.0
+
+
+def test_tokenbucket_refills(clock):
+    bucket = TokenBucket(1, 2, clock=clock, sleep=clock.sleep)
+    bucket.acquire()
+    bucket.acquire()
+    clock.now += 10
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == 1
+
+
+def test_crawler_preserves_order():
+    def fetch(q):
+        time.sleep(random.random() / 1000)
+        return q * 2
+
+    crawler = Crawler(fetch, concurrency=8)
+    assert crawler.map(range(50)) == [q * 2 for q in range(50)]
+
+
+def test_crawler_limits_concurrency():
+    lock = threading.Lock()
+    active = [0, 0]
+
+    def fetch(q):
+        with lock:
+            active[0] += 1
+            active[1] = max(active)
+        time.sleep(0.001)
+        with lock:
+            active[0] -= 1
+        return q
+
+    Crawler(fetch, concurrency=3).map(range(30))
+    assert 1 <= active[1] <= 3
+
+
+def test_crawler_retries(clock):
+    attempts = []
+
+    def fetch(q):
+        attempts.append(q)
+        if len(attempts) < 3:
+            raise IOError("flaky")
+        return q
+
+    crawler = Crawler(fetch, concurrency=1, backoff=1, sleep=clock.sleep)
+    assert crawler.map(["q"]) == ["q"]
+    assert attempts == ["q"] * 3
+    assert clock.slept == [1, 2]
+
+
+def test_crawler_gives_up(clock):
+    def fetch(q):
+        raise IOError("down")
+
+    crawler = Crawler(fetch, retries=2, sleep=clock.sleep)
+    with pytest.raises(Crawler.FetchError) as exc:
+        crawler.map(["q"])
+    assert exc.value.query == "q"
+    assert len(clock.slept) == 2
+
+
+def test_crawler_does_not_retry_other_errors():
+    attempts = []
+
+    def fetch(q):
+        attempts.append(q)
+        raise KeyError(q)
+
+    crawler = Crawler(fetch, retry_on=(IOError,))
+    with pytest.raises(KeyError):
+        crawler.map(["q"])
+    assert len(attempts) == 1
+
+
+def test_requestmetrics():
+    metrics = RequestMetrics()
+    metrics.record(0.1)
+    metrics.record(0.3, failed=True)
+    assert metrics.count == 2
+    assert metrics.failures == 1
+    assert metrics.mean_latency == pytest.approx(0.2)
+    assert metrics.max_latency == 0.3
+    metrics.reset()
+    assert metrics.count == 0
+    assert metrics.mean_latency == 0
+
+
+def test_requestmetrics_measure():
+    metrics = RequestMetrics()
+    with metrics.measure():
+        pass
+    with pytest.raises(IOError):
+        with metrics.measure():
+            raise IOError
+    assert metrics.count == 2
+    assert metrics.failures == 1
@@ -3,9 +3,15 @@
 # Copyright © 2021–2022 martin f. krafft <tctools@pobox.madduck.net>
 # Released under the MIT Licence
 #
+import pickle
 import pytest
 
-from pytcnz.datarecord import DataRecord, Placeholder
+from pytcnz.datarecord import (
+    DataRecord,
+    Placeholder,
+    CompactRecord,
+    make_compact,
+)
 
 
 def test_init():
@@ -104,3 +110,121 @@ def test_placeholder_morph():
     p = Placeholder(name="foo")
     p.set(rec)
     assert p == rec
+
+
+class CompactRecordSample(CompactRecord):
+    fields = ("one", "two", "three")
+
+
+@pytest.fixture
+def compact_record():
+    return CompactRecordSample(one=1, two=2, Three=3, four=4)
+
+
+def test_compact_fields_in_slots(compact_record):
+    # Instances still have a __dict__, from DataRecord and UserDict, but
+    # neither field values nor a data dict are kept in there
+    assert {"one", "two", "three", "data"}.isdisjoint(vars(compact_record))
+    for field in CompactRecordSample.fields:
+        assert field in CompactRecordSample.__slots__
+
+
+def test_compact_data_access(compact_record):
+    assert compact_record["one"] == 1
+    assert compact_record.get("one") == 1
+    assert compact_record.get("five", 5) == 5
+
+
+def test_compact_attribute_access(compact_record):
+    assert compact_record.two == 2
+    assert compact_record.three == 3
+
+
+def test_compact_extra_data(compact_record):
+    assert compact_record.four == 4
+    assert "four" in compact_record
+
+
+def test_compact_missing_field():
+    rec = CompactRecordSample(one=1)
+    assert "two" not in rec
+    with pytest.raises(AttributeError):
+        rec.two
+    with pytest.raises(KeyError):
+        rec["two"]
+
+
+def test_compact_equals_datarecord(compact_record):
+    assert compact_record == DataRecord(one=1, two=2, three=3, four=4)
+
+
+def test_compact_readonly(compact_record):
+    with pytest.raises(DataRecord.ReadOnlyError):
+        compact_record["four"] = 4
+    with pytest.raises(DataRecord.ReadOnlyError):
+        compact_record.one = 4
+    with pytest.raises(DataRecord.ReadOnlyError):
+        del compact_record["one"]
+
+
+def test_compact_reserved_names():
+    with pytest.raises(DataRecord.InvalidDataError):
+        CompactRecordSample(data="data")
+
+
+def test_compact_reserved_field_names():
+    with pytest.raises(DataRecord.InvalidDataError):
+
+        class Invalid(CompactRecord):
+            fields = ("get",)
+
+
+class DataRecordSample(DataRecord):
+    pass
+
+
+def test_make_compact():
+    Klass = make_compact(DataRecordSample, ("one",))
+    assert isinstance(Klass(one=1), DataRecordSample)
+    assert Klass.__name__ == "DataRecordSample"
+
+
+def test_placeholder_bind_compact(compact_record):
+    p = Placeholder(name="foo")
+    p.set(compact_record)
+    assert p == compact_record
+    assert p.one == 1
+    assert p["two"] == 2
+    assert isinstance(p, CompactRecordSample)
+
+
+def test_pickle():
+    rec = pickle.loads(pickle.dumps(DataRecord(one=1, Two=2)))
+    assert rec == DataRecord(one=1, two=2)
+    assert rec.two == 2
+    with pytest.raises(DataRecord.ReadOnlyError):
+        rec.one = 2
+
+
+def test_pickle_morphed_placeholder():
+    rec = DataRecord(name="foo")
+    p = Placeholder(name="foo")
+    p.set(rec)
+    rec2, p2 = pickle.loads(pickle.dumps((rec, p)))
+    assert vars(p2) is vars(rec2)
+
+
+def test_pickle_compact(compact_record):
+    rec = pickle.loads(pickle.dumps(compact_record))
+    assert rec == compact_record
+    assert "one" not in vars(rec)
+    with pytest.raises(DataRecord.ReadOnlyError):
+        rec.one = 2
+
+
+def test_pickle_placeholder_bound_compact(compact_record):
+    p = Placeholder(name="foo")
+    p.set(compact_record)
+    rec, p2 = pickle.loads(pickle.dumps((compact_record, p)))
+    assert p2.one == 1
+    assert isinstance(p2, CompactRecordSample)
@@ -6,7 +6,7 @@
 
 import pytest
 
-from pytcnz.datasource import DataSource
+from pytcnz.datasource import DataSource, ColumnPlan
 
 
 def test_colmap():
@@ -237,3 +237,112 @@ def test_read_rows_data(colnames, rows):
     target = {}
     DataSource.read_rows_into(target, colnames, rows, dict, additional="data")
     assert target["one"]["additional"] == "data"
+
+
+def test_iter_rows(colnames, rows):
+    records = list(DataSource.iter_rows(colnames, rows, dict))
+    assert [r["name"] for r in records] == [row[1] for row in rows]
+
+
+def test_iter_rows_is_lazy(colnames, rows):
+    consumed = []
+
+    def source():
+        for row in rows:
+            consumed.append(row)
+            yield row
+
+    it = DataSource.iter_rows(colnames, source(), dict)
+    assert not consumed
+    next(it)
+    assert len(consumed) == 1
+
+
+def test_iter_rows_duplicate_replaces(colnames, rows):
+    rows.append([33, "three", "33", "I am pretending to be three"])
+    records = list(DataSource.iter_rows(colnames, rows, dict))
+    assert len(records) == len(rows)
+    assert records[-1]["int"] == 33
+
+
+def test_iter_rows_resolv_duplicate_callback(colnames, rows):
+    rows.append([33, "three", "33", "I am pretending to be three"])
+
+    def resolve_cb(existing, new):
+        return existing
+
+    records = list(
+        DataSource.iter_rows(
+            colnames, rows, dict, resolve_duplicate_cb=resolve_cb
+        )
+    )
+    assert len(records) == len(rows) - 1
+
+
+def test_iter_rows_bounded_index(colnames, rows):
+    rows.append([11, "one", "11", "I am pretending to be one"])
+    called = []
+
+    def resolve_cb(existing, new):
+        called.append(new)
+        return existing
+
+    list(
+        DataSource.iter_rows(
+            colnames, rows, dict, resolve_duplicate_cb=resolve_cb, index_size=1
+        )
+    )
+    assert not called
+
+
+def test_iter_functions(colnames, rows, read_function_name, datasource):
+    fn = getattr(datasource, f"iter_{read_function_name}")
+    assert len(list(fn(colnames, rows))) == len(rows)
+    assert not getattr(datasource, read_function_name)
+
+
+def test_column_plan(colnames):
+    plan = ColumnPlan(colnames, colmap=dict(str="string"))
+    assert plan.colnames == ("int", "name", "string", "upper")
+    assert plan.idindex == 1
+
+
+def test_column_plan_kwargs(colnames, rows):
+    plan = ColumnPlan(colnames)
+    assert plan.make_kwargs(rows[0]) == dict(zip(colnames, rows[0]))
+
+
+def test_column_plan_drop_fields(colnames, rows):
+    plan = ColumnPlan(colnames, drop_fields={"upper", "int"})
+    assert plan.make_kwargs(rows[0]) == dict(name="one", str="1")
+
+
+def test_column_plan_duplicate_colnames():
+    plan = ColumnPlan(["name", "x", "x"])
+    assert plan.make_kwargs(["one", 1, 2]) == dict(name="one", x=2)
+
+
+def test_column_plan_short_row(colnames):
+    plan = ColumnPlan(colnames)
+    assert plan.make_kwargs([1, "one"]) == dict(int=1, name="one")
+
+
+def test_column_plan_cached(colnames):
+    colmap = dict(str="string")
+    plan = DataSource.get_column_plan(colnames, colmap=colmap)
+    assert DataSource.get_column_plan(colnames, colmap=colmap) is plan
+
+
+def test_read_rows_drop_fields(colnames, rows):
+    target = {}
+    DataSource.read_rows_into(
+        target, colnames, rows, dict, drop_fields={"upper"}
+    )
+    assert "upper" not in target["one"]
+
+
+def test_read_rows_skip_empty_id(colnames, rows):
+    target = {}
+    rows.append([4, "", "4", "FOUR"])
+    DataSource.read_rows_into(target, colnames, rows, dict)
+    assert len(target) == len(rows) - 1
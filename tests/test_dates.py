@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2021–2022 martin f. krafft <tctools@pobox.madduck.net>
+# Released under the MIT Licence
+#
+
+import pytest
+from datetime import date, datetime
+import dateutil.parser
+
+from pytcnz.dates import DateParser
+
+
+@pytest.fixture
+def parser():
+    return DateParser()
+
+
+def test_detect_format(parser):
+    assert parser.format is None
+    assert parser.parse("30/08/1999") == datetime(1999, 8, 30)
+    assert parser.format == "%d/%m/%Y"
+
+
+def test_redetect_format(parser):
+    parser.parse("30/08/1999")
+    assert parser.parse("5 Mar 2001") == datetime(2001, 3, 5)
+    assert parser.format == "%d %b %Y"
+
+
+@pytest.mark.parametrize(
+    "string",
+    [
+        "01/02/2003",
+        "1/2/2003",
+        "01-02-2003",
+        "01.02.2003",
+        "1 February 2003",
+        "2003-02-01",
+        "2003-02-13",
+        "1/2/03",
+        "1/2/2003 10:00",
+        "Feb 1 2003",
+    ],
+)
+@pytest.mark.parametrize("dayfirst", [True, False])
+def test_same_as_dateutil(string, dayfirst):
+    assert DateParser(dayfirst=dayfirst).parse(
+        string
+    ) == dateutil.parser.parse(string, dayfirst=dayfirst)
+
+
+def test_invalid(parser):
+    with pytest.raises(dateutil.parser.ParserError):
+        parser.parse("(invalid date )")
+
+
+def test_memo(parser):
+    parser.parse("30/08/1999")
+    parser.parse("30/08/1999")
+    assert (parser.hits, parser.misses) == (1, 1)
+
+
+def test_parse_many(parser):
+    d = date(2000, 1, 1)
+    assert parser.parse_many(["30/08/1999", None, "", d]) == [
+        datetime(1999, 8, 30),
+        None,
+        "",
+        d,
+    ]
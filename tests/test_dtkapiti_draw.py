@@ -7,8 +7,10 @@
 import pytest
 
 from pytcnz.dtkapiti.draw import Draw
+from pytcnz.dtkapiti.game import Game
 from pytcnz.dtkapiti.player import Player
 from .test_draw import make_draw_data
+from .test_game import make_game_data
 from .test_dtkapiti_player import make_player_data
 
 
@@ -60,3 +62,97 @@ def test_add_player_not_seeded(draw):
 def test_numeric_colour(draw_data):
     d = Draw(**draw_data | dict(colour=611651))
     assert d.colour == "511661"
+
+
+def test_get_player_by_seed(draw, player):
+    draw.add_player(player)
+    assert draw.get_player_by_seed(1) is player
+    assert draw.get_player_by_seed(2) is None
+    assert draw.get_player_by_seed(0) is None
+
+
+def test_get_player_by_id(draw, player):
+    draw.add_player(player)
+    assert draw.get_player_by_id("W01") is player
+    assert draw.get_player_by_id("W02") is None
+
+
+def test_add_player_replaces_seed(draw, player):
+    draw.add_player(player)
+    other = Player(**make_player_data(name="Kate Smith"))
+    draw.add_player(other)
+    assert draw.players == [other]
+    assert draw.get_player_by_id("W01") is other
+    draw.add_player(Player(**make_player_data()))
+
+
+def test_remove_player(draw, player):
+    draw.add_player(player)
+    draw.remove_player(player)
+    assert draw.players == [None]
+    assert draw.get_player_by_id("W01") is None
+    draw.add_player(Player(**make_player_data()))
+
+
+def make_game(name="W0101", **data):
+    return Game(
+        **make_game_data(
+            name=name,
+            from1="",
+            from2="",
+            score1=0,
+            score2=0,
+            status=99,
+            comment="",
+        )
+        | data
+    )
+
+
+def test_add_game(draw):
+    game = make_game()
+    draw.add_game(game)
+    assert draw.games == [game]
+    assert draw.get_game("W0101") is game
+    assert draw.get_game("W0102") is None
+
+
+def test_add_game_duplicate(draw):
+    draw.add_game(make_game())
+    with pytest.raises(Draw.DuplicateGameError):
+        draw.add_game(make_game(comment="another"))
+
+
+def test_add_game_not_matching_draw(draw):
+    with pytest.raises(Draw.InvalidGameError):
+        draw.add_game(make_game("M0101"))
+
+
+def test_remove_game(draw):
+    game = make_game()
+    draw.add_game(game)
+    draw.remove_game(make_game())
+    assert draw.games == [game]
+    draw.remove_game(game)
+    assert draw.games == []
+    assert draw.get_game("W0101") is None
+
+
+def test_replace_game(draw):
+    games = [make_game(f"W010{i}") for i in range(1, 4)]
+    for game in games:
+        draw.add_game(game)
+    new = make_game("W0102", comment="rescheduled")
+    draw.replace_game(games[1], new)
+    assert draw.games == [games[0], new, games[2]]
+    assert draw.get_game("W0102") is new
+    assert new.draw.name == "W0"
+
+
+def test_replace_game_duplicate(draw):
+    games = [make_game("W0101"), make_game("W0102")]
+    for game in games:
+        draw.add_game(game)
+    with pytest.raises(Draw.DuplicateGameError):
+        draw.replace_game(games[0], make_game("W0102"))
+    assert draw.get_game("W0101") is games[0]
@@ -4,10 +4,12 @@
 # Released under the MIT Licence
 #
 
+import datetime
 import pytest
 
 from pytcnz.scores import Scores
 from pytcnz.dtkapiti.game import Game
+from pytcnz.dtkapiti.schedule import ScheduleParser
 from pytcnz.dtkapiti.player import Player
 from .test_game import make_game_data
 from .test_dtkapiti_player import make_player_data
@@ -208,3 +210,16 @@ def played_game_no_scores(game_data):
 
 def test_played_no_scores_is_played(played_game_no_scores):
     assert played_game_no_scores.is_played()
+
+
+def test_datetime_from_tournament_start(game_data):
+    start = datetime.datetime(2022, 3, 9)
+    g = Game(**game_data | dict(tournament_start_date=start))
+    assert g.datetime == datetime.datetime(2022, 3, 10, 18, 0)
+
+
+def test_datetime_from_schedule_parser(game_data):
+    parser = ScheduleParser(datetime.datetime(2022, 3, 7))
+    g = Game(**game_data | dict(schedule_parser=parser))
+    assert g.datetime == datetime.datetime(2022, 3, 10, 18, 0)
+    assert "schedule_parser" not in g
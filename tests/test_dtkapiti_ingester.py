@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2021–2022 martin f. krafft <tctools@pobox.madduck.net>
+# Released under the MIT Licence
+#
+
+import asyncio
+import queue
+import pytest
+
+from pytcnz.dtkapiti.ingester import TCExportIngester
+from pytcnz.warnings import Warnings
+from .test_dtkapiti_tcexport_reader import make_game_row, save_export
+
+RESULT = make_game_row(status=0, score1=1, Comment="11-1 11-2 11-3")
+
+
+@pytest.fixture
+def filename(tmp_path):
+    filename = str(tmp_path / "export.xls")
+    save_export(filename)
+    return filename
+
+
+@pytest.fixture
+def ingester(filename):
+    return TCExportIngester(
+        filename, debounce=0.05, poll_interval=0.01, add_games_to_draws=True
+    )
+
+
+@pytest.fixture
+def published(ingester):
+    published = queue.Queue()
+    ingester.subscribe(lambda reader, changes: published.put(changes))
+    return published
+
+
+def test_ingest(ingester, published):
+    changes = ingester.ingest()
+    assert published.get_nowait() is changes
+    assert [g.name for g in changes.added_games] == ["W0101"]
+    assert len(changes.added_players) == 2
+    assert ingester.reader.draws["W0"].games == changes.added_games
+
+
+def test_ingest_update(filename, ingester, published):
+    ingester.ingest()
+    reader = ingester.reader
+    save_export(filename, games=[RESULT])
+    changes = ingester.ingest()
+    assert ingester.reader is reader
+    assert changes.get_results() == [reader.games["W0101"]]
+
+
+def test_ingest_unchanged_not_published(ingester, published):
+    ingester.ingest()
+    published.get_nowait()
+    assert not ingester.ingest()
+    assert published.empty()
+
+
+def test_ingest_incomplete(filename, ingester, published):
+    with open(filename, "r+b") as f:
+        f.truncate(100)
+    Warnings.clear()
+    assert ingester.ingest() is None
+    assert ingester.reader is None
+    assert len(Warnings) == 1
+    Warnings.clear()
+    save_export(filename)
+    assert ingester.ingest()
+
+
+def test_failing_subscriber(ingester, published):
+    def fail(reader, changes):
+        raise RuntimeError("subscriber failed")
+
+    ingester.subscribe(fail)
+    Warnings.clear()
+    ingester.ingest()
+    assert len(Warnings) == 1
+    Warnings.clear()
+    assert published.get_nowait()
+
+
+@pytest.mark.parametrize("use_inotify", [None, False])
+def test_run(filename, published, use_inotify):
+    ingester = TCExportIngester(
+        filename, debounce=0.05, poll_interval=0.01, use_inotify=use_inotify
+    )
+    ingester.subscribe(lambda reader, changes: published.put(changes))
+    with ingester:
+        assert published.get(timeout=5).added_games
+        save_export(filename, games=[RESULT])
+        assert published.get(timeout=5).get_results()
+
+
+def test_queue(filename, ingester):
+    async def main():
+        queue = ingester.get_queue()
+        with ingester:
+            reader, changes = await asyncio.wait_for(queue.get(), 5)
+            assert changes.added_games
+            save_export(filename, games=[RESULT])
+            reader, changes = await asyncio.wait_for(queue.get(), 5)
+            return changes.get_results()
+
+    assert asyncio.run(main())
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2021–2022 martin f. krafft <tctools@pobox.madduck.net>
+# Released under the MIT Licence
+#
+
+import pytest
+from datetime import datetime
+import dateutil.parser
+
+from pytcnz.dtkapiti.schedule import ScheduleParser
+
+MONDAY = datetime(2022, 3, 7)
+WEDNESDAY = datetime(2022, 3, 9, 13, 45, 12)
+
+
+@pytest.fixture
+def parser():
+    return ScheduleParser(MONDAY)
+
+
+@pytest.mark.parametrize(
+    "string,expected",
+    [
+        ("Thu 7:30pm", datetime(2022, 3, 10, 19, 30)),
+        ("Thu 18:00", datetime(2022, 3, 10, 18, 0)),
+        ("Mon 9am", datetime(2022, 3, 7, 9, 0)),
+        ("Sun 12pm", datetime(2022, 3, 13, 12, 0)),
+        ("Sat 12:15am", datetime(2022, 3, 12, 0, 15)),
+        ("friday 6:45 PM", datetime(2022, 3, 11, 18, 45)),
+    ],
+)
+def test_parse(parser, string, expected):
+    assert parser.parse(string) == expected
+
+
+@pytest.mark.parametrize(
+    "string",
+    [
+        "Thu 7:30pm",
+        "Tue 18:00",
+        "Mon 11am",
+        "Wed 10",
+        "Thursday 7pm",
+        "Thu 7:30:15pm",
+        "10 March 2022 18:00",
+    ],
+)
+@pytest.mark.parametrize("reference", [MONDAY, WEDNESDAY])
+def test_same_as_dateutil(string, reference):
+    assert ScheduleParser(reference).parse(string) == dateutil.parser.parse(
+        string, default=reference
+    )
+
+
+def test_memo(parser):
+    parser.parse("Thu 7:30pm")
+    parser.parse("Thu 7:30pm")
+    assert (parser.hits, parser.misses) == (1, 1)
+
+
+def test_invalid(parser):
+    with pytest.raises(dateutil.parser.ParserError):
+        parser.parse("Thu 25:00")
+
+
+def test_next_monday():
+    assert ScheduleParser.get_next_monday(MONDAY) == MONDAY
+    assert ScheduleParser.get_next_monday(WEDNESDAY) == datetime(2022, 3, 14)
+
+
+def test_default_reference():
+    assert ScheduleParser().reference == dateutil.parser.parse("Mon")
+
+
+def test_for_reference_shared():
+    assert ScheduleParser.for_reference(
+        MONDAY
+    ) is ScheduleParser.for_reference(MONDAY)
@@ -4,11 +4,329 @@
 # Released under the MIT Licence
 #
 
+import os
+import subprocess
+import sys
 import pytest
+import pyexcel
 
-from pytcnz.dtkapiti.tcexport_reader import TCExportReader  # noqa:F401
+from pytcnz.dtkapiti.tcexport_reader import TCExportReader
+from pytcnz.workbook import LazyWorkbook
+
+EXPORT = {
+    "Tournament": [["Title", "Foo Open"], ["Venue", "Bar Club"]],
+    "Draws": [
+        ["Name", "Description", "Colour", "Gendered"],
+        ["W0", "Women's Open", "$00123456", "W"],
+    ],
+    "Players": [
+        ["Code", "Name", "Gender", "Points", "DOB", "Phone", "Mobile"],
+        ["W01", "Jane Doe", "W", 3050, "30/08/1999", "", ""],
+        ["W02", "Kate Smith", "W", 2900, "", "", ""],
+    ],
+    "Games": [
+        [
+            "Name",
+            "Player1",
+            "From1",
+            "Score1",
+            "Player2",
+            "From2",
+            "Score2",
+            "Status",
+            "Comment",
+            "DayTime",
+        ],
+        ["W0101", "Jane Doe", "", 0, "Kate Smith", "", 0, 99, "", "Thu 18:00"],
+    ],
+}
+
+
+@pytest.fixture
+def filename(tmp_path):
+    filename = str(tmp_path / "export.xls")
+    pyexcel.save_book_as(bookdict=EXPORT, dest_file_name=filename)
+    return filename
 
 
 @pytest.mark.xfail
 def test():
     pass
+
+
+def test_read_all(filename):
+    reader = TCExportReader(filename, read_all=True)
+    assert reader.get_tournament_name() == "Foo Open"
+    assert list(reader.draws) == ["W0"]
+    assert list(reader.players) == ["Jane Doe", "Kate Smith"]
+    assert list(reader.games) == ["W0101"]
+
+
+def test_read_games_only_parses_games(filename, monkeypatch):
+    parsed = []
+    iter_rows = LazyWorkbook.iter_rows
+
+    def record(self, name):
+        parsed.append(name)
+        return iter_rows(self, name)
+
+    monkeypatch.setattr(LazyWorkbook, "iter_rows", record)
+    reader = TCExportReader(filename)
+    reader.read_games()
+    assert parsed == ["Games"]
+    assert reader.games["W0101"].player2.name == "Kate Smith"
+
+
+def test_iter_players(filename):
+    reader = TCExportReader(filename)
+    players = reader.iter_players()
+    assert next(players).name == "Jane Doe"
+    assert [p.name for p in players] == ["Kate Smith"]
+
+
+def test_add_players_to_draws(filename):
+    reader = TCExportReader(filename, add_players_to_draws=True)
+    reader.read_draws()
+    reader.read_players()
+    assert len(reader.draws["W0"].players) == 2
+
+
+def test_snapshot_written(filename, tmp_path):
+    snapshot = tmp_path / "export.snapshot"
+    TCExportReader(filename, read_all=True, snapshot=str(snapshot))
+    assert snapshot.exists()
+
+
+def test_snapshot_used(filename, tmp_path, monkeypatch):
+    snapshot = str(tmp_path / "export.snapshot")
+    kwargs = dict(
+        read_all=True,
+        snapshot=snapshot,
+        add_players_to_draws=True,
+        add_games_to_draws=True,
+    )
+    reader = TCExportReader(filename, **kwargs)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("workbook opened despite snapshot")
+
+    monkeypatch.setattr(LazyWorkbook, "__init__", fail)
+    restored = TCExportReader(filename, **kwargs)
+    assert restored.get_tournament_name() == "Foo Open"
+    assert restored.players == reader.players
+    assert list(restored.games) == list(reader.games)
+    draw = restored.draws["W0"]
+    assert draw.players == list(restored.players.values())
+    assert draw.games == list(restored.games.values())
+    assert restored.players["Jane Doe"].draw.name == "W0"
+
+
+def test_snapshot_ignored_with_other_options(filename, tmp_path):
+    snapshot = str(tmp_path / "export.snapshot")
+    TCExportReader(filename, read_all=True, snapshot=snapshot)
+    reader = TCExportReader(
+        filename,
+        read_all=True,
+        snapshot=snapshot,
+        add_players_to_draws=True,
+    )
+    assert len(reader.draws["W0"].players) == 2
+
+
+def test_snapshot_ignored_when_export_changes(filename, tmp_path):
+    snapshot = str(tmp_path / "export.snapshot")
+    TCExportReader(filename, read_all=True, snapshot=snapshot)
+    export = EXPORT | dict(Tournament=[["Title", "Bar Open"]])
+    pyexcel.save_book_as(bookdict=export, dest_file_name=filename)
+    reader = TCExportReader(filename, read_all=True, snapshot=snapshot)
+    assert reader.get_tournament_name() == "Bar Open"
+
+
+def test_snapshot_players_equal_across_processes(filename, tmp_path):
+    # Hashes of strings differ between processes, so players restored from
+    # a snapshot must not use those of the process that wrote it
+    snapshot = str(tmp_path / "export.snapshot")
+    code = (
+        "import sys; "
+        "from pytcnz.dtkapiti.tcexport_reader import TCExportReader; "
+        "reader = TCExportReader(sys.argv[1], snapshot=sys.argv[2]); "
+        "reader.read_all(); "
+        "fresh = TCExportReader(sys.argv[1], read_all=True); "
+        "restored = reader.players['Jane Doe']; "
+        "assert restored == fresh.players['Jane Doe']; "
+        "assert fresh.players['Jane Doe'] in {restored}"
+    )
+    for seed in ("1", "2"):
+        out = subprocess.run(
+            [sys.executable, "-c", code, filename, snapshot],
+            capture_output=True,
+            text=True,
+            env=os.environ | dict(PYTHONHASHSEED=seed),
+        )
+        assert out.returncode == 0, out.stderr
+    assert os.path.exists(snapshot)
+
+
+def make_game_row(name="W0101", status=99, score1=0, score2=0, **data):
+    row = dict(
+        Name=name,
+        Player1="Jane Doe",
+        From1="",
+        Score1=score1,
+        Player2="Kate Smith",
+        From2="",
+        Score2=score2,
+        Status=status,
+        Comment="",
+        DayTime="Thu 18:00",
+    )
+    return list((row | data).values())
+
+
+def save_export(filename, games=None, players=None):
+    export = EXPORT.copy()
+    if games is not None:
+        export["Games"] = EXPORT["Games"][:1] + games
+    if players is not None:
+        export["Players"] = EXPORT["Players"][:1] + players
+    pyexcel.save_book_as(bookdict=export, dest_file_name=filename)
+
+
+@pytest.fixture
+def linked_reader(filename):
+    return TCExportReader(
+        filename,
+        read_all=True,
+        add_players_to_draws=True,
+        add_games_to_draws=True,
+        add_players_to_games=True,
+    )
+
+
+def test_update_unchanged(linked_reader):
+    game = linked_reader.games["W0101"]
+    changes = linked_reader.update()
+    assert not changes
+    assert linked_reader.games["W0101"] is game
+
+
+def test_update_only_parses_players_and_games(linked_reader, monkeypatch):
+    parsed = []
+    iter_rows = LazyWorkbook.iter_rows
+
+    def record(self, name):
+        parsed.append(name)
+        return iter_rows(self, name)
+
+    monkeypatch.setattr(LazyWorkbook, "iter_rows", record)
+    linked_reader.update()
+    assert parsed == ["Players", "Games"]
+
+
+def test_update_result(filename, linked_reader):
+    save_export(
+        filename,
+        games=[
+            make_game_row(status=0, score1=1, Comment="11-1 11-2 11-3"),
+            make_game_row("W0102", DayTime="Fri 18:00"),
+        ],
+    )
+    old = linked_reader.games["W0101"]
+    changes = linked_reader.update()
+    new = linked_reader.games["W0101"]
+    assert changes.updated_games == [(old, new)]
+    assert changes.added_games == [linked_reader.games["W0102"]]
+    assert changes.get_results() == [new]
+    assert new.is_finished()
+    assert linked_reader.draws["W0"].games == [
+        new,
+        linked_reader.games["W0102"],
+    ]
+
+
+def test_update_rescheduled(filename, linked_reader):
+    save_export(filename, games=[make_game_row(DayTime="Fri 19:00")])
+    changes = linked_reader.update()
+    game = linked_reader.games["W0101"]
+    assert changes.get_rescheduled() == [game]
+    assert changes.get_results() == []
+    assert game.datetime.hour == 19
+
+
+def test_update_removed_game(filename, linked_reader):
+    save_export(filename, games=[make_game_row("W0102")])
+    old = linked_reader.games["W0101"]
+    changes = linked_reader.update()
+    assert changes.removed_games == [old]
+    assert "W0101" not in linked_reader.games
+    assert linked_reader.draws["W0"].games == [linked_reader.games["W0102"]]
+
+
+def test_update_player(filename, linked_reader):
+    players = EXPORT["Players"][1:]
+    jane = players[0][:3] + [3100] + players[0][4:]
+    save_export(filename, players=[jane, players[1]])
+    jane, kate = linked_reader.players.values()
+    game = linked_reader.games["W0101"]
+    changes = linked_reader.update()
+    new = linked_reader.players["Jane Doe"]
+    assert changes.updated_players == [(jane, new)]
+    assert new.points == 3100
+    assert linked_reader.draws["W0"].players == [new, kate]
+    # the game refers to the new player record
+    assert changes.updated_games == [(game, linked_reader.games["W0101"])]
+    assert linked_reader.games["W0101"].player1 is new
+
+
+def test_update_requires_games(filename):
+    reader = TCExportReader(filename)
+    with pytest.raises(TCExportReader.DataUnavailableError):
+        reader.update()
+
+
+def test_update_after_snapshot(filename, tmp_path):
+    snapshot = str(tmp_path / "export.snapshot")
+    TCExportReader(filename, read_all=True, snapshot=snapshot)
+    reader = TCExportReader(filename, read_all=True, snapshot=snapshot)
+    assert not reader.update()
+
+
+def test_update_removed_player(filename):
+    reader = TCExportReader(filename, read_all=True, add_players_to_draws=True)
+    kate = reader.players["Kate Smith"]
+    save_export(filename, players=EXPORT["Players"][1:2])
+    changes = reader.update()
+    assert changes.removed_players == [kate]
+    assert reader.draws["W0"].players == [reader.players["Jane Doe"], None]
+
+
+def test_update_removed_player_cleaned_name(filename):
+    jane, kate = EXPORT["Players"][1:]
+    jane = jane[:1] + ["Dr Jane Doe"] + jane[2:]
+    kate = kate[:1] + ["Kate A. Smith"] + kate[2:]
+    save_export(filename, players=[jane, kate])
+    reader = TCExportReader(filename, read_all=True, add_players_to_draws=True)
+    assert list(reader.players) == ["Jane Doe", "Kate Smith"]
+    assert not reader.update()
+    old = reader.players["Kate Smith"]
+    save_export(filename, players=[jane])
+    changes = reader.update()
+    assert changes.removed_players == [old]
+    assert list(reader.players) == ["Jane Doe"]
+    assert reader.draws["W0"].players == [reader.players["Jane Doe"], None]
+
+
+def test_update_renamed_player_same_record(filename):
+    reader = TCExportReader(filename, read_all=True)
+    jane, kate = EXPORT["Players"][1:]
+    old = reader.players["Jane Doe"]
+    jane = jane[:1] + ["Dr Jane Doe"] + jane[2:]
+    save_export(filename, players=[jane, kate])
+    changes = reader.update()
+    new = reader.players["Jane Doe"]
+    assert changes.removed_players == []
+    assert changes.updated_players == [(old, new)]
+    save_export(filename, players=[kate])
+    changes = reader.update()
+    assert changes.removed_players == [new]
+    assert "Jane Doe" not in reader.players
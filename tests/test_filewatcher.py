@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2021–2022 martin f. krafft <tctools@pobox.madduck.net>
+# Released under the MIT Licence
+#
+
+import os
+import threading
+import pytest
+
+from pytcnz.filewatcher import FileWatcher
+
+
+@pytest.fixture
+def filename(tmp_path):
+    filename = tmp_path / "export.xls"
+    filename.write_bytes(b"data")
+    return str(filename)
+
+
+@pytest.fixture(params=[True, False], ids=["inotify", "polling"])
+def watcher(request, filename):
+    try:
+        watcher = FileWatcher(
+            filename, poll_interval=0.01, use_inotify=request.param
+        )
+    except FileWatcher.InotifyUnavailableError:
+        pytest.skip("inotify not available")
+    with watcher:
+        yield watcher
+
+
+def later(fn, delay=0.05):
+    timer = threading.Timer(delay, fn)
+    timer.start()
+    return timer
+
+
+def test_timeout(watcher):
+    assert not watcher.wait(0.05)
+
+
+def test_modified(watcher, filename):
+    later(lambda: open(filename, "ab").write(b" more"))
+    assert watcher.wait(5)
+
+
+def test_replaced(watcher, filename, tmp_path):
+    def replace():
+        tmpname = tmp_path / "export.tmp"
+        tmpname.write_bytes(b"new data")
+        os.replace(tmpname, filename)
+
+    later(replace)
+    assert watcher.wait(5)
+
+
+def test_created(tmp_path):
+    filename = tmp_path / "missing.xls"
+    with FileWatcher(filename, poll_interval=0.01) as watcher:
+        later(lambda: filename.write_bytes(b"data"))
+        assert watcher.wait(5)
+
+
+def test_other_files_ignored(watcher, tmp_path):
+    later(lambda: (tmp_path / "other.xls").write_bytes(b"data"))
+    assert not watcher.wait(0.2)
+
+
+def test_fallback_to_polling(filename, monkeypatch):
+    def unavailable(self):
+        raise FileWatcher.InotifyUnavailableError("test")
+
+    monkeypatch.setattr(
+        FileWatcher, "_FileWatcher__init_inotify", unavailable
+    )
+    with FileWatcher(filename) as watcher:
+        assert not watcher.uses_inotify
+    with pytest.raises(FileWatcher.InotifyUnavailableError):
+        FileWatcher(filename, use_inotify=True)
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2021–2022 martin f. krafft <tctools@pobox.madduck.net>
+# Released under the MIT Licence
+#
+
+from pytcnz import patterns
+
+
+def test_draw_re_shared():
+    assert patterns.get_draw_re(r"\w\d") is patterns.get_draw_re(r"\w\d")
+
+
+def test_draw_re_per_pattern():
+    assert patterns.get_draw_re(r"\w\d") is not patterns.get_draw_re(r"\w")
+
+
+def test_draw_re():
+    assert patterns.get_draw_re(r"\w\d").match("M101").group("draw") == "M1"
+
+
+def test_draw_seed_re():
+    md = patterns.get_draw_seed_re(r"\w\d{2}").match("M1012").groupdict()
+    assert md == dict(draw="M10", seed="12")
+
+
+def test_salutations_re_longest_first():
+    pat = patterns.get_salutations_re(("Mr", "Mrs"))
+    assert pat.sub("", "Mrs Jane Doe") == "Jane Doe"
+
+
+def test_cache_info():
+    patterns.get_salutations_re(("Dr",))
+    patterns.get_salutations_re(("Dr",))
+    assert patterns.get_cache_info()["salutations"].hits >= 1
@@ -43,3 +43,25 @@ def incomplete_number(request):
 def test_incomplete_number(incomplete_number):
     with pytest.raises(PhoneNumber.InvalidPhoneNumber):
         PhoneNumber(incomplete_number)
+
+
+def test_str_national():
+    assert str(PhoneNumber("64/021/1100938")) == "0211100938"
+
+
+def test_equality():
+    assert PhoneNumber("021 110 0938") == PhoneNumber("+64211100938")
+    assert PhoneNumber("021 110 0938") == "0211100938"
+
+
+def test_parse_cached():
+    PhoneNumber("043841234")
+    hits = PhoneNumber.get_cache_info().hits
+    PhoneNumber("043841234")
+    assert PhoneNumber.get_cache_info().hits == hits + 1
+
+
+def test_invalid_number_cached(incomplete_number):
+    for i in range(2):
+        with pytest.raises(PhoneNumber.InvalidPhoneNumber):
+            PhoneNumber(incomplete_number)
@@ -4,7 +4,7 @@
 # Released under the MIT Licence
 #
 import pytest
-from pytcnz.scores import Scores
+from pytcnz.scores import Scores, PackedScores, ScoresArray
 
 A = Scores.Player.A
 B = Scores.Player.B
@@ -246,3 +246,104 @@ def test_flip_scores(valid_score):
 def test_comma_used_as_delim(valid_score):
     with pytest.raises(Scores.IncompleteError):
         Scores.from_string("4/11, 4/11, 4,11")
+
+
+def test_parse_many():
+    strings = ["11-0 11-0 11-0", "no scores", "11-4 11-4 11-4 x"]
+    ret = Scores.parse_many(strings)
+    assert [r[1] for r in ret] == ["", "no scores", "x"]
+    assert ret[0][0] == Scores([(11, 0), (11, 0), (11, 0)])
+    assert ret[1][0] is None
+
+
+def test_parse_many_like_from_string():
+    strings = [
+        "11-0, 11-0, 11-0",
+        "11 - 4 11:4 11/4",
+        "11-4 5-11 11-8 12-10 retired",
+        "walkover",
+    ]
+    assert [
+        (str(s) if s else s, r) for s, r in Scores.parse_many(strings)
+    ] == [
+        (str(s) if s else s, r)
+        for s, r in (Scores.from_string(x) for x in strings)
+    ]
+
+
+def test_parse_many_bestof():
+    ret = Scores.parse_many(["11-0 11-0"], bestof=3)
+    assert ret[0][0].winner == A
+
+
+def test_from_string_cached_is_independent():
+    s1 = Scores.from_string("11-4 5-11 11-8 12-10")[0]
+    s1.flip_scores()
+    s2 = Scores.from_string("11-4 5-11 11-8 12-10")[0]
+    assert s2.winner == A
+    assert s2[0] == (11, 4)
+
+
+def test_invalid_scores_cached():
+    for i in range(2):
+        with pytest.raises(Scores.IncompleteError):
+            Scores.from_string("11-0 11-0")
+
+
+@pytest.fixture
+def packed_score(valid_score):
+    return valid_score.pack()
+
+
+def test_pack(valid_score, packed_score):
+    assert len(packed_score.to_bytes()) == PackedScores.WIDTH
+    assert list(packed_score) == list(valid_score)
+
+
+def test_packed_api(valid_score, packed_score):
+    assert packed_score.get_scores() == valid_score.get_scores()
+    assert packed_score.get_games_score() == valid_score.get_games_score()
+    assert packed_score.winner == valid_score.winner
+    assert len(packed_score) == len(valid_score)
+    assert packed_score[-1] == valid_score[-1]
+
+
+def test_packed_equality(valid_score, packed_score):
+    assert packed_score == valid_score
+    assert valid_score == packed_score
+    assert packed_score == valid_score.pack()
+    assert hash(packed_score) == hash(valid_score.pack())
+
+
+def test_packed_roundtrip(valid_score, packed_score):
+    assert packed_score.to_scores() == valid_score
+
+
+def test_packed_flip_scores(valid_score, packed_score):
+    packed_score.flip_scores()
+    valid_score.flip_scores()
+    assert packed_score == valid_score
+    assert packed_score.winner == valid_score.winner
+
+
+def test_pack_too_many_sets():
+    with pytest.raises(PackedScores.PackingError):
+        PackedScores.pack_sets([(11, 0)] * 6)
+
+
+def test_pack_out_of_range():
+    with pytest.raises(PackedScores.PackingError):
+        PackedScores.pack_sets([(300, 298)])
+
+
+def test_scores_array(valid_score):
+    arr = ScoresArray([valid_score, valid_score.pack()])
+    assert len(arr) == 2
+    assert arr[0] == valid_score
+    assert list(arr)[1] == valid_score
+
+
+def test_scores_array_views(valid_score):
+    arr = ScoresArray([valid_score])
+    arr[0].flip_scores()
+    assert arr[0].winner == Scores.Player.B
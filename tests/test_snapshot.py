@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2021–2022 martin f. krafft <tctools@pobox.madduck.net>
+# Released under the MIT Licence
+#
+
+import os
+import pytest
+
+from pytcnz.snapshot import Snapshot
+from pytcnz.datarecord import DataRecord
+
+RECORDS = dict(one=DataRecord(name="one"), two=[1, 2, 3])
+
+
+@pytest.fixture
+def source(tmp_path):
+    source = tmp_path / "source.xls"
+    source.write_bytes(b"source data")
+    return str(source)
+
+
+@pytest.fixture
+def filename(tmp_path):
+    return str(tmp_path / "source.snapshot")
+
+
+def make_snapshot(filename, source, **context):
+    return Snapshot(filename, source, context=context)
+
+
+def test_load_missing(filename, source):
+    assert make_snapshot(filename, source).load() is None
+
+
+def test_save_load(filename, source):
+    assert make_snapshot(filename, source).save(RECORDS)
+    assert make_snapshot(filename, source).load() == RECORDS
+
+
+def test_context_tuples(filename, source):
+    make_snapshot(filename, source, colmap=(("a", "b"),)).save(RECORDS)
+    snapshot = make_snapshot(filename, source, colmap=(("a", "b"),))
+    assert snapshot.load() == RECORDS
+
+
+def test_context_mismatch(filename, source):
+    make_snapshot(filename, source, onday="2021-10-06").save(RECORDS)
+    snapshot = make_snapshot(filename, source, onday="2021-10-07")
+    assert snapshot.load() is None
+
+
+def test_source_changed(filename, source):
+    make_snapshot(filename, source).save(RECORDS)
+    with open(source, "ab") as f:
+        f.write(b" and more")
+    assert make_snapshot(filename, source).load() is None
+
+
+def test_source_changed_same_size(filename, source):
+    make_snapshot(filename, source).save(RECORDS)
+    stat = os.stat(source)
+    with open(source, "wb") as f:
+        f.write(b"SOURCE DATA")
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert make_snapshot(filename, source).load() is None
+
+
+def test_source_touched(filename, source):
+    make_snapshot(filename, source).save(RECORDS)
+    stat = os.stat(source)
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert make_snapshot(filename, source).load() == RECORDS
+
+
+def test_source_changed_while_reading(filename, source):
+    snapshot = make_snapshot(filename, source)
+    assert snapshot.load() is None
+    with open(source, "ab") as f:
+        f.write(b" and more")
+    assert not snapshot.save(RECORDS)
+    assert not os.path.exists(filename)
+
+
+def test_other_version(filename, source, monkeypatch):
+    make_snapshot(filename, source).save(RECORDS)
+    monkeypatch.setattr(Snapshot, "VERSION", Snapshot.VERSION + 1)
+    assert make_snapshot(filename, source).load() is None
+
+
+def test_not_a_snapshot(filename, source):
+    with open(filename, "wb") as f:
+        f.write(b"garbage")
+    assert make_snapshot(filename, source).load() is None
+
+
+def test_truncated(filename, source):
+    make_snapshot(filename, source).save(RECORDS)
+    with open(filename, "r+b") as f:
+        f.truncate(os.path.getsize(filename) - 10)
+    with pytest.raises(Snapshot.SnapshotError):
+        make_snapshot(filename, source).load()
+
+
+def test_invalidate(filename, source):
+    snapshot = make_snapshot(filename, source)
+    snapshot.save(RECORDS)
+    snapshot.invalidate()
+    assert snapshot.load() is None
+    snapshot.invalidate()
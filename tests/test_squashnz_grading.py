@@ -5,6 +5,7 @@
 #
 import pytest
 
+from pytcnz.gender import Gender
 from pytcnz.squashnz.grading import SquashNZGrading
 
 
@@ -127,3 +128,58 @@ def test_junior_transition(junior_tuplet):
     gender, points, grade = junior_tuplet
     g = SquashNZGrading(points, gender, True)
     assert g.grade == grade
+
+
+def test_points_to_grades(grading_tuplets):
+    gender, junior, points, grade = grading_tuplets
+    gender = Gender.from_string(gender)
+    grades = SquashNZGrading.points_to_grades(
+        [points, points], [gender, gender], [junior, junior]
+    )
+    assert [g.name for g in grades] == [grade, grade]
+
+
+def test_points_to_grades_seniors():
+    grades = SquashNZGrading.points_to_grades(
+        [4500, 100, 0], [Gender.M, Gender.W, Gender.W]
+    )
+    assert [g.name for g in grades] == ["A1", "F", "Ungraded"]
+
+
+def test_points_to_grades_invalid(invalid_points):
+    gender, junior, points = invalid_points
+    with pytest.raises(SquashNZGrading.InvalidGradingError):
+        SquashNZGrading.points_to_grades(
+            [points], [Gender.from_string(gender)], [junior]
+        )
+
+
+def test_flyweight(grading):
+    assert SquashNZGrading(2870, Gender.M, False) is grading
+
+
+def test_flyweight_distinguishes_junior():
+    assert SquashNZGrading(650, "M") is not SquashNZGrading(650, "M", True)
+
+
+def test_hash(grading, grading2):
+    assert hash(grading) == hash(grading2)
+    assert len({grading, grading2, SquashNZGrading(2870, "W")}) == 2
+
+
+def test_immutable(grading):
+    with pytest.raises(AttributeError):
+        grading._points = 3000
+
+
+def test_copy(grading):
+    import copy
+
+    assert copy.deepcopy(grading) is grading
+
+
+def test_total_ordering(grading, lower_grading):
+    assert grading > lower_grading
+    assert grading >= lower_grading
+    assert lower_grading <= grading
+    assert sorted([grading, lower_grading]) == [lower_grading, grading]
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2021–2022 martin f. krafft <tctools@pobox.madduck.net>
+# Released under the MIT Licence
+#
+
+import pytest
+
+from pytcnz.squashnz.gradinglist_cache import GradingListCache
+
+
+class Clock:
+    now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def cache(clock):
+    with GradingListCache(":memory:", clock=clock) as cache:
+        yield cache
+
+
+def test_miss(cache):
+    assert cache.get("search", dict(club="WNKP")) is None
+    assert cache.misses == 1
+
+
+def test_roundtrip(cache):
+    cache.put("search", dict(club="WNKP", grade="A"), [1, 2])
+    assert cache.get("search", dict(grade="A", club="WNKP")) == [1, 2]
+    assert cache.hits == 1
+
+
+def test_kinds_are_separate(cache):
+    cache.put("init", None, "config")
+    assert cache.get("search") is None
+
+
+def test_max_age(cache, clock):
+    cache.put("init", None, "config")
+    clock.now += 100
+    assert cache.get_age("init") == 100
+    assert cache.get("init", max_age=200) == "config"
+    assert cache.get("init", max_age=50) is None
+    assert cache.get("init") == "config"
+
+
+def test_replace(cache):
+    cache.put("init", None, "old")
+    cache.put("init", None, "new")
+    assert cache.get("init") == "new"
+    assert len(cache) == 1
+
+
+def test_invalidate(cache):
+    cache.put("init", None, "config")
+    cache.put("search", dict(club="WNKP"), [])
+    cache.invalidate("search")
+    assert len(cache) == 1
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_persists(tmp_path):
+    filename = tmp_path / "cache.sqlite"
+    with GradingListCache(filename) as cache:
+        cache.put("init", None, dict(config=1))
+    with GradingListCache(filename) as cache:
+        assert cache.get("init") == dict(config=1)
+
+
+def test_cannot_open(tmp_path):
+    with pytest.raises(GradingListCache.CacheError):
+        GradingListCache(tmp_path / "missing" / "cache.sqlite")
@@ -4,11 +4,327 @@
 # Released under the MIT Licence
 #
 
+import gzip
+import json
 import pytest
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
-from pytcnz.squashnz.gradinglist_reader import GradingListReader  # noqa:F401
+from pytcnz.squashnz.gradinglist_reader import GradingListReader
+from pytcnz.squashnz.gradinglist_cache import GradingListCache
+from pytcnz.warnings import Warnings
 
+CONFIG = dict(
+    genders=["Both", "Female", "Male"],
+    districts=[
+        dict(code="All", desc="All"),
+        dict(code="WN", desc="Wellington"),
+        dict(code="CN", desc="Central"),
+    ],
+    clubs=[
+        dict(code="All", desc="All"),
+        dict(code="WNKP", desc="Kapiti"),
+        dict(code="WNHU", desc="Hutt"),
+        dict(code="CNPN", desc="Palmerston North"),
+    ],
+    ages=["Any", "Junior", "Senior", "Masters"],
+    grades=["Any", "A", "B", "C"],
+)
 
-@pytest.mark.xfail
-def test():
-    pass
+
+class FakeResponse:
+    def __init__(self, data):
+        self.__data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.__data
+
+
+def make_population(size=1):
+    population = []
+    for club in CONFIG["clubs"][1:]:
+        for grade in CONFIG["grades"][1:]:
+            for age in CONFIG["ages"][1:]:
+                for gender in ("F", "M"):
+                    for n in range(size):
+                        code = f"{club['code']}{gender}{age}{grade}{n}"
+                        population.append(
+                            dict(
+                                id=code,
+                                name=f"Player {code}",
+                                gender=gender,
+                                squashCode=code,
+                                grade=grade,
+                                age=age,
+                                points=1000,
+                            )
+                        )
+    return population
+
+
+class FakeRequests:
+    def __init__(self, failures=0, size=1):
+        self.searches = []
+        self.failures = failures
+        self.population = make_population(size)
+        self.__lock = threading.Lock()
+
+    def get(self, url, **kwargs):
+        return FakeResponse(dict(config=CONFIG))
+
+    def post(self, url, json, **kwargs):
+        time.sleep(random.random() / 1000)
+        with self.__lock:
+            self.searches.append(json)
+            if self.failures:
+                self.failures -= 1
+                raise IOError("Connection reset")
+
+        def matches(p):
+            return (
+                json["district"] in ("All", p["squashCode"][:2])
+                and json["club"] in ("All", p["squashCode"][:4])
+                and json["grade"] in ("Any", p["grade"])
+                and json["age"] in ("Any", p["age"])
+            )
+
+        found = [p for p in self.population if matches(p)]
+        found = found[: GradingListReader.RESULT_LIMIT]
+        return FakeResponse(
+            dict(
+                gradedPlayers1=[p for p in found if p["gender"] == "F"],
+                gradedPlayers2=[p for p in found if p["gender"] == "M"],
+            )
+        )
+
+
+@pytest.fixture
+def fake_requests():
+    return FakeRequests()
+
+
+def test_read_config(fake_requests):
+    reader = GradingListReader(session=fake_requests)
+    assert reader.clubs["WNKP"] == "Kapiti"
+    assert reader.districts == {"WN": "Wellington", "CN": "Central"}
+
+
+def test_one_query_per_grade_age(fake_requests):
+    reader = GradingListReader(session=fake_requests)
+    reader.read_players(grades=["A", "B"], ages=["Junior"])
+    assert len(fake_requests.searches) == 2
+    assert len(reader.players) == 3 * 2 * 2
+
+
+def test_one_query_per_club(fake_requests):
+    reader = GradingListReader(session=fake_requests)
+    reader.read_players(clubs=["WNKP", "CNPN"])
+    assert {s["club"] for s in fake_requests.searches} == {"WNKP", "CNPN"}
+    assert len(fake_requests.searches) == 2
+
+
+def test_limit_by_district(fake_requests):
+    reader = GradingListReader(session=fake_requests)
+    reader.read_players(districts=["WN"])
+    assert len(fake_requests.searches) == 1
+    assert fake_requests.searches[0]["district"] == "WN"
+    assert {p.squash_code[:2] for p in reader.players.values()} == {"WN"}
+
+
+def test_merge_is_deterministic(fake_requests, monkeypatch):
+    monkeypatch.setattr(GradingListReader, "RESULT_LIMIT", 5)
+    serial = GradingListReader(session=fake_requests)
+    serial.read_players(grades=["A", "B", "C"], concurrency=1)
+    concurrent = GradingListReader(session=fake_requests)
+    concurrent.read_players(grades=["A", "B", "C"], concurrency=8)
+    assert list(serial.players) == list(concurrent.players)
+
+
+def test_retries_failed_requests(monkeypatch):
+    fake = FakeRequests(failures=2)
+    monkeypatch.setattr(time, "sleep", lambda secs: None)
+    reader = GradingListReader(session=fake)
+    reader.read_players(clubs=["WNKP"], retries=2)
+    assert len(reader.players) == 3 * 3 * 2
+
+
+def test_gives_up_eventually(monkeypatch):
+    fake = FakeRequests(failures=100)
+    monkeypatch.setattr(time, "sleep", lambda secs: None)
+    reader = GradingListReader(session=fake)
+    with pytest.raises(GradingListReader.RequestError):
+        reader.read_players(clubs=["WNKP"], retries=2)
+
+
+def test_metrics(fake_requests):
+    reader = GradingListReader(session=fake_requests)
+    assert reader.metrics.count == 1
+    reader.read_players(grades=["A", "B"])
+    assert reader.metrics.count == 1 + 2
+    assert reader.metrics.failures == 0
+    assert reader.metrics.max_latency >= reader.metrics.mean_latency > 0
+
+
+def test_metrics_count_failures(monkeypatch):
+    fake = FakeRequests(failures=1)
+    monkeypatch.setattr(time, "sleep", lambda secs: None)
+    reader = GradingListReader(session=fake)
+    reader.read_players(clubs=["WNKP"])
+    assert reader.metrics.count == 3
+    assert reader.metrics.failures == 1
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = set()
+
+    def log_message(self, *args):
+        pass
+
+    def __reply(self, data):
+        body = json.dumps(data).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        StandInHandler.connections.add(self.client_address)
+
+    def do_GET(self):
+        self.__reply(dict(config=CONFIG))
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.__reply(dict(gradedPlayers1=[], gradedPlayers2=[]))
+
+
+@pytest.fixture
+def stand_in_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    StandInHandler.connections.clear()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+
+def test_session_reuses_connections(stand_in_server):
+    reader = GradingListReader(base_url=stand_in_server, pool_size=2)
+    reader.read_players(clubs=["WNKP", "WNHU", "CNPN"], concurrency=2)
+    assert reader.metrics.count == 1 + 3
+    # At most one connection per pool slot, plus the initial one
+    assert len(StandInHandler.connections) <= 3
+
+
+@pytest.fixture
+def cache():
+    with GradingListCache(":memory:") as cache:
+        yield cache
+
+
+def test_cache_serves_repeated_runs(fake_requests, cache):
+    reader = GradingListReader(session=fake_requests, cache=cache)
+    reader.read_players(grades=["A", "B"])
+    assert reader.metrics.count == 1 + 2
+
+    again = GradingListReader(session=fake_requests, cache=cache)
+    again.read_players(grades=["A", "B"])
+    assert again.metrics.count == 0
+    assert list(again.players) == list(reader.players)
+
+
+def test_cache_refreshes_stale_queries_only(fake_requests, cache):
+    reader = GradingListReader(session=fake_requests, cache=cache)
+    reader.read_players(clubs=["WNKP", "WNHU"])
+    cache.invalidate("search")
+    GradingListReader(session=fake_requests, cache=cache).read_players(
+        clubs=["WNKP"]
+    )
+    fake_requests.searches.clear()
+
+    reader = GradingListReader(session=fake_requests, cache=cache)
+    reader.read_players(clubs=["WNKP", "WNHU", "CNPN"])
+    assert {s["club"] for s in fake_requests.searches} == {"WNHU", "CNPN"}
+
+    fresh = GradingListReader(session=fake_requests, cache=cache, ttl=0)
+    fresh.read_players(clubs=["WNKP"])
+    assert fresh.metrics.count == 1
+
+
+def test_cache_refresh_all(fake_requests, cache):
+    GradingListReader(session=fake_requests, cache=cache).read_players()
+    reader = GradingListReader(session=fake_requests, cache=cache)
+    reader.read_players(refresh=True)
+    assert reader.metrics.count == 1
+
+
+def test_offline(fake_requests, cache):
+    GradingListReader(session=fake_requests, cache=cache).read_players()
+    offline = GradingListReader(session=object(), cache=cache, offline=True)
+    offline.read_players()
+    assert len(offline.players) == 3 * 3 * 3 * 2
+
+
+def test_offline_missing(fake_requests, cache):
+    GradingListReader(session=fake_requests, cache=cache)
+    offline = GradingListReader(session=object(), cache=cache, offline=True)
+    with pytest.raises(GradingListReader.RequestError):
+        offline.read_players()
+
+
+def test_offline_requires_cache():
+    with pytest.raises(GradingListReader.RequestError):
+        GradingListReader(session=object(), offline=True)
+
+
+def test_split_capped_queries(monkeypatch):
+    # 18 players per club, 36 in the WN district, 54 in the country
+    monkeypatch.setattr(GradingListReader, "RESULT_LIMIT", 20)
+    fake = FakeRequests()
+    reader = GradingListReader(session=fake)
+    reader.read_players()
+    assert len(reader.players) == 54
+    # country, 2 districts, 2 WN clubs
+    assert len(fake.searches) == 1 + 2 + 2
+    assert reader.plan.requests == 5
+    assert [
+        (step["query"]["district"], step["query"]["club"], step["split"])
+        for step in reader.plan
+    ] == [
+        (None, None, True),
+        ("WN", None, True),
+        ("WN", "WNKP", False),
+        ("WN", "WNHU", False),
+        ("CN", None, False),
+    ]
+    assert "5 queries, 5 requests, 0 from cache" in str(reader.plan)
+
+
+def test_split_down_to_ages(monkeypatch):
+    monkeypatch.setattr(GradingListReader, "RESULT_LIMIT", 7)
+    fake = FakeRequests()
+    reader = GradingListReader(session=fake)
+    reader.read_players(clubs=["WNKP"])
+    assert len(reader.players) == 18
+    # club, 3 grades, not needing to split further
+    assert len(fake.searches) == 1 + 3
+
+
+def test_unsplittable_capped_query_warns(monkeypatch):
+    monkeypatch.setattr(GradingListReader, "RESULT_LIMIT", 2)
+    Warnings.clear()
+    fake = FakeRequests(size=2)
+    reader = GradingListReader(session=fake)
+    reader.read_players(clubs=["WNKP"], grades=["A"], ages=["Junior"])
+    assert "INCOMPLETE" in str(reader.plan)
+    assert len(Warnings) == 1
+    Warnings.clear()
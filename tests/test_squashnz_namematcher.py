@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2021–2022 martin f. krafft <tctools@pobox.madduck.net>
+# Released under the MIT Licence
+#
+
+import pytest
+import random
+
+from pytcnz.datasource import DataSource
+from pytcnz.gender import Gender
+from pytcnz.squashnz.player import Player
+from pytcnz.squashnz.namematcher import NameMatcher, match_players
+
+REGISTRATIONS = [
+    ["Jane Doe", "W", 0],
+    ["Kate Smith", "W", 0],
+    ["Martin Krafft", "M", 0],
+    ["Jon Smith", "M", 0],
+    ["Nobody Known", "M", 0],
+]
+GRADINGLIST = [
+    ["Mrs Jane Doe", "W", 2870],
+    ["Katherine Smith", "W", 1450],
+    ["Kate Smyth", "W", 1400],
+    ["Krafft Martin", "M", 2870],
+    ["John Smith", "M", 650],
+    ["Joan Smith", "W", 800],
+]
+
+
+@pytest.fixture
+def registrations():
+    source = DataSource(Player_class=Player)
+    source.read_players(["name", "gender", "points"], REGISTRATIONS)
+    return source
+
+
+@pytest.fixture
+def gradinglist():
+    source = DataSource(Player_class=Player)
+    source.read_players(["name", "gender", "points"], GRADINGLIST)
+    return source
+
+
+@pytest.fixture
+def matcher(gradinglist):
+    return NameMatcher(gradinglist.players)
+
+
+def test_length(matcher):
+    assert len(matcher) == len(GRADINGLIST)
+
+
+def test_trigrams():
+    assert NameMatcher.get_trigrams("jo ab") == {" jo", "jo ", " ab", "ab "}
+
+
+def test_score_identical():
+    assert NameMatcher.get_score("Jane Doe", "Ms jane  doe") == 1.0
+
+
+def test_score_word_order():
+    assert NameMatcher.get_score("Jane Doe", "Doe Jane") == 1.0
+
+
+def test_score_unrelated():
+    assert NameMatcher.get_score("Jane Doe", "Martin Krafft") == 0.0
+
+
+def test_match_exact(matcher):
+    player, score = matcher.match_one("Jane Doe")
+    assert player.name == "Jane Doe"
+    assert score == 1.0
+
+
+def test_match_typo(matcher):
+    player, score = matcher.match_one("Martin Kraft")
+    assert player.name == "Krafft Martin"
+    assert 0.6 < score < 1.0
+
+
+def test_match_ranked(matcher):
+    found = matcher.match("Kate Smith", limit=3, min_score=0.3)
+    assert found[0][0].name == "Kate Smyth"
+    scores = [s for _, s in found]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_match_gender(matcher):
+    player, score = matcher.match_one("Jon Smith", gender=Gender.M)
+    assert player.name == "John Smith"
+
+
+def test_no_match(matcher):
+    assert matcher.match_one("Nobody Known") == (None, 0.0)
+
+
+def test_match_strings():
+    matcher = NameMatcher(["Jane Doe", "John Smith"], key=str)
+    assert matcher.match_one("Jon Smith")[0] == "John Smith"
+
+
+def test_candidates_complete():
+    # The candidate filter must not lose anything a full scan would find
+    rng = random.Random(1)
+    letters = "abcdefghij"
+    names = [
+        " ".join(
+            "".join(rng.choice(letters) for i in range(rng.randint(2, 6)))
+            for w in range(2)
+        )
+        for n in range(300)
+    ]
+    matcher = NameMatcher(names, key=str, min_score=0.5)
+    for name in names[:50]:
+        expected = {
+            n for n in names if NameMatcher.get_score(name, n) >= 0.5
+        }
+        found = {n for n, s in matcher.match(name, limit=len(names))}
+        assert found == expected
+
+
+def test_match_players(registrations, gradinglist):
+    matches = match_players(registrations, gradinglist)
+    assert {a: b.name for a, (b, s) in matches.items()} == {
+        "Jane Doe": "Jane Doe",
+        "Kate Smith": "Kate Smyth",
+        "Martin Krafft": "Krafft Martin",
+        "Jon Smith": "John Smith",
+    }
+    assert matches["Jane Doe"][1] == 1.0
+
+
+def test_match_players_ignoring_gender(registrations, gradinglist):
+    matches = match_players(
+        registrations, gradinglist, match_gender=False, min_score=0.3
+    )
+    assert "Nobody Known" not in matches
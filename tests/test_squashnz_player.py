@@ -8,6 +8,9 @@ import pytest
 from datetime import date
 
 from pytcnz.squashnz.player import Player
+from pytcnz.playerbase import PlayerBase
+from pytcnz.datarecord import Placeholder
+from pytcnz.draw import Draw
 from .test_playerbase import PLAYER
 
 PLAYER = PLAYER | dict(
@@ -87,6 +90,21 @@ def test_player_get_age_dob_emptystring(player):
     assert player.get_age_group() == Player.AgeGroup.Unknown
 
 
+def test_ages_for_dobs():
+    onday = date(2021, 10, 6)
+    dobs = [date(1999, 10, 6), date(1999, 10, 7), None, "", date(2010, 1, 1)]
+    ages = Player.get_ages_for_dobs(dobs, onday=onday)
+    assert ages == [22, 21, None, None, 11]
+    assert ages == [Player.get_age_for_dob(d, onday=onday) for d in dobs]
+
+
+def test_age_groups_for_ages():
+    ages = [40, 35, 22, None, 0, 11, 19]
+    assert Player.get_age_groups_for_ages(ages) == [
+        Player.get_age_group_for_age(a) for a in ages
+    ]
+
+
 def test_player_age_group_junior(player_data):
     player = Player(**player_data | dict(grade="J1"))
     assert player.age_group == Player.AgeGroup.Junior
@@ -150,6 +168,65 @@ def test_equality_ignores_id(player_data):
     assert p1 == p2
 
 
+def test_equality_ignores_id_fingerprint(player_data):
+    p1 = Player(**player_data)
+    p2 = Player(**player_data | dict(id="foo"))
+    assert p1.get_fingerprint() == p2.get_fingerprint()
+    assert hash(p1) == hash(p2)
+
+
+def test_inequality(player_data):
+    p1 = Player(**player_data)
+    p2 = Player(**player_data | dict(points=1000))
+    assert p1 != p2
+    assert p1.get_fingerprint() != p2.get_fingerprint()
+
+
+def test_inequality_placeholder(player):
+    assert player != Placeholder(name="foo")
+
+
+def test_equality_set(player_data):
+    p1 = Player(**player_data)
+    p2 = Player(**player_data | dict(id="foo"))
+    p3 = Player(**player_data | dict(name="Kate Smith"))
+    assert len({p1, p2, p3}) == 2
+
+
+def test_equality_with_other_record(player, player_data):
+    other = PlayerBase(**player.data)
+    assert player == other
+
+
+def test_fingerprint_unhashable_values(player_data):
+    p1 = Player(**player_data | dict(clubs=["A", "B"]))
+    p2 = Player(**player_data | dict(clubs=["A", "B"]))
+    assert p1 == p2
+    assert hash(p1) == hash(p2)
+
+
+def test_equality_phone_number_formats(player_data):
+    p1 = Player(**player_data | dict(mobile="021-234567"))
+    p2 = Player(**player_data | dict(mobile="021234567"))
+    assert p1.mobile == p2.mobile
+    assert p1 == p2
+    assert hash(p1) == hash(p2)
+
+
+def test_equality_numeric_types(player_data):
+    p1 = Player(**player_data | dict(points=1000))
+    p2 = Player(**player_data | dict(points=1000.0))
+    assert p1 == p2
+    assert hash(p1) == hash(p2)
+
+
+def test_fingerprint_names_records(player_data):
+    p1 = Player(**player_data | dict(draw=Placeholder(name="W0")))
+    p2 = Player(**player_data | dict(draw=Placeholder(name="W0")))
+    p2.draw.set(Draw("W0", description="Women"))
+    assert p1 == p2
+
+
 def test_single_word_name(player_data):
     p = Player(**player_data | dict(name="Bye"))
 
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2021–2022 martin f. krafft <tctools@pobox.madduck.net>
+# Released under the MIT Licence
+#
+
+import pytest
+
+from pytcnz.datasource import DataSource
+from pytcnz.squashnz.player import Player
+from pytcnz.squashnz.playerindex import PlayerIndex
+
+COLNAMES = ["id", "name", "gender", "points", "club", "squashCode"]
+ROWS = [
+    [1, "Jane Doe", "W", 2870, "Thorndon", "WNTHJXD"],
+    [2, "Kate Smith", "W", 1450, "Khandallah", "WNKHKXS"],
+    [3, "Martin Krafft", "M", 2870, "Thorndon", "WNTHMXK"],
+    [4, "John Smith", "M", 650, "Khandallah", "WNKHJXS"],
+]
+
+
+@pytest.fixture
+def source():
+    source = DataSource(Player_class=Player)
+    source.read_players(
+        COLNAMES, ROWS, colmap=dict(squashcode="squash_code")
+    )
+    return source
+
+
+@pytest.fixture
+def index(source):
+    return PlayerIndex.from_source(source)
+
+
+def test_length(index):
+    assert len(index) == len(ROWS)
+
+
+def test_by_name(index, source):
+    assert index.get_by_name("Jane Doe") is source.players["Jane Doe"]
+
+
+def test_by_name_missing(index):
+    assert index.get_by_name("Jane Smith") is None
+
+
+def test_by_normalised_name(index):
+    assert index.get_by_normalised_name("Mrs  jane  DOE").name == "Jane Doe"
+
+
+def test_by_squash_code(index):
+    assert index.get_by_squash_code("WNTHMXK").name == "Martin Krafft"
+
+
+def test_by_id(index):
+    assert index.get_by_id(2).name == "Kate Smith"
+
+
+def test_by_club(index):
+    names = {p.name for p in index.find_by_club("Khandallah")}
+    assert names == {"Kate Smith", "John Smith"}
+
+
+def test_ambiguous(index):
+    index.add(Player(name="Jane Doe", gender="W", points=100))
+    with pytest.raises(PlayerIndex.AmbiguousKeyError):
+        index.get_by_name("Jane Doe")
+    assert len(index.find("name", "Jane Doe")) == 2
+
+
+def test_unknown_key(index):
+    with pytest.raises(PlayerIndex.UnknownKeyError):
+        index.find("shoe_size", 42)
+
+
+def test_points_range(index):
+    assert [p.points for p in index.find_by_points(1000, 2870)] == [
+        1450,
+        2870,
+        2870,
+    ]
+    assert [p.name for p in index.find_by_points(points_max=1000)] == [
+        "John Smith"
+    ]
+    assert len(index.find_by_points()) == len(ROWS)
+
+
+def test_add(index):
+    player = Player(name="Ann Other", gender="W", points=1500, club="Hutt")
+    index.add(player)
+    index.add(player)
+    assert len(index) == len(ROWS) + 1
+    assert index.find_by_club("Hutt") == [player]
+    assert player in index.find_by_points(1500, 1500)
+
+
+def test_remove(index, source):
+    player = source.players["Kate Smith"]
+    index.remove(player)
+    assert player not in index
+    assert index.get_by_squash_code("WNKHKXS") is None
+    assert index.find_by_club("Khandallah") == [source.players["John Smith"]]
+    assert player not in index.find_by_points()
+    index.remove(player)
+    assert len(index) == len(ROWS) - 1
+
+
+def test_join(source):
+    grading = PlayerIndex(
+        [
+            Player(name="Mrs Jane Doe", gender="W", points=2900),
+            Player(name="John Smith", gender="M", points=700),
+        ]
+    )
+    joined = {
+        p.name: grading.get_by_normalised_name(p.name).points
+        for p in source.players.values()
+        if grading.get_by_normalised_name(p.name)
+    }
+    assert joined == {"Jane Doe": 2900, "John Smith": 700}
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2021–2022 martin f. krafft <tctools@pobox.madduck.net>
+# Released under the MIT Licence
+#
+
+import pytest
+
+from pytcnz.gender import Gender
+from pytcnz.squashnz.player import Player
+from pytcnz.squashnz.playertable import PlayerTable
+
+COLNAMES = ["name", "gender", "points", "club", "squashCode", "grade"]
+ROWS = [
+    ["Jane Doe", "W", 2870, "Thorndon", "WNTHJXD", "A2"],
+    ["Kate Smith", "W", 1450, "Khandallah", "WNKHKXS", "D1"],
+    ["Martin Krafft", "M", 2870, "Thorndon", "WNTHMXK", "B2"],
+    ["John Smith", "M", 650, "Khandallah", "WNKHJXS", "J2"],
+]
+
+
+@pytest.fixture
+def table():
+    return PlayerTable.from_rows(
+        COLNAMES, ROWS, colmap=dict(squashcode="squash_code")
+    )
+
+
+def test_length(table):
+    assert len(table) == len(ROWS)
+
+
+def test_lazy_materialisation(table):
+    player = table[0]
+    assert isinstance(player, Player)
+    assert player.name == "Jane Doe"
+    assert table[0] is player
+
+
+def test_column(table):
+    assert table.get_column("points") == [2870, 1450, 2870, 650]
+    W, M = Gender.W, Gender.M
+    assert table.get_column("gender") == [W, W, M, M]
+
+
+def test_column_grade(table):
+    assert table.get_column("grade") == ["A2", "D1", "B2", "J2"]
+
+
+def test_column_age_group(table):
+    assert table.get_column("age_group")[3] == Player.AgeGroup.Junior
+
+
+def test_unknown_column(table):
+    with pytest.raises(PlayerTable.UnknownColumnError):
+        table.get_column("shoe_size")
+
+
+def test_filter(table):
+    men = table.filter(genders=["M"])
+    assert [p.name for p in men] == ["Martin Krafft", "John Smith"]
+
+
+def test_filter_points(table):
+    assert len(table.filter(points_min=1000, points_max=2000)) == 1
+
+
+def test_filter_combined(table):
+    t = table.filter(genders=["W"], clubs=["Thorndon"])
+    assert t.get_column("name") == ["Jane Doe"]
+
+
+def test_where(table):
+    t = table.where(p > 1000 for p in table.get_column("points"))
+    assert len(t) == 3
+
+
+def test_sort(table):
+    t = table.sort("points", reverse=True)
+    assert t.get_column("points") == [2870, 2870, 1450, 650]
+
+
+def test_group_by(table):
+    groups = table.group_by("club")
+    assert set(groups) == {"Thorndon", "Khandallah"}
+    assert len(groups["Thorndon"]) == 2
+
+
+def test_count_by(table):
+    assert table.count_by("gender") == {Gender.W: 2, Gender.M: 2}
+
+
+def test_points_histogram(table):
+    assert table.get_points_histogram(1000) == {0: 1, 1000: 1, 2000: 2}
+
+
+def test_from_players():
+    players = {
+        r[0]: Player(name=r[0], gender=r[1], points=r[2], club=r[3])
+        for r in ROWS
+    }
+    table = PlayerTable.from_players(players)
+    assert table[2] is players["Martin Krafft"]
+    assert table.count_by("club") == {"Thorndon": 2, "Khandallah": 2}
@@ -58,3 +58,21 @@ def test_add_player_not_matching_draw(draw_data, player):
     draw = Draw(**draw_data | dict(name="M3"))
     with pytest.raises(Draw.InvalidPlayerError):
         draw.add_player(player)
+
+
+def test_get_player_by_seed(draw, player):
+    draw.add_player(player)
+    assert draw.get_player_by_seed(player.seed) is player
+    assert draw.get_player_by_seed(player.seed + 1) is None
+
+
+def test_get_player_by_id(draw, player):
+    draw.add_player(player)
+    assert draw.get_player_by_id(player.id) is player
+
+
+def test_remove_player(draw, player):
+    draw.add_player(player)
+    draw.remove_player(player)
+    assert draw.get_player_by_seed(player.seed) is None
+    assert draw.get_player_by_id(player.id) is None
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2021–2022 martin f. krafft <tctools@pobox.madduck.net>
+# Released under the MIT Licence
+#
+
+import pytest
+import subprocess
+import sys
+
+from pytcnz.util import LazyImport
+
+
+def test_lazyimport_module():
+    mod = LazyImport("json")
+    assert "not loaded" in repr(mod)
+    assert mod.loads("[1]") == [1]
+    assert "loaded" in repr(mod)
+
+
+def test_lazyimport_attribute():
+    OrderedDict = LazyImport("collections", "OrderedDict")
+    assert OrderedDict(a=1) == {"a": 1}
+
+
+def test_lazyimport_missing_module():
+    mod = LazyImport("pytcnz.does_not_exist")
+    with pytest.raises(ModuleNotFoundError):
+        mod.anything
+
+
+def test_lazyimport_in_except_clause():
+    exceptions = LazyImport("json")
+    with pytest.raises(ValueError):
+        try:
+            raise ValueError
+        except exceptions.JSONDecodeError:
+            pass
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "pytcnz.scores",
+        "pytcnz.squashnz.grading",
+        "pytcnz.squashnz.registrations_reader",
+        "pytcnz.squashnz.gradinglist_reader",
+        "pytcnz.squashnz.isquash_controller",
+        "pytcnz.dtkapiti.tcexport_reader",
+        "pytcnz.tctools.drawmaker_reader",
+    ],
+)
+def test_no_heavy_imports(module):
+    heavy = ("dateutil", "phonenumbers", "pyexcel", "pytz", "selenium")
+    code = (
+        f"import sys, {module}; "
+        f"print(' '.join(m for m in {heavy!r} if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True
+    )
+    assert out.returncode == 0, out.stderr
+    assert out.stdout.strip() == ""
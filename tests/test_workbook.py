@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2021–2022 martin f. krafft <tctools@pobox.madduck.net>
+# Released under the MIT Licence
+#
+
+import datetime
+import pytest
+import pyexcel
+
+from pytcnz.workbook import LazyWorkbook
+
+BOOK = {
+    "Info": [["Title", "Foo Open"], ["Venue", "Bar Club"]],
+    "Data": [
+        ["Name", "Points", "Date", "Comment"],
+        ["Jane", 3050.0, datetime.date(2021, 10, 6), "foo"],
+        ["Kate", 2.5, "", ""],
+        ["", "", "", ""],
+        ["Mary", 1000, datetime.date(1999, 8, 30)],
+    ],
+}
+
+
+@pytest.fixture(params=["xls", "ods"])
+def filename(request, tmp_path):
+    filename = str(tmp_path / f"book.{request.param}")
+    pyexcel.save_book_as(bookdict=BOOK, dest_file_name=filename)
+    return filename
+
+
+@pytest.fixture
+def workbook(filename):
+    with LazyWorkbook(filename) as workbook:
+        yield workbook
+
+
+def test_sheet_names(workbook):
+    assert sorted(workbook.get_sheet_names()) == sorted(BOOK)
+
+
+@pytest.mark.parametrize("name", BOOK.keys())
+def test_rows_like_pyexcel(workbook, filename, name):
+    assert list(workbook.iter_rows(name)) == (
+        pyexcel.get_book(file_name=filename)[name].array
+    )
+
+
+def test_get_table(workbook):
+    header, rows = workbook.get_table("Data")
+    assert header == ["Name", "Points", "Date", "Comment"]
+    rows = list(rows)
+    assert rows[0] == ["Jane", 3050, datetime.date(2021, 10, 6), "foo"]
+    assert rows[1] == ["Kate", 2.5, "", ""]
+    assert all(len(row) == len(header) for row in rows)
+
+
+def test_rows_are_streamed(workbook):
+    rows = workbook.iter_rows("Data")
+    assert next(rows) == ["Name", "Points", "Date", "Comment"]
+
+
+def test_unknown_sheet(workbook):
+    with pytest.raises(LazyWorkbook.SheetNotFoundError):
+        list(workbook.iter_rows("Missing"))
+
+
+def test_xls_sheets_loaded_on_demand(tmp_path):
+    filename = str(tmp_path / "book.xls")
+    pyexcel.save_book_as(bookdict=BOOK, dest_file_name=filename)
+    with LazyWorkbook(filename) as workbook:
+        assert not workbook.is_loaded("Info")
+        assert not workbook.is_loaded("Data")
+        list(workbook.iter_rows("Data"))
+        assert workbook.is_loaded("Data")
+        assert not workbook.is_loaded("Info")
+        workbook.unload("Data")
+        assert not workbook.is_loaded("Data")